@@ -6,7 +6,11 @@ Handles both LDAP and local authentication with fallback
 
 import logging
 import hashlib
+import hmac
 import secrets
+import threading
+import time
+from collections import OrderedDict
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 import json
@@ -20,6 +24,14 @@ except ImportError:
     LDAP_INTEGRATION_AVAILABLE = False
     LDAP_AVAILABLE = False
 
+# Frequently guessed passwords; failures with these weigh more towards a lockout
+COMMON_PASSWORDS = frozenset({
+    '123456', '12345678', '123456789', '111111', 'password', 'password1',
+    'passw0rd', 'qwerty', 'abc123', 'letmein', 'welcome', 'admin', 'admin123',
+    'root', 'changeme', 'iloveyou', 'monkey', 'dragon', 'football', 'baseball',
+    'sunshine', 'princess', 'trustno1', 'test', 'test123'
+})
+
 class AuthManager:
     """
     Unified authentication manager supporting both LDAP and local authentication
@@ -34,15 +46,47 @@ class AuthManager:
             'ldap_enabled': LDAP_AVAILABLE and LDAP_INTEGRATION_AVAILABLE,
             'local_fallback': True,
             'session_timeout_hours': 8,
-            'max_failed_attempts': 5,
+            'max_failed_attempts': 10,  # weighted hit count before lockout
+            'common_password_weight': 5,
             'lockout_duration_minutes': 30,
+            'backoff_base_seconds': 1,
+            'backoff_max_seconds': 300,
             'require_strong_passwords': True,
-            'min_password_length': 8
+            'min_password_length': 8,
+            'auth_attempts_retention_days': 7
         }
         
+        # In-memory back-off state: username -> (consecutive failures, next allowed time)
+        self._backoff = {}
+        
+        # LDAP manager is only built once LDAP is actually used
+        self._ldap_manager = None
+        
+        # Short-lived cache of LDAP bind results keyed by (username, salted password digest);
+        # holds the DN and attributes but never groups
+        self._ldap_cache = OrderedDict()
+        self._ldap_cache_ttl = 300
+        self._ldap_negative_cache_ttl = 30
+        self._ldap_cache_max_size = 1024
+        self._cache_salt = secrets.token_hex(16)
+        
+        # Recently rejected local credentials, to skip re-hashing repeated wrong guesses
+        self._local_failure_cache = {}
+        self._local_failure_ttl = 10
+        
+        # The manager is a process-wide singleton; guards the back-off and cache state above
+        self._state_lock = threading.Lock()
+        
         # Initialize local user tables if needed
         self._initialize_local_auth_tables()
     
+    @property
+    def ldap_manager(self):
+        """LDAP manager, created on first use and only when LDAP is enabled"""
+        if self._ldap_manager is None and self.config['ldap_enabled']:
+            self._ldap_manager = get_ldap_manager()
+        return self._ldap_manager
+    
     def _initialize_local_auth_tables(self):
         """Initialize local authentication tables"""
         try:
@@ -96,6 +140,29 @@ class AuthManager:
                     )
                 """)
                 
+                # Auth attempts rolled up into 5-minute buckets for statistics
+                cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'auth_attempts_5m'")
+                rollup_exists = cursor.fetchone() is not None
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS auth_attempts_5m (
+                        bucket_ts INTEGER NOT NULL,
+                        success BOOLEAN NOT NULL,
+                        auth_method VARCHAR(50) NOT NULL,
+                        count INTEGER NOT NULL DEFAULT 0,
+                        PRIMARY KEY (bucket_ts, success, auth_method)
+                    )
+                """)
+                
+                # Seed today's buckets from attempts logged before the rollup existed
+                if not rollup_exists:
+                    cursor.execute("""
+                        INSERT INTO auth_attempts_5m (bucket_ts, success, auth_method, count)
+                        SELECT CAST(strftime('%s', timestamp) AS INTEGER) / 300 * 300, success, auth_method, COUNT(*)
+                        FROM auth_attempts
+                        WHERE timestamp >= date('now')
+                        GROUP BY 1, 2, 3
+                    """)
+                
                 # Create indexes
                 cursor.execute("CREATE INDEX IF NOT EXISTS idx_local_users_username ON local_users(username)")
                 cursor.execute("CREATE INDEX IF NOT EXISTS idx_user_sessions_session_id ON user_sessions(session_id)")
@@ -112,6 +179,24 @@ class AuthManager:
                 
         except Exception as e:
             self.logger.error(f"Error initializing local auth tables: {e}")
+        
+        self._prune_auth_attempts()
+    
+    def _prune_auth_attempts(self):
+        """Drop raw auth attempts and rollup buckets older than the retention window"""
+        retention_days = self.config['auth_attempts_retention_days']
+        try:
+            with self.db.get_cursor() as cursor:
+                cursor.execute("""
+                    DELETE FROM auth_attempts
+                    WHERE timestamp < datetime('now', ?)
+                """, (f"-{retention_days} days",))
+                cursor.execute(
+                    "DELETE FROM auth_attempts_5m WHERE bucket_ts < ?",
+                    (int(time.time()) - retention_days * 86400,)
+                )
+        except Exception as e:
+            self.logger.error(f"Error pruning auth attempts: {e}")
     
     def _create_default_admin(self):
         """Create default admin user"""
@@ -148,16 +233,20 @@ class AuthManager:
             self._log_auth_attempt(username, 'unknown', False, ip_address, user_agent, 'User account locked')
             return False, None, 'locked'
         
+        # Refuse attempts that arrive before the back-off window has passed
+        if self._is_rate_limited(username):
+            self._log_auth_attempt(username, 'rate_limited', False, ip_address, user_agent, 'Too many attempts, retry later')
+            return False, None, 'rate_limited'
+        
         user_info = None
         auth_method = 'unknown'
         success = False
         error_message = ''
         
-        # Try LDAP authentication first if available
-        if self.config['ldap_enabled']:
+        # Try LDAP authentication first if enabled and the server is not failing
+        if self.config['ldap_enabled'] and self.ldap_manager.is_healthy():
             try:
-                ldap_manager = get_ldap_manager()
-                success, user_info = ldap_manager.authenticate_user(username, password)
+                success, user_info = self._authenticate_ldap_user(username, password)
                 auth_method = 'ldap'
                 
                 if success and user_info:
@@ -188,17 +277,65 @@ class AuthManager:
         
         # Handle failed authentication
         if not success:
-            self._handle_failed_auth(username)
+            self._handle_failed_auth(username, password)
             self._log_auth_attempt(username, auth_method, False, ip_address, user_agent, error_message)
             return False, None, auth_method
         
         # Handle successful authentication
+        with self._state_lock:
+            self._backoff.pop(username, None)
         self._reset_failed_attempts(username)
         self._update_last_login(username, auth_method)
         self._log_auth_attempt(username, auth_method, True, ip_address, user_agent)
         
         return True, user_info, auth_method
     
+    def _authenticate_ldap_user(self, username: str, password: str) -> Tuple[bool, Optional[Dict]]:
+        """Authenticate against LDAP, reusing a recent bind result when available"""
+        key = (username, hashlib.sha256((password + self._cache_salt).encode()).digest())
+        now = time.monotonic()
+        
+        hit = None
+        with self._state_lock:
+            cached = self._ldap_cache.get(key)
+            if cached is not None:
+                timestamp, result = cached
+                ttl = self._ldap_cache_ttl if result[0] else self._ldap_negative_cache_ttl
+                if now - timestamp < ttl:
+                    self._ldap_cache.move_to_end(key)
+                    hit = result
+                else:
+                    del self._ldap_cache[key]
+        
+        if hit is not None:
+            success, user_info = hit
+            if not success or not user_info:
+                return hit
+            # Groups decide the user's role, so they are read fresh rather than cached
+            return success, dict(user_info, groups=self.ldap_manager.get_user_groups(user_info['dn']))
+        
+        # The bind itself runs outside the lock so logins don't queue behind each other
+        success, user_info = self.ldap_manager.authenticate_user(username, password)
+        cached_info = (
+            {field: value for field, value in user_info.items() if field != 'groups'}
+            if user_info else user_info
+        )
+        
+        with self._state_lock:
+            self._ldap_cache[key] = (now, (success, cached_info))
+            if len(self._ldap_cache) > self._ldap_cache_max_size:
+                self._ldap_cache.popitem(last=False)
+        return success, user_info
+    
+    def invalidate_ldap_cache(self, username: str = None):
+        """Drop cached LDAP bind results for a user, or all of them"""
+        with self._state_lock:
+            if username is None:
+                self._ldap_cache.clear()
+                return
+            for key in [k for k in self._ldap_cache if k[0] == username]:
+                del self._ldap_cache[key]
+    
     def create_session(self, username: str, auth_method: str, ip_address: str = None, user_agent: str = None) -> str:
         """Create a new user session"""
         try:
@@ -210,7 +347,7 @@ class AuthManager:
                     INSERT INTO user_sessions 
                     (session_id, user_identifier, created_at, last_activity, expires_at, session_data, ip_address, user_agent)
                     VALUES (?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, ?, ?, ?, ?)
-                """, (session_id, username, expires_at, json.dumps({'auth_method': auth_method}), ip_address, user_agent))
+                """, (self._session_key(session_id), username, expires_at, json.dumps({'auth_method': auth_method}), ip_address, user_agent))
             
             self.logger.info(f"Session created for {username} ({auth_method})")
             return session_id
@@ -219,6 +356,11 @@ class AuthManager:
             self.logger.error(f"Error creating session for {username}: {e}")
             return None
     
+    @staticmethod
+    def _session_key(session_id: str) -> str:
+        """Digest stored in user_sessions in place of the raw session token"""
+        return hashlib.sha256(session_id.encode()).hexdigest()
+    
     def validate_session(self, session_id: str) -> Tuple[bool, Optional[Dict]]:
         """Validate a user session"""
         try:
@@ -227,7 +369,7 @@ class AuthManager:
                     SELECT user_identifier, session_data, expires_at, last_activity
                     FROM user_sessions 
                     WHERE session_id = ?
-                """, (session_id,))
+                """, (self._session_key(session_id),))
                 
                 session = cursor.fetchone()
                 
@@ -245,7 +387,7 @@ class AuthManager:
                     UPDATE user_sessions 
                     SET last_activity = CURRENT_TIMESTAMP
                     WHERE session_id = ?
-                """, (session_id,))
+                """, (self._session_key(session_id),))
                 
                 # Parse session data and return normalized format
                 session_data = json.loads(session['session_data']) if session['session_data'] else {}
@@ -273,7 +415,7 @@ class AuthManager:
                 cursor.execute("""
                     DELETE FROM user_sessions 
                     WHERE session_id = ?
-                """, (session_id,))
+                """, (self._session_key(session_id),))
             return True
         except Exception as e:
             self.logger.error(f"Error invalidating session {session_id}: {e}")
@@ -297,6 +439,9 @@ class AuthManager:
                     VALUES (?, ?, ?, ?, ?, ?)
                 """, (username, password_hash, salt, email, full_name, role))
             
+            self.invalidate_ldap_cache(username)
+            with self._state_lock:
+                self._local_failure_cache = {k: v for k, v in self._local_failure_cache.items() if k[0] != username}
             self.logger.info(f"Local user created: {username}")
             return True
             
@@ -306,6 +451,12 @@ class AuthManager:
     
     def _authenticate_local_user(self, username: str, password: str) -> Tuple[bool, Optional[Dict]]:
         """Authenticate against local user database"""
+        failure_key = (username, hashlib.sha256((password + self._cache_salt).encode()).digest())
+        now = time.monotonic()
+        with self._state_lock:
+            if self._local_failure_cache.get(failure_key, 0) > now:
+                return False, None
+        
         try:
             with self.db.get_cursor() as cursor:
                 cursor.execute("""
@@ -325,7 +476,7 @@ class AuthManager:
                 # Verify password
                 password_hash = self._hash_password(password, user['salt'])
                 
-                if password_hash == user['password_hash']:
+                if hmac.compare_digest(password_hash, user['password_hash']):
                     user_info = {
                         'username': username,
                         'email': user['email'],
@@ -335,6 +486,10 @@ class AuthManager:
                     }
                     return True, user_info
                 else:
+                    with self._state_lock:
+                        if len(self._local_failure_cache) > 4096:
+                            self._local_failure_cache = {k: v for k, v in self._local_failure_cache.items() if v > now}
+                        self._local_failure_cache[failure_key] = now + self._local_failure_ttl
                     return False, None
                     
         except Exception as e:
@@ -406,16 +561,37 @@ class AuthManager:
             self.logger.error(f"Error checking lock status for {username}: {e}")
             return False
     
-    def _handle_failed_auth(self, username: str):
+    def _is_rate_limited(self, username: str) -> bool:
+        """Check if user is still inside the back-off window of a previous failure"""
+        with self._state_lock:
+            state = self._backoff.get(username)
+        return state is not None and time.monotonic() < state[1]
+    
+    def _handle_failed_auth(self, username: str, password: str = ''):
         """Handle failed authentication attempt"""
+        # Exponential back-off between consecutive failures
+        now = time.monotonic()
+        with self._state_lock:
+            failures = self._backoff.get(username, (0, 0))[0] + 1
+            delay = min(self.config['backoff_base_seconds'] * 2 ** (failures - 1), self.config['backoff_max_seconds'])
+            self._backoff[username] = (failures, now + delay)
+            
+            # Forget usernames whose back-off ran out long ago
+            if len(self._backoff) > 4096:
+                stale_before = now - self.config['backoff_max_seconds']
+                self._backoff = {user: state for user, state in self._backoff.items() if state[1] > stale_before}
+        
+        # Guesses from the common password list count more than honest typos
+        weight = self.config['common_password_weight'] if password.lower() in COMMON_PASSWORDS else 1
+        
         try:
             with self.db.get_cursor() as cursor:
-                # Increment failed attempts
+                # Increment weighted failed attempts
                 cursor.execute("""
                     UPDATE local_users 
-                    SET failed_attempts = failed_attempts + 1
+                    SET failed_attempts = failed_attempts + ?
                     WHERE username = ?
-                """, (username,))
+                """, (weight, username))
                 
                 # Check if user should be locked
                 cursor.execute("""
@@ -473,6 +649,12 @@ class AuthManager:
                     (username, auth_method, success, ip_address, user_agent, error_message)
                     VALUES (?, ?, ?, ?, ?, ?)
                 """, (username, auth_method, success, ip_address, user_agent, error_message))
+                
+                cursor.execute("""
+                    INSERT INTO auth_attempts_5m (bucket_ts, success, auth_method, count)
+                    VALUES (?, ?, ?, 1)
+                    ON CONFLICT (bucket_ts, success, auth_method) DO UPDATE SET count = count + 1
+                """, (int(time.time()) // 300 * 300, success, auth_method))
         except Exception as e:
             self.logger.error(f"Error logging auth attempt: {e}")
     
@@ -481,35 +663,27 @@ class AuthManager:
         try:
             stats = {}
             
-            with self.db.get_cursor() as cursor:
-                # Total auth attempts today
-                cursor.execute("""
-                    SELECT COUNT(*) as total, 
-                           SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END) as successful
-                    FROM auth_attempts 
-                    WHERE DATE(timestamp) = DATE('now')
-                """)
-                daily_stats = cursor.fetchone()
-                stats['daily_attempts'] = dict(daily_stats) if daily_stats else {'total': 0, 'successful': 0}
-                
-                # Active sessions
-                cursor.execute("""
-                    SELECT COUNT(*) as active_sessions
-                    FROM user_sessions 
-                    WHERE expires_at > datetime('now')
-                """)
-                stats['active_sessions'] = cursor.fetchone()['active_sessions']
-                
-                # Local users count
-                cursor.execute("SELECT COUNT(*) as local_users FROM local_users WHERE is_active = 1")
-                stats['local_users'] = cursor.fetchone()['local_users']
-                
-                # LDAP users count
-                if LDAP_INTEGRATION_AVAILABLE:
-                    cursor.execute("SELECT COUNT(*) as ldap_users FROM ldap_users WHERE is_active = 1")
-                    stats['ldap_users'] = cursor.fetchone()['ldap_users']
-                else:
-                    stats['ldap_users'] = 0
+            # Daily attempts come from the 5-minute rollup, starting at UTC midnight
+            day_start = int(time.time()) // 86400 * 86400
+            
+            queries = {
+                'total': ("SELECT COALESCE(SUM(count), 0) FROM auth_attempts_5m WHERE bucket_ts >= ?", (day_start,)),
+                'successful': ("SELECT COALESCE(SUM(count), 0) FROM auth_attempts_5m WHERE bucket_ts >= ? AND success = 1", (day_start,)),
+                'active_sessions': ("SELECT COUNT(*) FROM user_sessions WHERE expires_at > datetime('now')", ()),
+                'local_users': ("SELECT COUNT(*) FROM local_users WHERE is_active = 1", ())
+            }
+            
+            # LDAP users are only counted when the LDAP tables are in use
+            if LDAP_INTEGRATION_AVAILABLE:
+                queries['ldap_users'] = ("SELECT COUNT(*) FROM ldap_users WHERE is_active = 1", ())
+            
+            # All counters in a single statement
+            counts = self.db.get_counts(queries)
+            
+            stats['daily_attempts'] = {'total': counts['total'], 'successful': counts['successful']}
+            stats['active_sessions'] = counts['active_sessions']
+            stats['local_users'] = counts['local_users']
+            stats['ldap_users'] = counts.get('ldap_users', 0)
             
             return stats
             
@@ -520,10 +694,13 @@ class AuthManager:
 
 # Global instance
 _auth_manager = None
+_auth_manager_lock = threading.Lock()
 
 def get_auth_manager() -> AuthManager:
     """Get authentication manager instance"""
     global _auth_manager
     if _auth_manager is None:
-        _auth_manager = AuthManager()
+        with _auth_manager_lock:
+            if _auth_manager is None:
+                _auth_manager = AuthManager()
     return _auth_manager
\ No newline at end of file
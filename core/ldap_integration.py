@@ -4,19 +4,34 @@ LDAP Integration for MultiDBManager
 Handles LDAP authentication and user synchronization
 """
 
+import atexit
 import logging
+import queue
+import re
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import lru_cache
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 import json
 
 try:
-    from ldap3 import Server, Connection, ALL, SUBTREE
+    from ldap3 import Server, Connection, BASE, NONE, NO_ATTRIBUTES, SUBTREE
     from ldap3.core.exceptions import LDAPException, LDAPBindError
+    from ldap3.utils.conv import escape_filter_chars
+    # Usernames repeat across logins; escape each one once
+    escape_filter_chars = lru_cache(maxsize=4096)(escape_filter_chars)
     # Check if LDAPInvalidCredentialsError exists, if not use LDAPBindError
     try:
         from ldap3.core.exceptions import LDAPInvalidCredentialsError
     except ImportError:
         LDAPInvalidCredentialsError = LDAPBindError
+    try:
+        from ldap3.core.exceptions import LDAPPasswordIsMandatoryError
+    except ImportError:
+        LDAPPasswordIsMandatoryError = LDAPBindError
     LDAP_AVAILABLE = True
     print("✅ LDAP3 library imported successfully")
 except ImportError as e:
@@ -28,6 +43,12 @@ except Exception as e:
 
 from database.database_manager import get_database_manager
 
+# Entry attributes stored for a user; searches request only these
+USER_ATTRIBUTES = ['cn', 'mail', 'displayName', 'givenName', 'sn']
+
+# Below this many users, one group search per user beats paging through every group
+GROUP_SCAN_MIN_USERS = 20
+
 class LDAPManager:
     """
     LDAP Manager for user authentication and synchronization
@@ -51,12 +72,140 @@ class LDAPManager:
             'group_search_base': 'dc=example,dc=com',
             'timeout': 10,
             'auto_sync': True,
-            'sync_interval_hours': 24
+            'sync_interval_hours': 24,
+            'pool_size': 8,
+            'failure_threshold': 3,
+            'failure_cooldown_seconds': 30
         }
         
+        # Server definition, created lazily, and a pool of service-bound connections;
+        # both are reused across calls
+        self._server = None
+        self._pool = self._new_pool()
+        
+        # Member attribute for the bulk group search, derived from group_filter
+        self._member_attribute = self._parse_member_attribute()
+        
+        # Login attribute for bulk user lookups, derived from user_filter
+        self._user_attribute = self._parse_user_attribute()
+        
+        # Circuit breaker: after repeated server errors, report unhealthy for a cooldown
+        self._consecutive_failures = 0
+        self._broken_until = 0.0
+        
+        # username -> (user_info without groups, expires_at); lets repeat logins skip the DN search.
+        # Groups decide the user's role, so they are always read fresh.
+        self._dn_cache: Dict[str, Tuple[Dict, float]] = {}
+        self._dn_cache_ttl = 3600
+        
         if not LDAP_AVAILABLE:
             self.logger.error("LDAP3 library not available. Install with: pip install ldap3")
     
+    def _get_server(self) -> 'Server':
+        """
+        LDAP server definition, built once without reading the root DSE/schema
+        """
+        if self._server is None:
+            self._server = Server(
+                self.config['server'],
+                port=self.config['port'],
+                use_ssl=self.config['use_ssl'],
+                get_info=NONE,
+                connect_timeout=self.config.get('timeout')
+            )
+        return self._server
+    
+    def _new_connection(self) -> 'Connection':
+        """
+        Open a connection bound as the configured service account.
+        The timeout also bounds each response wait, so a hung server fails fast.
+        """
+        return Connection(
+            self._get_server(),
+            user=self.config['bind_dn'],
+            password=self.config['bind_password'],
+            auto_bind=True,
+            receive_timeout=self.config.get('timeout')
+        )
+    
+    def _new_pool(self) -> queue.Queue:
+        """
+        Empty connection pool sized from the current configuration
+        """
+        return queue.Queue(maxsize=self.config.get('pool_size', 8))
+    
+    @contextmanager
+    def _acquire(self):
+        """
+        Borrow a service-bound connection from the pool.
+        Connections that raise while borrowed are discarded rather than returned.
+        """
+        pool = self._pool
+        try:
+            try:
+                conn = pool.get_nowait()
+                if conn.closed:
+                    conn = self._new_connection()
+            except queue.Empty:
+                conn = self._new_connection()
+        except Exception:
+            self._record_failure()
+            raise
+        
+        try:
+            yield conn
+        except Exception:
+            self._record_failure()
+            self._discard_connection(conn)
+            raise
+        
+        self._consecutive_failures = 0
+        if pool is not self._pool:
+            # The pool was closed while this connection was borrowed
+            self._discard_connection(conn)
+            return
+        try:
+            pool.put_nowait(conn)
+        except queue.Full:
+            self._discard_connection(conn)
+    
+    def _record_failure(self):
+        """
+        Count a server error and open the circuit once the threshold is reached
+        """
+        self._consecutive_failures += 1
+        if self._consecutive_failures >= self.config.get('failure_threshold', 3):
+            self._broken_until = time.monotonic() + self.config.get('failure_cooldown_seconds', 30)
+            self._consecutive_failures = 0
+            self.logger.warning("LDAP server failing repeatedly, skipping LDAP during cooldown")
+    
+    def is_healthy(self) -> bool:
+        """
+        Whether LDAP should be tried (False while the circuit breaker is open)
+        """
+        return LDAP_AVAILABLE and time.monotonic() >= self._broken_until
+    
+    def _discard_connection(self, conn: 'Connection'):
+        """
+        Unbind a connection that will not go back to the pool
+        """
+        try:
+            conn.unbind()
+        except Exception:
+            pass
+    
+    def close_pool(self):
+        """
+        Unbind all pooled connections, leaving an empty pool for later calls
+        """
+        pool, self._pool = self._pool, self._new_pool()
+        while True:
+            try:
+                conn = pool.get_nowait()
+            except queue.Empty:
+                break
+            self._discard_connection(conn)
+    
     def test_connection(self) -> Tuple[bool, str]:
         """
         Test LDAP connection
@@ -66,29 +215,15 @@ class LDAPManager:
             return False, "LDAP3 library not installed"
         
         try:
-            server = Server(
-                self.config['server'],
-                port=self.config['port'],
-                use_ssl=self.config['use_ssl'],
-                get_info=ALL
-            )
-            
-            conn = Connection(
-                server,
-                user=self.config['bind_dn'],
-                password=self.config['bind_password'],
-                auto_bind=True
-            )
+            with self._acquire() as conn:
+                # Test search: read the base entry itself, without attributes
+                conn.search(
+                    search_base=self.config['base_dn'],
+                    search_filter='(objectClass=*)',
+                    search_scope=BASE,
+                    attributes=NO_ATTRIBUTES
+                )
             
-            # Test search
-            conn.search(
-                search_base=self.config['base_dn'],
-                search_filter='(objectClass=*)',
-                search_scope=SUBTREE,
-                size_limit=1
-            )
-            
-            conn.unbind()
             return True, "LDAP connection successful"
             
         except LDAPBindError as e:
@@ -107,27 +242,34 @@ class LDAPManager:
             return False, None
         
         try:
-            # First, find the user
-            user_info = self.get_user_info(username)
-            if not user_info:
-                self.logger.warning(f"User {username} not found in LDAP")
-                return False, None
-            
-            # Try to bind with user credentials
-            server = Server(
-                self.config['server'],
-                port=self.config['port'],
-                use_ssl=self.config['use_ssl']
-            )
+            # First, find the user, reusing a recently resolved DN when possible
+            cached = self._dn_cache.get(username)
+            if cached and time.monotonic() < cached[1]:
+                user_info = dict(cached[0])
+            else:
+                user_info = self.get_user_info(username)
+                if not user_info:
+                    self.logger.warning(f"User {username} not found in LDAP")
+                    return False, None
+                self._cache_user(username, user_info, time.monotonic() + self._dn_cache_ttl)
+            
+            # Try to bind with user credentials, then restore the service bind
+            with self._acquire() as conn:
+                try:
+                    authenticated = conn.rebind(user=user_info['dn'], password=password)
+                except (LDAPBindError, LDAPInvalidCredentialsError, LDAPPasswordIsMandatoryError):
+                    # Rejected credentials are not a server failure; keep them out of the breaker
+                    authenticated = False
+                finally:
+                    conn.rebind(user=self.config['bind_dn'], password=self.config['bind_password'])
             
-            conn = Connection(
-                server,
-                user=user_info['dn'],
-                password=password,
-                auto_bind=True
-            )
+            if not authenticated:
+                # The DN may have moved; look it up again next time
+                self._dn_cache.pop(username, None)
+                raise LDAPInvalidCredentialsError("Invalid credentials")
             
-            conn.unbind()
+            if 'groups' not in user_info:
+                user_info['groups'] = self.get_user_groups(user_info['dn'])
             
             # Log successful authentication
             self._log_auth_event(username, True, "LDAP authentication successful")
@@ -144,6 +286,15 @@ class LDAPManager:
             self._log_auth_event(username, False, f"Authentication error: {e}")
             return False, None
     
+    def _cache_user(self, username: str, user_info: Dict, expires_at: float):
+        """
+        Cache a user's DN and attributes, leaving out groups
+        """
+        self._dn_cache[username] = (
+            {key: value for key, value in user_info.items() if key != 'groups'},
+            expires_at
+        )
+    
     def get_user_info(self, username: str) -> Optional[Dict]:
         """
         Get user information from LDAP
@@ -152,34 +303,22 @@ class LDAPManager:
             return None
         
         try:
-            server = Server(
-                self.config['server'],
-                port=self.config['port'],
-                use_ssl=self.config['use_ssl']
-            )
-            
-            conn = Connection(
-                server,
-                user=self.config['bind_dn'],
-                password=self.config['bind_password'],
-                auto_bind=True
-            )
-            
             # Search for user
-            search_filter = self.config['user_filter'].format(username=username)
-            
-            conn.search(
-                search_base=self.config['user_search_base'],
-                search_filter=search_filter,
-                search_scope=SUBTREE,
-                attributes=['*']
-            )
-            
-            if len(conn.entries) == 0:
-                conn.unbind()
+            search_filter = self.config['user_filter'].format(username=escape_filter_chars(username))
+            
+            with self._acquire() as conn:
+                conn.search(
+                    search_base=self.config['user_search_base'],
+                    search_filter=search_filter,
+                    search_scope=SUBTREE,
+                    attributes=USER_ATTRIBUTES
+                )
+                entries = list(conn.entries)
+            
+            if len(entries) == 0:
                 return None
             
-            entry = conn.entries[0]
+            entry = entries[0]
             user_info = {
                 'dn': str(entry.entry_dn),
                 'username': username,
@@ -191,13 +330,71 @@ class LDAPManager:
                 'groups': self.get_user_groups(str(entry.entry_dn))
             }
             
-            conn.unbind()
             return user_info
             
         except Exception as e:
             self.logger.error(f"Error getting user info for {username}: {e}")
             return None
     
+    def bulk_lookup(self, usernames: List[str]) -> Dict[str, Dict]:
+        """
+        Look up several users with a single OR-filter search.
+        Found users are returned keyed by username and seeded into the DN cache,
+        so a following authenticate_user only needs the bind.
+        """
+        if not LDAP_AVAILABLE or not usernames:
+            return {}
+        
+        user_attribute = self._user_attribute
+        if not user_attribute:
+            # Complex user filter: the matching username can't be read back from the entry
+            users = {}
+            for username in usernames:
+                user_info = self.get_user_info(username)
+                if user_info:
+                    users[username] = user_info
+            return users
+        
+        try:
+            search_filter = '(|{})'.format(''.join(
+                self.config['user_filter'].format(username=escape_filter_chars(username))
+                for username in usernames
+            ))
+            
+            with self._acquire() as conn:
+                entries = conn.extend.standard.paged_search(
+                    search_base=self.config['user_search_base'],
+                    search_filter=search_filter,
+                    search_scope=SUBTREE,
+                    attributes=[user_attribute] + USER_ATTRIBUTES,
+                    paged_size=self.config.get('page_size', 500),
+                    generator=False
+                )
+            
+            entries = [entry for entry in entries if entry.get('type') == 'searchResEntry']
+            memberships = (
+                self._get_group_memberships()
+                if len(entries) >= GROUP_SCAN_MIN_USERS else None
+            )
+            
+            # LDAP matches the login attribute case-insensitively
+            requested = {username.lower(): username for username in usernames}
+            expires_at = time.monotonic() + self._dn_cache_ttl
+            users = {}
+            for entry in entries:
+                username = requested.get(self._first_value(entry['attributes'], user_attribute).lower())
+                if username is None:
+                    continue
+                user_info = self._user_info_from_entry(entry, username, memberships)
+                users[username] = user_info
+                self._cache_user(username, user_info, expires_at)
+            
+            return users
+            
+        except Exception as e:
+            self.logger.error(f"Error looking up {len(usernames)} users: {e}")
+            return {}
+    
     def get_user_groups(self, user_dn: str) -> List[str]:
         """
         Get groups for a user
@@ -206,35 +403,23 @@ class LDAPManager:
             return []
         
         try:
-            server = Server(
-                self.config['server'],
-                port=self.config['port'],
-                use_ssl=self.config['use_ssl']
-            )
-            
-            conn = Connection(
-                server,
-                user=self.config['bind_dn'],
-                password=self.config['bind_password'],
-                auto_bind=True
-            )
-            
             # Search for groups containing this user
             search_filter = self.config['group_filter'].format(user_dn=user_dn)
             
-            conn.search(
-                search_base=self.config['group_search_base'],
-                search_filter=search_filter,
-                search_scope=SUBTREE,
-                attributes=['cn']
-            )
+            with self._acquire() as conn:
+                conn.search(
+                    search_base=self.config['group_search_base'],
+                    search_filter=search_filter,
+                    search_scope=SUBTREE,
+                    attributes=['cn']
+                )
+                entries = list(conn.entries)
             
             groups = []
-            for entry in conn.entries:
+            for entry in entries:
                 if hasattr(entry, 'cn'):
                     groups.append(str(entry.cn))
             
-            conn.unbind()
             return groups
             
         except Exception as e:
@@ -252,16 +437,27 @@ class LDAPManager:
             # Get all users from LDAP
             ldap_users = self.get_all_users()
             
-            # Sync to database
-            synced_count = 0
-            errors = []
+            # Refresh cached DNs and drop users that no longer exist in LDAP
+            expires_at = time.monotonic() + self._dn_cache_ttl
+            cached_usernames = set(self._dn_cache)
+            self._dn_cache = {}
+            for user in ldap_users:
+                if user['username'] in cached_usernames:
+                    self._cache_user(user['username'], user, expires_at)
             
+            # One row per username: a uid listed in several OUs would otherwise
+            # break the batch on the unique constraint, so the last entry wins
+            errors = []
+            users_by_name = {}
             for user in ldap_users:
-                try:
-                    self._sync_user_to_db(user)
-                    synced_count += 1
-                except Exception as e:
-                    errors.append(f"Failed to sync user {user.get('username', 'unknown')}: {e}")
+                if not user.get('username'):
+                    errors.append(f"Failed to sync user {user.get('dn', 'unknown')}: no uid or cn")
+                    continue
+                users_by_name[user['username']] = user
+            
+            # Sync to database in a single transaction
+            self._sync_users_to_db(list(users_by_name.values()))
+            synced_count = len(users_by_name)
             
             # Log sync results
             self._log_sync_event(synced_count, len(errors))
@@ -285,97 +481,161 @@ class LDAPManager:
             return []
         
         try:
-            server = Server(
-                self.config['server'],
-                port=self.config['port'],
-                use_ssl=self.config['use_ssl']
-            )
+            page_size = self.config.get('page_size', 500)
             
-            conn = Connection(
-                server,
-                user=self.config['bind_dn'],
-                password=self.config['bind_password'],
-                auto_bind=True
-            )
+            # Page through all users, fetching only the attributes we store
+            with self._acquire() as conn:
+                entries = conn.extend.standard.paged_search(
+                    search_base=self.config['user_search_base'],
+                    search_filter='(objectClass=inetOrgPerson)',
+                    search_scope=SUBTREE,
+                    attributes=['uid'] + USER_ATTRIBUTES,
+                    paged_size=page_size,
+                    generator=False
+                )
             
-            # Search for all users
-            conn.search(
-                search_base=self.config['user_search_base'],
-                search_filter='(objectClass=inetOrgPerson)',
-                search_scope=SUBTREE,
-                attributes=['*']
-            )
+            memberships = self._get_group_memberships()
             
             users = []
-            for entry in conn.entries:
-                user_info = {
-                    'dn': str(entry.entry_dn),
-                    'username': str(entry.uid) if hasattr(entry, 'uid') else str(entry.cn),
-                    'cn': str(entry.cn) if hasattr(entry, 'cn') else '',
-                    'mail': str(entry.mail) if hasattr(entry, 'mail') else '',
-                    'displayName': str(entry.displayName) if hasattr(entry, 'displayName') else '',
-                    'givenName': str(entry.givenName) if hasattr(entry, 'givenName') else '',
-                    'sn': str(entry.sn) if hasattr(entry, 'sn') else '',
-                    'groups': self.get_user_groups(str(entry.entry_dn))
-                }
-                users.append(user_info)
+            for entry in entries:
+                if entry.get('type') != 'searchResEntry':
+                    continue
+                attributes = entry['attributes']
+                username = self._first_value(attributes, 'uid') or self._first_value(attributes, 'cn')
+                users.append(self._user_info_from_entry(entry, username, memberships))
             
-            conn.unbind()
             return users
             
         except Exception as e:
             self.logger.error(f"Error getting all users: {e}")
             return []
     
-    def _sync_user_to_db(self, user_info: Dict):
+    def _parse_member_attribute(self) -> Optional[str]:
         """
-        Sync a single user to the database
+        Attribute name from a plain (attribute={user_dn}) group filter, else None
+        """
+        match = re.fullmatch(r'\((\w+)=\{user_dn\}\)', self.config.get('group_filter', ''))
+        return match.group(1) if match else None
+    
+    def _parse_user_attribute(self) -> Optional[str]:
+        """
+        Attribute name from a plain (attribute={username}) user filter, else None
+        """
+        match = re.fullmatch(r'\((\w+)=\{username\}\)', self.config.get('user_filter', ''))
+        return match.group(1) if match else None
+    
+    def _get_group_memberships(self) -> Optional[Dict[str, List[str]]]:
+        """
+        Map member DN (lowercased) to group names with one paged group search.
+        Returns None when the group filter is not a plain (attribute={user_dn}) match.
+        """
+        member_attribute = self._member_attribute
+        if not member_attribute:
+            return None
+        
+        with self._acquire() as conn:
+            entries = conn.extend.standard.paged_search(
+                search_base=self.config['group_search_base'],
+                search_filter=f'({member_attribute}=*)',
+                search_scope=SUBTREE,
+                attributes=['cn', member_attribute],
+                paged_size=self.config.get('page_size', 500),
+                generator=False
+            )
+        
+        memberships = defaultdict(list)
+        for entry in entries:
+            if entry.get('type') != 'searchResEntry':
+                continue
+            group_name = self._first_value(entry['attributes'], 'cn')
+            if not group_name:
+                continue
+            members = entry['attributes'].get(member_attribute, [])
+            for member_dn in ([members] if isinstance(members, str) else members):
+                memberships[member_dn.lower()].append(group_name)
+        return memberships
+    
+    def _user_info_from_entry(self, entry: Dict[str, Any], username: str,
+                              memberships: Optional[Dict[str, List[str]]]) -> Dict:
+        """
+        User info from a raw search entry, in the shape get_user_info returns.
+        Groups come from memberships when given, else from a group search for this user.
+        """
+        attributes = entry['attributes']
+        return {
+            'dn': entry['dn'],
+            'username': username,
+            'cn': self._first_value(attributes, 'cn') or username,
+            'mail': self._first_value(attributes, 'mail'),
+            'displayName': self._first_value(attributes, 'displayName'),
+            'givenName': self._first_value(attributes, 'givenName'),
+            'sn': self._first_value(attributes, 'sn'),
+            'groups': (
+                memberships.get(entry['dn'].lower(), [])
+                if memberships is not None
+                else self.get_user_groups(entry['dn'])
+            )
+        }
+    
+    @staticmethod
+    def _first_value(attributes: Dict[str, Any], name: str) -> str:
+        """
+        First value of an attribute from a raw search entry, or empty string
+        """
+        value = attributes.get(name)
+        if isinstance(value, (list, tuple)):
+            value = value[0] if value else ''
+        return str(value) if value else ''
+    
+    def _sync_users_to_db(self, users: List[Dict]):
+        """
+        Upsert LDAP users into the database in a single transaction
         """
         try:
-            # Create or update user in local database
             with self.db.get_cursor() as cursor:
-                # Check if user exists
-                cursor.execute("""
-                    SELECT id FROM ldap_users WHERE username = ?
-                """, (user_info['username'],))
+                cursor.execute("SELECT username FROM ldap_users")
+                existing = {row['username'] for row in cursor.fetchall()}
                 
-                existing = cursor.fetchone()
+                # Update existing users
+                cursor.executemany("""
+                    UPDATE ldap_users 
+                    SET dn = ?, email = ?, display_name = ?, 
+                        given_name = ?, surname = ?, groups_data = ?,
+                        last_sync = CURRENT_TIMESTAMP
+                    WHERE username = ?
+                """, [
+                    (
+                        user['dn'],
+                        user['mail'],
+                        user['displayName'],
+                        user['givenName'],
+                        user['sn'],
+                        json.dumps(user['groups']),
+                        user['username']
+                    )
+                    for user in users if user['username'] in existing
+                ])
                 
-                if existing:
-                    # Update existing user
-                    cursor.execute("""
-                        UPDATE ldap_users 
-                        SET dn = ?, email = ?, display_name = ?, 
-                            given_name = ?, surname = ?, groups_data = ?,
-                            last_sync = CURRENT_TIMESTAMP
-                        WHERE username = ?
-                    """, (
-                        user_info['dn'],
-                        user_info['mail'],
-                        user_info['displayName'],
-                        user_info['givenName'],
-                        user_info['sn'],
-                        json.dumps(user_info['groups']),
-                        user_info['username']
-                    ))
-                else:
-                    # Insert new user
-                    cursor.execute("""
-                        INSERT INTO ldap_users 
-                        (username, dn, email, display_name, given_name, surname, groups_data, last_sync)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-                    """, (
-                        user_info['username'],
-                        user_info['dn'],
-                        user_info['mail'],
-                        user_info['displayName'],
-                        user_info['givenName'],
-                        user_info['sn'],
-                        json.dumps(user_info['groups'])
-                    ))
+                # Insert new users
+                cursor.executemany("""
+                    INSERT INTO ldap_users 
+                    (username, dn, email, display_name, given_name, surname, groups_data, last_sync)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                """, [
+                    (
+                        user['username'],
+                        user['dn'],
+                        user['mail'],
+                        user['displayName'],
+                        user['givenName'],
+                        user['sn'],
+                        json.dumps(user['groups'])
+                    )
+                    for user in users if user['username'] not in existing
+                ])
                 
         except Exception as e:
-            self.logger.error(f"Error syncing user {user_info['username']} to database: {e}")
+            self.logger.error(f"Error syncing {len(users)} users to database: {e}")
             raise
     
     def _log_auth_event(self, username: str, success: bool, message: str):
@@ -417,11 +677,17 @@ class LDAPManager:
         Update LDAP configuration
         """
         self.config.update(new_config)
+        self.close_pool()
+        self._server = None
+        self._dn_cache.clear()
+        self._member_attribute = self._parse_member_attribute()
+        self._user_attribute = self._parse_user_attribute()
         self.logger.info("LDAP configuration updated")
 
 
 # Global instance
 _ldap_manager = None
+_ldap_manager_lock = threading.Lock()
 
 def get_ldap_manager(config: Optional[Dict[str, Any]] = None) -> LDAPManager:
     """
@@ -429,7 +695,11 @@ def get_ldap_manager(config: Optional[Dict[str, Any]] = None) -> LDAPManager:
     """
     global _ldap_manager
     if _ldap_manager is None:
-        _ldap_manager = LDAPManager(config)
+        with _ldap_manager_lock:
+            if _ldap_manager is None:
+                _ldap_manager = LDAPManager(config)
+                # Unbind the shared connection pool cleanly on interpreter exit
+                atexit.register(_ldap_manager.close_pool)
     return _ldap_manager
 
 
@@ -15,6 +15,10 @@ from typing import Dict, List, Optional, Any
 from datetime import datetime
 import logging
 
+# module path -> (mtime key, parsed module.json); shared by every ModuleManager,
+# since callers usually build a fresh manager per request
+_MODULE_INFO_CACHE: Dict[Path, tuple] = {}
+
 class ModuleManager:
     """Real module management system"""
     
@@ -77,37 +81,58 @@ class ModuleManager:
         if not self.modules_dir.exists():
             self.logger.warning(f"Modules directory {self.modules_dir} does not exist")
             return discovered
-            
+        
+        installed = self._get_installed_names()
         for module_path in self.modules_dir.iterdir():
             if module_path.is_dir() and not module_path.name.startswith('.'):
                 module_info = self._load_module_info(module_path)
                 if module_info:
+                    module_info['is_installed'] = module_info['name'] in installed
                     discovered.append(module_info)
                     
         return discovered
     
     def _load_module_info(self, module_path: Path) -> Optional[Dict[str, Any]]:
-        """Load module information from module.json"""
+        """Load module information; module.json is only re-parsed after the module changes"""
         try:
             module_json = module_path / "module.json"
             if not module_json.exists():
                 self.logger.warning(f"No module.json found in {module_path}")
                 return None
+            
+            # Directory mtime covers files being added or removed, module.json mtime covers edits
+            mtime_key = (module_path.stat().st_mtime_ns, module_json.stat().st_mtime_ns)
+            cached = _MODULE_INFO_CACHE.get(module_path)
+            if cached and cached[0] == mtime_key:
+                info = dict(cached[1])
+            else:
+                with open(module_json, 'r', encoding='utf-8') as f:
+                    parsed = json.load(f)
+                _MODULE_INFO_CACHE[module_path] = (mtime_key, parsed)
+                info = dict(parsed)
                 
-            with open(module_json, 'r', encoding='utf-8') as f:
-                info = json.load(f)
-                
-            # Add computed fields
+            # Add computed fields; dependencies can be installed or removed at any
+            # time, so loadability is always checked fresh
             info['install_path'] = str(module_path)
-            info['is_installed'] = self._is_module_installed(info['name'])
             info['is_loadable'] = self._check_module_loadable(module_path, info)
-            
             return info
             
         except Exception as e:
             self.logger.error(f"Failed to load module info from {module_path}: {e}")
             return None
     
+    def _get_installed_names(self) -> set:
+        """Names of all modules registered as installed"""
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            cursor.execute("SELECT name FROM installed_modules")
+            names = {row[0] for row in cursor.fetchall()}
+            conn.close()
+            return names
+        except Exception:
+            return set()
+    
     def _is_module_installed(self, module_name: str) -> bool:
         """Check if module is registered as installed"""
         try:
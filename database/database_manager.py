@@ -11,15 +11,110 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
 import hashlib
+import queue
 import threading
 from contextlib import contextmanager
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Connections are pooled per database file and shared by every DatabaseManager on it
+CONNECTION_POOL_SIZE = 8
+CONNECTION_PRAGMAS = (
+    "PRAGMA foreign_keys = ON",
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA mmap_size = 268435456",
+)
+_CONN_POOLS: Dict[str, queue.LifoQueue] = {}
+_CONN_POOLS_LOCK = threading.Lock()
+
+
+def _json_loads(data: str) -> Any:
+    """Parse a JSON column value, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(data: Any) -> str:
+    """Serialize a value for a JSON column, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data)
+
+
 class DatabaseManager:
     """
     Centralized database manager for MultiDBManager
     Handles SQLite operations, migrations, and data consistency
     """
     
+    # Hot-path SQL kept as fixed strings so each connection prepares it once
+    STATEMENTS = {
+        'add_server': """
+            INSERT INTO servers (name, host, port, database_name, database_type, username, password, 
+                               environment, scanner_settings, connection_metadata)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        'get_servers': """
+            SELECT s.*, ss.total_users, ss.active_users, ss.total_roles, ss.total_tables, ss.last_scan_at
+            FROM server_summary ss
+            JOIN servers s ON s.id = ss.id
+        """,
+        'get_server': """
+            SELECT s.*, ss.total_users, ss.active_users, ss.total_roles, ss.total_tables, ss.last_scan_at
+            FROM server_summary ss
+            JOIN servers s ON s.id = ss.id
+            WHERE s.id = ?
+            LIMIT 1
+        """,
+        'get_active_servers': """
+            SELECT s.*, ss.total_users, ss.active_users, ss.total_roles, ss.total_tables, ss.last_scan_at
+            FROM server_summary ss
+            JOIN servers s ON s.id = ss.id
+            WHERE s.status != 'Inactive'
+        """,
+        'update_server': """
+            UPDATE servers 
+            SET name = ?, host = ?, port = ?, database_name = ?, database_type = ?, 
+                username = ?, password = ?, environment = ?, 
+                scanner_settings = ?, connection_metadata = ?, updated_at = CURRENT_TIMESTAMP
+            WHERE id = ?
+        """,
+        'delete_server': "DELETE FROM servers WHERE id = ?",
+        'get_users_by_server': """
+            SELECT u.*, s.name as server_name
+            FROM users u
+            JOIN servers s ON u.server_id = s.id
+            WHERE u.server_id = ?
+            ORDER BY u.username
+        """,
+        'get_global_users': """
+            SELECT u.id, u.username, u.normalized_username, u.user_type, u.is_active, 
+                   u.last_login, u.created_at, u.discovered_at, u.metadata, u.permissions_data,
+                   s.name as server_name, s.database_type, s.environment,
+                   COUNT(DISTINCT s2.id) as appears_on_servers
+            FROM users u
+            JOIN servers s ON u.server_id = s.id
+            LEFT JOIN users u2 ON u.normalized_username = u2.normalized_username AND u2.id != u.id
+            LEFT JOIN servers s2 ON u2.server_id = s2.id
+            GROUP BY u.id, u.username, u.normalized_username, u.user_type, u.is_active, 
+                     u.last_login, u.created_at, u.discovered_at, u.metadata, u.permissions_data,
+                     s.name, s.database_type, s.environment
+            ORDER BY u.normalized_username
+        """,
+        'server_stats': "SELECT COUNT(*) as total, COUNT(CASE WHEN status LIKE '🟢%' THEN 1 END) as connected FROM servers",
+        'user_stats': "SELECT COUNT(*) as total, COUNT(CASE WHEN is_active THEN 1 END) as active FROM users",
+        'global_user_stats': "SELECT COUNT(DISTINCT normalized_username) as unique_users FROM users",
+        'activity_stats': "SELECT COUNT(*) as recent_events FROM user_activity WHERE timestamp > datetime('now', '-24 hours')",
+        'security_stats': "SELECT COUNT(*) as unresolved_events FROM security_events WHERE resolved = FALSE",
+    }
+    
     def __init__(self, db_path: str = "data/multidb_manager.db"):
         self.db_path = db_path
         self.logger = logging.getLogger("database_manager")
@@ -28,37 +123,71 @@ class DatabaseManager:
         # Ensure database directory exists
         os.makedirs(os.path.dirname(db_path), exist_ok=True)
         
+        self._pool_key = os.path.abspath(db_path)
+        with _CONN_POOLS_LOCK:
+            self._pool = _CONN_POOLS.setdefault(
+                self._pool_key, queue.LifoQueue(maxsize=CONNECTION_POOL_SIZE)
+            )
+        
         # Initialize database
         self._initialize_database()
     
-    def _get_connection(self) -> sqlite3.Connection:
-        """Get thread-local database connection"""
-        if not hasattr(self._local, 'connection'):
-            self._local.connection = sqlite3.connect(
-                self.db_path,
-                check_same_thread=False,
-                timeout=30.0
-            )
-            self._local.connection.row_factory = sqlite3.Row
-            self._local.connection.execute("PRAGMA foreign_keys = ON")
-            self._local.connection.execute("PRAGMA journal_mode = WAL")
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open a new database connection with the standard pragmas applied"""
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            timeout=30.0,
+            cached_statements=256
+        )
+        conn.row_factory = sqlite3.Row
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+    
+    @contextmanager
+    def _connection(self):
+        """Borrow a pooled connection; nested use on the same thread shares it"""
+        conn = getattr(self._local, 'connection', None)
+        if conn is not None:
+            yield conn
+            return
+        
+        try:
+            conn = self._pool.get_nowait()
+        except queue.Empty:
+            conn = self._open_connection()
         
-        return self._local.connection
+        self._local.connection = conn
+        try:
+            yield conn
+        finally:
+            del self._local.connection
+            if conn.in_transaction:
+                conn.rollback()
+            try:
+                self._pool.put_nowait(conn)
+            except queue.Full:
+                conn.close()
     
     @contextmanager
     def get_cursor(self):
         """Context manager for database operations"""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        try:
-            yield cursor
-            conn.commit()
-        except Exception as e:
-            conn.rollback()
-            self.logger.error(f"Database operation failed: {e}")
-            raise
-        finally:
-            cursor.close()
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            try:
+                yield cursor
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                self.logger.error(f"Database operation failed: {e}")
+                raise
+            finally:
+                cursor.close()
+    
+    def _execute(self, cursor: sqlite3.Cursor, name: str, params: Tuple = ()) -> sqlite3.Cursor:
+        """Run a named statement from STATEMENTS on the given cursor"""
+        return cursor.execute(self.STATEMENTS[name], params)
     
     def _initialize_database(self):
         """Initialize database with schema"""
@@ -72,41 +201,41 @@ class DatabaseManager:
                 # Split schema into individual statements to handle errors gracefully
                 statements = [stmt.strip() for stmt in schema_sql.split(';') if stmt.strip()]
                 
-                conn = self._get_connection()
-                cursor = conn.cursor()
+                with self._connection() as conn:
+                    cursor = conn.cursor()
                 
-                try:
-                    for statement in statements:
-                        if statement.strip():
-                            try:
-                                # Handle PRAGMA statements separately (they don't need transactions)
-                                if statement.strip().upper().startswith('PRAGMA'):
-                                    cursor.execute(statement)
-                                else:
-                                    cursor.execute(statement)
-                            except (sqlite3.OperationalError, sqlite3.IntegrityError) as e:
-                                error_msg = str(e).lower()
-                                # Skip if already exists (for triggers, views, etc.)
-                                if "already exists" in error_msg:
-                                    continue
-                                # Skip duplicate data insertion
-                                elif "unique constraint failed" in error_msg:
-                                    continue
-                                # Skip transaction warnings for PRAGMA
-                                elif "no transaction is active" in error_msg:
-                                    continue
-                                # Skip incomplete input warnings
-                                elif "incomplete input" in error_msg:
-                                    continue
-                                else:
-                                    self.logger.warning(f"Schema statement warning: {e}")
+                    try:
+                        for statement in statements:
+                            if statement.strip():
+                                try:
+                                    # Handle PRAGMA statements separately (they don't need transactions)
+                                    if statement.strip().upper().startswith('PRAGMA'):
+                                        cursor.execute(statement)
+                                    else:
+                                        cursor.execute(statement)
+                                except (sqlite3.OperationalError, sqlite3.IntegrityError) as e:
+                                    error_msg = str(e).lower()
+                                    # Skip if already exists (for triggers, views, etc.)
+                                    if "already exists" in error_msg:
+                                        continue
+                                    # Skip duplicate data insertion
+                                    elif "unique constraint failed" in error_msg:
+                                        continue
+                                    # Skip transaction warnings for PRAGMA
+                                    elif "no transaction is active" in error_msg:
+                                        continue
+                                    # Skip incomplete input warnings
+                                    elif "incomplete input" in error_msg:
+                                        continue
+                                    else:
+                                        self.logger.warning(f"Schema statement warning: {e}")
                     
-                    conn.commit()
-                except Exception as e:
-                    conn.rollback()
-                    raise
-                finally:
-                    cursor.close()
+                        conn.commit()
+                    except Exception as e:
+                        conn.rollback()
+                        raise
+                    finally:
+                        cursor.close()
                 
                 self.logger.info("Database initialized successfully")
             else:
@@ -123,11 +252,7 @@ class DatabaseManager:
     def add_server(self, server_config: Dict[str, Any]) -> int:
         """Add a new server configuration"""
         with self.get_cursor() as cursor:
-            cursor.execute("""
-                INSERT INTO servers (name, host, port, database_name, database_type, username, password, 
-                                   environment, scanner_settings, connection_metadata)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
+            self._execute(cursor, 'add_server', (
                 server_config['name'],
                 server_config['host'],
                 server_config['port'],
@@ -136,8 +261,8 @@ class DatabaseManager:
                 server_config.get('username'),
                 server_config.get('password'),
                 server_config.get('environment', 'Development'),
-                json.dumps(server_config.get('scanner_settings', {})),
-                json.dumps(server_config.get('connection_metadata') or server_config.get('metadata', {}))
+                _json_dumps(server_config.get('scanner_settings', {})),
+                _json_dumps(server_config.get('connection_metadata') or server_config.get('metadata', {}))
             ))
             
             server_id = cursor.lastrowid
@@ -147,32 +272,31 @@ class DatabaseManager:
     def get_servers(self, include_inactive: bool = True) -> List[Dict[str, Any]]:
         """Get all servers with their configuration"""
         with self.get_cursor() as cursor:
-            query = "SELECT * FROM server_summary"
-            if not include_inactive:
-                query += " WHERE status != 'Inactive'"
-            
-            cursor.execute(query)
+            # Summary counts and full server config in one query
+            self._execute(cursor, 'get_servers' if include_inactive else 'get_active_servers')
             servers = []
             
             for row in cursor.fetchall():
-                server = dict(row)
-                
-                # Get full server config
-                cursor.execute("SELECT * FROM servers WHERE id = ?", (server['id'],))
-                full_config = dict(cursor.fetchone())
-                
-                # Parse JSON fields
-                if full_config['scanner_settings']:
-                    full_config['scanner_settings'] = json.loads(full_config['scanner_settings'])
-                if full_config['connection_metadata']:
-                    full_config['connection_metadata'] = json.loads(full_config['connection_metadata'])
-                
-                # Merge summary with full config
-                server.update(full_config)
-                servers.append(server)
+                servers.append(self._server_from_row(row))
             
             return servers
     
+    def get_server(self, server_id: int) -> Optional[Dict[str, Any]]:
+        """Get a single server by ID, or None if it does not exist"""
+        with self.get_cursor() as cursor:
+            self._execute(cursor, 'get_server', (server_id,))
+            row = cursor.fetchone()
+            return self._server_from_row(row) if row else None
+    
+    def _server_from_row(self, row: sqlite3.Row) -> Dict[str, Any]:
+        """Convert a server row to a dict with its JSON fields parsed"""
+        server = dict(row)
+        if server['scanner_settings']:
+            server['scanner_settings'] = _json_loads(server['scanner_settings'])
+        if server['connection_metadata']:
+            server['connection_metadata'] = _json_loads(server['connection_metadata'])
+        return server
+    
     def get_all_servers(self) -> List[Dict[str, Any]]:
         """Alias for get_servers() for backward compatibility"""
         return self.get_servers()
@@ -197,8 +321,7 @@ class DatabaseManager:
             # Parse scan results if stored as JSON
             if scan_dict.get('scan_results'):
                 try:
-                    import json
-                    results = json.loads(scan_dict['scan_results'])
+                    results = _json_loads(scan_dict['scan_results'])
                     return results
                 except:
                     pass
@@ -228,13 +351,7 @@ class DatabaseManager:
         """Update server configuration"""
         try:
             with self.get_cursor() as cursor:
-                cursor.execute("""
-                    UPDATE servers 
-                    SET name = ?, host = ?, port = ?, database_name = ?, database_type = ?, 
-                        username = ?, password = ?, environment = ?, 
-                        scanner_settings = ?, connection_metadata = ?, updated_at = CURRENT_TIMESTAMP
-                    WHERE id = ?
-                """, (
+                self._execute(cursor, 'update_server', (
                     server_config['name'],
                     server_config['host'],
                     server_config['port'],
@@ -243,8 +360,8 @@ class DatabaseManager:
                     server_config.get('username'),
                     server_config.get('password'),
                     server_config.get('environment', 'Development'),
-                    json.dumps(server_config.get('scanner_settings', {})),
-                    json.dumps(server_config.get('connection_metadata') or server_config.get('metadata', {})),
+                    _json_dumps(server_config.get('scanner_settings', {})),
+                    _json_dumps(server_config.get('connection_metadata') or server_config.get('metadata', {})),
                     server_id
                 ))
                 
@@ -271,7 +388,7 @@ class DatabaseManager:
     def delete_server(self, server_id: int):
         """Delete server and all related data"""
         with self.get_cursor() as cursor:
-            cursor.execute("DELETE FROM servers WHERE id = ?", (server_id,))
+            self._execute(cursor, 'delete_server', (server_id,))
             self.logger.info(f"Deleted server ID: {server_id}")
     
     # ================================
@@ -284,44 +401,31 @@ class DatabaseManager:
             # Clear existing users for this server
             cursor.execute("DELETE FROM users WHERE server_id = ?", (server_id,))
             
-            # Insert new users
-            for user in users_data:
-                normalized_username = self._normalize_username(user['name'])
-                
-                cursor.execute("""
-                    INSERT INTO users (server_id, username, normalized_username, user_type, 
-                                     is_active, last_login, metadata, permissions_data)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
+            # Insert new users in a single batch
+            cursor.executemany("""
+                INSERT INTO users (server_id, username, normalized_username, user_type, 
+                                 is_active, last_login, metadata, permissions_data)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, [
+                (
                     server_id,
                     user['name'],
-                    normalized_username,
+                    self._normalize_username(user['name']),
                     user.get('type', 'unknown'),
                     user.get('active', True),
                     user.get('last_login'),
-                    json.dumps(user.get('metadata', {})),
-                    json.dumps(user.get('permissions', []))
-                ))
+                    _json_dumps(user.get('metadata', {})),
+                    _json_dumps(user.get('permissions', []))
+                )
+                for user in users_data
+            ])
             
             self.logger.info(f"Saved {len(users_data)} users for server ID: {server_id}")
     
     def get_global_users(self) -> Dict[str, Any]:
         """Get unified global users across all servers"""
         with self.get_cursor() as cursor:
-            cursor.execute("""
-                SELECT u.id, u.username, u.normalized_username, u.user_type, u.is_active, 
-                       u.last_login, u.created_at, u.discovered_at, u.metadata, u.permissions_data,
-                       s.name as server_name, s.database_type, s.environment,
-                       COUNT(DISTINCT s2.id) as appears_on_servers
-                FROM users u
-                JOIN servers s ON u.server_id = s.id
-                LEFT JOIN users u2 ON u.normalized_username = u2.normalized_username AND u2.id != u.id
-                LEFT JOIN servers s2 ON u2.server_id = s2.id
-                GROUP BY u.id, u.username, u.normalized_username, u.user_type, u.is_active, 
-                         u.last_login, u.created_at, u.discovered_at, u.metadata, u.permissions_data,
-                         s.name, s.database_type, s.environment
-                ORDER BY u.normalized_username
-            """)
+            self._execute(cursor, 'get_global_users')
             
             global_users = {}
             for row in cursor.fetchall():
@@ -361,21 +465,15 @@ class DatabaseManager:
     def get_users_by_server(self, server_id: int) -> List[Dict[str, Any]]:
         """Get all users for a specific server"""
         with self.get_cursor() as cursor:
-            cursor.execute("""
-                SELECT u.*, s.name as server_name
-                FROM users u
-                JOIN servers s ON u.server_id = s.id
-                WHERE u.server_id = ?
-                ORDER BY u.username
-            """, (server_id,))
+            self._execute(cursor, 'get_users_by_server', (server_id,))
             
             users = []
             for row in cursor.fetchall():
                 user = dict(row)
                 if user['metadata']:
-                    user['metadata'] = json.loads(user['metadata'])
+                    user['metadata'] = _json_loads(user['metadata'])
                 if user['permissions_data']:
-                    user['permissions_data'] = json.loads(user['permissions_data'])
+                    user['permissions_data'] = _json_loads(user['permissions_data'])
                 users.append(user)
             
             return users
@@ -436,7 +534,7 @@ class DatabaseManager:
                 WHERE id = ?
             """, (
                 duration_ms,
-                json.dumps(results),
+                _json_dumps(results),
                 len(results.get('users', [])),
                 len(results.get('roles', [])),
                 len(results.get('tables', [])),
@@ -475,7 +573,7 @@ class DatabaseManager:
             for row in cursor.fetchall():
                 scan = dict(row)
                 if scan['results']:
-                    scan['results'] = json.loads(scan['results'])
+                    scan['results'] = _json_loads(scan['results'])
                 history.append(scan)
             
             return history
@@ -528,32 +626,47 @@ class DatabaseManager:
             stats = {}
             
             # Server statistics
-            cursor.execute("SELECT COUNT(*) as total, COUNT(CASE WHEN status LIKE '🟢%' THEN 1 END) as connected FROM servers")
+            self._execute(cursor, 'server_stats')
             server_stats = dict(cursor.fetchone())
             stats['servers'] = server_stats
             
             # User statistics
-            cursor.execute("SELECT COUNT(*) as total, COUNT(CASE WHEN is_active THEN 1 END) as active FROM users")
+            self._execute(cursor, 'user_stats')
             user_stats = dict(cursor.fetchone())
             stats['users'] = user_stats
             
             # Global user statistics
-            cursor.execute("SELECT COUNT(DISTINCT normalized_username) as unique_users FROM users")
+            self._execute(cursor, 'global_user_stats')
             global_user_stats = dict(cursor.fetchone())
             stats['global_users'] = global_user_stats
             
             # Recent activity
-            cursor.execute("SELECT COUNT(*) as recent_events FROM user_activity WHERE timestamp > datetime('now', '-24 hours')")
+            self._execute(cursor, 'activity_stats')
             activity_stats = dict(cursor.fetchone())
             stats['activity'] = activity_stats
             
             # Security statistics
-            cursor.execute("SELECT COUNT(*) as unresolved_events FROM security_events WHERE resolved = FALSE")
+            self._execute(cursor, 'security_stats')
             security_stats = dict(cursor.fetchone())
             stats['security'] = security_stats
             
             return stats
     
+    def get_counts(self, queries: Dict[str, Tuple[str, Tuple]]) -> Dict[str, int]:
+        """
+        Run several scalar count queries as a single UNION ALL statement.
+        queries maps a result name to (sql, params), where sql selects one value.
+        """
+        sql = " UNION ALL ".join(f"SELECT ? AS name, ({query}) AS count" for query, _ in queries.values())
+        params = []
+        for name, (_, query_params) in queries.items():
+            params.append(name)
+            params.extend(query_params)
+        
+        with self.get_cursor() as cursor:
+            cursor.execute(sql, params)
+            return {row['name']: row['count'] for row in cursor.fetchall()}
+    
     def backup_database(self, backup_path: str = None) -> str:
         """Create database backup"""
         if not backup_path:
@@ -563,19 +676,25 @@ class DatabaseManager:
         os.makedirs(os.path.dirname(backup_path), exist_ok=True)
         
         # Create backup using SQLite backup API
-        source = self._get_connection()
         backup_conn = sqlite3.connect(backup_path)
         
-        source.backup(backup_conn)
+        with self._connection() as source:
+            source.backup(backup_conn)
         backup_conn.close()
         
         self.logger.info(f"Database backed up to: {backup_path}")
         return backup_path
     
     def close(self):
-        """Close database connection"""
-        if hasattr(self._local, 'connection'):
-            self._local.connection.close()
+        """Close pooled database connections and forget the pool for this path"""
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
+        with _CONN_POOLS_LOCK:
+            if _CONN_POOLS.get(self._pool_key) is self._pool:
+                del _CONN_POOLS[self._pool_key]
 
 
 # ================================
@@ -9,11 +9,15 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List
 
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 import streamlit as st
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
 sys.path.append(str(project_root))
@@ -27,6 +31,26 @@ from modules.alerts.alert_manager import AlertManager, AlertSeverity, AlertStatu
 logger = RedshiftLogger()
 
 
+def _dump_json(data: Dict[str, Any]) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+        )
+    return json.dumps(data, indent=2, default=str).encode("utf-8")
+
+
+# Fixed display order for severity breakdowns
+SEVERITY_ORDER = ("critical", "high", "medium", "low")
+
+# (column, legend name, line color) for the system resource chart
+SYSTEM_METRIC_TRACES = (
+    ("cpu_percent", "CPU %", "#1f77b4"),
+    ("memory_percent", "Memory %", "#ff7f0e"),
+    ("disk_percent", "Disk %", "#2ca02c"),
+)
+
+
 class AlertPanel:
     """Main alert management panel"""
 
@@ -146,8 +170,9 @@ class AlertPanel:
                 severity = alert.severity.value
                 severity_counts[severity] = severity_counts.get(severity, 0) + 1
 
-            # Display severity breakdown
-            severity_cols = st.columns(len(severity_counts))
+            # Display severity breakdown in a fixed layout so the column
+            # structure stays the same between reruns
+            severity_cols = st.columns(len(SEVERITY_ORDER))
 
             severity_colors = {
                 "critical": "🔴",
@@ -156,10 +181,15 @@ class AlertPanel:
                 "low": "🟢",
             }
 
-            for i, (severity, count) in enumerate(severity_counts.items()):
-                with severity_cols[i]:
-                    color = severity_colors.get(severity, "⚪")
-                    st.metric(f"{color} {severity.title()}", count)
+            for col, severity in zip(severity_cols, SEVERITY_ORDER):
+                with col:
+                    if severity in severity_counts:
+                        color = severity_colors.get(severity, "⚪")
+                        st.metric(
+                            f"{color} {severity.title()}", severity_counts[severity]
+                        )
+                    else:
+                        st.empty()
 
             # Recent alerts
             st.markdown("##### Recent Alerts:")
@@ -193,7 +223,10 @@ class AlertPanel:
 
         if not active_alerts:
             st.success("✅ No active alerts currently!")
-            st.balloons()
+            # Celebrate once per session, not on every rerun
+            if not st.session_state.get("_balloons_shown"):
+                st.balloons()
+                st.session_state["_balloons_shown"] = True
             return
 
         # Filter controls
@@ -295,32 +328,52 @@ class AlertPanel:
                             if key != "metrics":  # Skip complex metrics
                                 st.markdown(f"- **{key}:** {value}")
 
-            # Actions
+            # Actions - a single form per card so only the submit reruns
             if current_user and current_user.role in [UserRole.ADMIN, UserRole.MANAGER]:
-                col1, col2, col3, col4 = st.columns(4)
+                actions = []
+                if alert.status == AlertStatus.ACTIVE:
+                    actions.append("✅ Acknowledge")
+                if alert.status in [AlertStatus.ACTIVE, AlertStatus.ACKNOWLEDGED]:
+                    actions.append("🔧 Resolve")
+                actions.extend(["📤 Export", "🔄 Refresh"])
 
-                with col1:
-                    if alert.status == AlertStatus.ACTIVE:
-                        if st.button("✅ Acknowledge", key=f"ack_card_{alert.id}"):
-                            self._acknowledge_alert(alert.id)
+                with st.form(f"actions_{alert.id}", clear_on_submit=True):
+                    col1, col2 = st.columns([3, 1])
 
-                with col2:
-                    if alert.status in [AlertStatus.ACTIVE, AlertStatus.ACKNOWLEDGED]:
-                        if st.button("🔧 Resolve", key=f"resolve_card_{alert.id}"):
-                            self._resolve_alert(alert.id)
+                    with col1:
+                        action = st.selectbox(
+                            "Action",
+                            options=actions,
+                            key=f"action_{alert.id}",
+                            label_visibility="collapsed",
+                        )
 
-                with col3:
-                    if st.button("📤 Export", key=f"export_{alert.id}"):
+                    with col2:
+                        submitted = st.form_submit_button(
+                            "Apply", use_container_width=True
+                        )
+
+                if submitted:
+                    if action == "✅ Acknowledge":
+                        self._acknowledge_alert(alert.id)
+                    elif action == "🔧 Resolve":
+                        self._resolve_alert(alert.id)
+                    elif action == "📤 Export":
+                        # Download buttons are not allowed inside forms
                         self._export_alert(alert)
-
-                with col4:
-                    if st.button("🔄 Refresh", key=f"refresh_{alert.id}"):
+                    else:
                         st.rerun()
 
             st.markdown("---")
 
     def _render_system_metrics(self):
         """Render system metrics and monitoring charts"""
+        # Imported lazily so the other tabs don't pay the plotting import cost
+        import numpy as np
+        import pandas as pd
+        import plotly.express as px
+        import plotly.graph_objects as go
+
         st.markdown("#### 📈 System Performance Metrics")
 
         # Time range selector
@@ -384,75 +437,88 @@ class AlertPanel:
         # Performance charts
         st.markdown("##### Performance Trends:")
 
-        # CPU and Memory chart
-        fig_system = go.Figure()
-
-        fig_system.add_trace(
-            go.Scatter(
-                x=df["timestamp"],
-                y=df["cpu_percent"],
-                mode="lines",
-                name="CPU %",
-                line=dict(color="#1f77b4"),
-            )
-        )
-
-        fig_system.add_trace(
-            go.Scatter(
-                x=df["timestamp"],
-                y=df["memory_percent"],
-                mode="lines",
-                name="Memory %",
-                line=dict(color="#ff7f0e"),
-            )
-        )
-
-        fig_system.add_trace(
-            go.Scatter(
-                x=df["timestamp"],
-                y=df["disk_percent"],
+        # CPU and Memory chart - built in a single constructor call so plotly
+        # validates the figure once instead of once per trace/threshold
+        config = self.alert_manager.config
+        # Plain ndarrays take plotly's fast serialization path. Usage values
+        # are 0-100 percentages, so whole-percent uint8 is plenty for a chart
+        # and keeps the payload sent to the browser small.
+        timestamps = df["timestamp"].to_numpy()
+        traces = [
+            go.Scattergl(
+                x=timestamps,
+                y=np.clip(np.rint(df[column].fillna(0).to_numpy()), 0, 100).astype(
+                    np.uint8
+                ),
                 mode="lines",
-                name="Disk %",
-                line=dict(color="#2ca02c"),
+                name=name,
+                line=dict(color=color),
             )
-        )
-
-        # Add threshold lines
-        config = self.alert_manager.config
-        fig_system.add_hline(
-            y=config.get("alert_threshold_cpu", 80),
-            line_dash="dash",
-            line_color="red",
-            annotation_text="CPU Alert Threshold",
-        )
-
-        fig_system.add_hline(
-            y=config.get("alert_threshold_memory", 85),
-            line_dash="dash",
-            line_color="orange",
-            annotation_text="Memory Alert Threshold",
-        )
-
-        fig_system.update_layout(
-            title="System Resource Usage Over Time",
-            xaxis_title="Time",
-            yaxis_title="Usage Percentage",
-            hovermode="x unified",
+            for column, name, color in SYSTEM_METRIC_TRACES
+        ]
+
+        # Threshold lines
+        thresholds = [
+            (config.get("alert_threshold_cpu", 80), "red", "CPU Alert Threshold"),
+            (
+                config.get("alert_threshold_memory", 85),
+                "orange",
+                "Memory Alert Threshold",
+            ),
+        ]
+
+        fig_system = go.Figure(
+            data=traces,
+            layout=dict(
+                title="System Resource Usage Over Time",
+                xaxis=dict(title="Time"),
+                yaxis=dict(title="Usage Percentage"),
+                hovermode="x unified",
+                # Keep zoom/pan state across reruns
+                uirevision="alerts_metrics",
+                shapes=[
+                    dict(
+                        type="line",
+                        xref="paper",
+                        x0=0,
+                        x1=1,
+                        yref="y",
+                        y0=value,
+                        y1=value,
+                        line=dict(color=color, dash="dash"),
+                    )
+                    for value, color, _ in thresholds
+                ],
+                annotations=[
+                    dict(
+                        xref="paper",
+                        x=1,
+                        yref="y",
+                        y=value,
+                        text=text,
+                        showarrow=False,
+                        xanchor="right",
+                        yanchor="bottom",
+                    )
+                    for value, _, text in thresholds
+                ],
+            ),
         )
 
         st.plotly_chart(fig_system, use_container_width=True)
 
         # Network activity chart if data available
         if "active_connections" in df.columns:
+            connections = np.clip(
+                df["active_connections"].fillna(0).to_numpy(),
+                0,
+                np.iinfo(np.uint16).max,
+            ).astype(np.uint16)
             fig_network = px.line(
-                df,
-                x="timestamp",
-                y="active_connections",
+                x=timestamps,
+                y=connections,
                 title="Network Connections Over Time",
-                labels={
-                    "active_connections": "Active Connections",
-                    "timestamp": "Time",
-                },
+                labels={"y": "Active Connections", "x": "Time"},
             )
 
             st.plotly_chart(fig_network, use_container_width=True)
@@ -700,7 +766,7 @@ class AlertPanel:
 
         st.download_button(
             "💾 Download Alert Details",
-            data=json.dumps(alert_data, indent=2),
+            data=_dump_json(alert_data),
             file_name=f"alert_{alert.id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
             mime="application/json",
         )
@@ -711,16 +777,14 @@ class AlertPanel:
             config_path = project_root / "data" / "module_configs" / "alert_system.json"
 
             if config_path.exists():
-                with open(config_path, "r") as f:
-                    full_config = json.load(f)
+                full_config = json.loads(config_path.read_bytes())
             else:
                 full_config = {"enabled": True, "auto_start": True, "priority": 8}
 
             full_config["custom"] = new_config
             full_config["last_modified"] = datetime.now().isoformat()
 
-            with open(config_path, "w") as f:
-                json.dump(full_config, f, indent=2)
+            config_path.write_bytes(_dump_json(full_config))
 
             # Update alert manager config
             self.alert_manager.config = new_config
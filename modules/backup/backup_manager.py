@@ -3,30 +3,330 @@ Backup Manager Module
 Core backup and restore functionality for RedshiftManager.
 """
 
+import errno
+import hashlib
+import io
 import json
 import logging
+import mmap
 import os
 import shutil
 
 # Add project root to path
 import sys
+import tarfile
 import threading
 import time
+import uuid
 import zipfile
+import zlib
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
-
-import schedule
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+try:
+    from blake3 import blake3
+
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
 
 project_root = Path(__file__).parent.parent.parent
-sys.path.append(str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.append(str(project_root))
 
 from utils.logging_system import RedshiftLogger
 from utils.user_preferences import UserPreferencesManager
 
 from core.plugin_interface import ModuleBase
 
+# A file to put in a backup: (archive name, source file or generated content)
+BackupItem = Tuple[str, Union[Path, bytes]]
+
+# Worker threads for I/O bound scans and deletions of the backup store
+BACKUP_IO_WORKERS = 16
+
+# Content hash recorded in backup manifests; manifests hashed with another
+# algorithm can't be compared against and are treated as having no files
+HASH_ALGORITHM = "blake3" if BLAKE3_AVAILABLE else "sha256"
+
+# How long an unchanged backup listing may be served from cache
+LIST_CACHE_TTL_SECONDS = 2.0
+
+# Number of uncompressed backup directory sizes to remember
+DIR_SIZE_CACHE_SIZE = 1024
+
+# File suffixes of compressed backup archives, by compression setting
+ARCHIVE_SUFFIXES = {"zip": ".zip", "zstd": ".tar.zst"}
+
+# Files that are already compressed gain nothing from deflate
+COMPRESSED_SUFFIXES = {".zip", ".gz", ".xz", ".zst", ".bz2", ".png", ".jpg", ".jpeg"}
+COMPRESSED_MAGIC = (
+    b"PK\x03\x04",  # zip
+    b"\x1f\x8b",  # gzip
+    b"\xfd7zXZ",  # xz
+    b"\x28\xb5\x2f\xfd",  # zstd
+    b"BZh",  # bzip2
+    b"\x89PNG",  # png
+    b"\xff\xd8\xff",  # jpeg
+)
+
+
+def _load_json(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dump_json(data: Any, indent: bool = True) -> bytes:
+    """Serialize to JSON bytes, using orjson when available
+
+    With indent=False the output is compact and fits on one line.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        return json.dumps(data, indent=2).encode("utf-8")
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def _hash_bytes(data: bytes) -> str:
+    """Content hash of in-memory backup content"""
+    if BLAKE3_AVAILABLE:
+        return blake3(data).hexdigest()
+    return hashlib.sha256(data).hexdigest()
+
+
+def _hash_file(file_path: Path) -> str:
+    """Content hash used to detect changed files in backup manifests"""
+    if BLAKE3_AVAILABLE:
+        digest = blake3(max_threads=blake3.AUTO)
+        if file_path.stat().st_size:
+            digest.update_mmap(str(file_path))
+        return digest.hexdigest()
+
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _is_compressed(file_path: Path, data: bytes) -> bool:
+    """Check whether file contents are already compressed"""
+    return file_path.suffix.lower() in COMPRESSED_SUFFIXES or data.startswith(
+        COMPRESSED_MAGIC
+    )
+
+
+def _deflate_data(
+    data: Union[bytes, mmap.mmap], level: int
+) -> Tuple[int, bytes, int, int]:
+    """Raw-deflate a zip entry payload, returning (crc32, payload, size, compress_type)"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+    payload = compressor.compress(data) + compressor.flush()
+    return zlib.crc32(data), payload, len(data), zipfile.ZIP_DEFLATED
+
+
+def _deflate_file(
+    source: Union[Path, bytes], level: int
+) -> Tuple[int, bytes, int, int]:
+    """Prepare a zip entry payload, returning (crc32, payload, size, compress_type)
+
+    Already-compressed files are stored as-is, everything else is raw-deflated.
+    Files are memory-mapped so zlib reads them without an extra copy.
+    """
+    if isinstance(source, bytes):
+        return _deflate_data(source, level)
+
+    with open(source, "rb") as f:
+        if not os.fstat(f.fileno()).st_size:
+            return _deflate_data(b"", level)
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if _is_compressed(source, data[:8]):
+                return zlib.crc32(data), data[:], len(data), zipfile.ZIP_STORED
+            return _deflate_data(data, level)
+
+
+def _copy_fd(src_fd: int, dst_fd: int):
+    """Copy between file descriptors, preferring in-kernel copies"""
+    copy_file_range = getattr(os, "copy_file_range", None)
+    if copy_file_range is not None:
+        try:
+            while copy_file_range(src_fd, dst_fd, 1 << 30):
+                pass
+            return
+        except OSError as e:
+            if e.errno not in (
+                errno.EXDEV,
+                errno.ENOSYS,
+                errno.EINVAL,
+                errno.EOPNOTSUPP,
+            ):
+                raise
+
+    sendfile = getattr(os, "sendfile", None)
+    if sendfile is not None:
+        try:
+            while sendfile(dst_fd, src_fd, None, 1 << 30):
+                pass
+            return
+        except OSError as e:
+            if e.errno not in (errno.EINVAL, errno.ENOSYS, errno.ENOTSOCK):
+                raise
+
+    with open(src_fd, "rb", closefd=False) as fsrc, open(
+        dst_fd, "wb", closefd=False
+    ) as fdst:
+        shutil.copyfileobj(fsrc, fdst, 1 << 20)
+
+
+def _ensure_dirs(paths: Iterable[Path]):
+    """Create a batch of directories with as few mkdir calls as possible
+
+    Deepest paths go first, so directories created as a side effect of an
+    earlier makedirs are not created again.
+    """
+    created = set()
+    for path in sorted(set(paths), key=lambda p: len(p.parts), reverse=True):
+        if path in created:
+            continue
+        os.makedirs(path, exist_ok=True)
+        created.add(path)
+        created.update(path.parents)
+
+
+def _ordered_map(
+    executor: ThreadPoolExecutor,
+    func: Callable[..., Any],
+    items: Iterable[Any],
+    window: int,
+) -> Iterator[Any]:
+    """Like executor.map, but keeps at most `window` tasks in flight"""
+    pending = deque()
+    for item in items:
+        pending.append(executor.submit(func, *item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+# ZipFile internals used by _write_precompressed; they are not public API,
+# so archives are written with plain ZipFile.write if a release changes them
+ZIPFILE_INTERNALS = (
+    "fp",
+    "start_dir",
+    "filelist",
+    "NameToInfo",
+    "_writecheck",
+    "_didModify",
+)
+
+
+def _can_write_precompressed(zipf: zipfile.ZipFile) -> bool:
+    """Check an open archive has the internals _write_precompressed needs"""
+    return all(hasattr(zipf, name) for name in ZIPFILE_INTERNALS)
+
+
+def _write_precompressed(
+    zipf: zipfile.ZipFile, zinfo: zipfile.ZipInfo, crc: int, payload: bytes, size: int
+):
+    """Append an already-compressed entry to an open zip archive
+
+    Mirrors what ZipFile does when closing an entry opened for writing, but
+    skips the compression step since the payload is compressed up front.
+    Only call this when _can_write_precompressed(zipf) holds.
+    """
+    zinfo.CRC = crc
+    zinfo.file_size = size
+    zinfo.compress_size = len(payload)
+    zinfo.flag_bits = 0
+    if not zinfo.external_attr:
+        zinfo.external_attr = 0o600 << 16
+    zip64 = max(size, len(payload)) > zipfile.ZIP64_LIMIT
+
+    zipf.fp.seek(zipf.start_dir)
+    zinfo.header_offset = zipf.fp.tell()
+    zipf._writecheck(zinfo)
+    zipf._didModify = True
+    zipf.fp.write(zinfo.FileHeader(zip64))
+    zipf.fp.write(payload)
+
+    zipf.filelist.append(zinfo)
+    zipf.NameToInfo[zinfo.filename] = zinfo
+    zipf.start_dir = zipf.fp.tell()
+
+
+def _extract_zip(zip_path: Path, dest_dir: Path, workers: int):
+    """Extract a zip archive, inflating its entries in parallel
+
+    ZipFile serializes reads on its shared file object, so every worker
+    thread opens its own handle on the archive.
+    """
+    dest_root = dest_dir.resolve()
+    with zipfile.ZipFile(zip_path, "r") as zipf:
+        members = []
+        dirs = {dest_root}
+        for info in zipf.infolist():
+            target = (dest_root / info.filename).resolve()
+            if target != dest_root and dest_root not in target.parents:
+                raise ValueError(f"Unsafe path in backup archive: {info.filename}")
+            if info.is_dir():
+                dirs.add(target)
+            else:
+                dirs.add(target.parent)
+                members.append((info, target))
+    _ensure_dirs(dirs)
+
+    local = threading.local()
+    handles = []
+
+    def extract_member(info: zipfile.ZipInfo, target: Path):
+        worker_zip = getattr(local, "zipf", None)
+        if worker_zip is None:
+            worker_zip = local.zipf = zipfile.ZipFile(zip_path, "r")
+            handles.append(worker_zip)
+        with worker_zip.open(info, "r") as src, open(target, "wb") as dst:
+            shutil.copyfileobj(src, dst, 1 << 20)
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for future in [executor.submit(extract_member, *m) for m in members]:
+                future.result()
+    finally:
+        for worker_zip in handles:
+            worker_zip.close()
+
 
 class BackupManager(ModuleBase):
     """
@@ -42,6 +342,19 @@ class BackupManager(ModuleBase):
 
         self._scheduler_thread = None
         self._scheduler_running = False
+        self._scheduler_wake = threading.Event()
+        self._next_backup_at: Optional[datetime] = None
+
+        # Background deletion of discarded temp directories
+        self._trash_lock = threading.Lock()
+        self._trash_thread = None
+
+        # (directory state key, monotonic timestamp, backups) from list_backups
+        self._list_cache = (None, 0.0, None)
+
+        # (st_dev, st_ino, st_mtime_ns) of a directory -> its total size
+        self._dir_size_cache: "OrderedDict[Tuple[int, int, int], int]" = OrderedDict()
+        self._dir_size_lock = threading.Lock()
 
         self.logger.log_action_start("Backup Manager initialized")
 
@@ -95,19 +408,22 @@ class BackupManager(ModuleBase):
                 project_root / "data" / "module_configs" / "backup_module.json"
             )
             if config_path.exists():
-                with open(config_path, "r") as f:
-                    config_data = json.load(f)
-                    return config_data.get("custom", {})
+                config_data = _load_json(config_path.read_bytes())
+                return config_data.get("custom", {})
 
             # Default configuration
             return {
                 "backup_frequency": "daily",
                 "backup_location": "./backup",
                 "compress_backups": True,
+                "compression": "zip",
+                "compress_level": 1,
+                "zstd_level": 3,
                 "retention_days": 30,
                 "include_user_data": True,
                 "include_logs": False,
                 "encrypt_backups": False,
+                "max_incremental_backups": 6,
             }
         except Exception as e:
             self.logger.log_error(f"Error loading backup config: {e}")
@@ -118,6 +434,7 @@ class BackupManager(ModuleBase):
         directories = [
             "full_backups",
             "incremental_backups",
+            "manifests",
             "config_backups",
             "user_backups",
             "temp",
@@ -126,6 +443,9 @@ class BackupManager(ModuleBase):
         for dir_name in directories:
             (self.backup_dir / dir_name).mkdir(parents=True, exist_ok=True)
 
+        # Finish deleting anything left in the trash by a previous run
+        self._empty_trash()
+
     def _start_scheduler(self):
         """Start the backup scheduler"""
         if self._scheduler_running:
@@ -133,24 +453,21 @@ class BackupManager(ModuleBase):
 
         frequency = self.config.get("backup_frequency", "daily")
 
-        if frequency == "hourly":
-            schedule.every().hour.do(self._scheduled_backup)
-        elif frequency == "daily":
-            schedule.every().day.at("02:00").do(self._scheduled_backup)
-        elif frequency == "weekly":
-            schedule.every().week.do(self._scheduled_backup)
         # Manual frequency doesn't schedule automatic backups
+        self._next_backup_at = self._compute_next_backup(frequency)
+        if self._next_backup_at is None:
+            return
 
-        if frequency != "manual":
-            self._scheduler_running = True
-            self._scheduler_thread = threading.Thread(
-                target=self._run_scheduler, daemon=True
-            )
-            self._scheduler_thread.start()
+        self._scheduler_wake.clear()
+        self._scheduler_running = True
+        self._scheduler_thread = threading.Thread(
+            target=self._run_scheduler, args=(frequency,), daemon=True
+        )
+        self._scheduler_thread.start()
 
-            self.logger.log_action_end(
-                f"Backup scheduler started with {frequency} frequency"
-            )
+        self.logger.log_action_end(
+            f"Backup scheduler started with {frequency} frequency"
+        )
 
     def _stop_scheduler(self):
         """Stop the backup scheduler"""
@@ -158,30 +475,68 @@ class BackupManager(ModuleBase):
             return
 
         self._scheduler_running = False
-        schedule.clear()
+        self._scheduler_wake.set()
 
         if self._scheduler_thread and self._scheduler_thread.is_alive():
             self._scheduler_thread.join(timeout=5)
 
+        self._next_backup_at = None
         self.logger.log_action_end("Backup scheduler stopped")
 
-    def _run_scheduler(self):
-        """Run the backup scheduler loop"""
+    def _run_scheduler(self, frequency: str):
+        """Run the backup scheduler loop
+
+        Sleeps until the next scheduled backup; _stop_scheduler wakes it early.
+        """
         while self._scheduler_running:
-            schedule.run_pending()
-            time.sleep(60)  # Check every minute
+            timeout = (self._next_backup_at - datetime.now()).total_seconds()
+            self._scheduler_wake.wait(max(0.0, timeout))
+            if not self._scheduler_running:
+                return
+
+            if datetime.now() >= self._next_backup_at:
+                self._scheduled_backup()
+                self._next_backup_at = self._compute_next_backup(frequency)
+
+    @staticmethod
+    def _compute_next_backup(
+        frequency: str, now: Optional[datetime] = None
+    ) -> Optional[datetime]:
+        """Get when the next backup is due for a frequency, or None if manual"""
+        now = now or datetime.now()
+
+        if frequency == "hourly":
+            return now + timedelta(hours=1)
+        if frequency == "daily":
+            next_backup = now.replace(hour=2, minute=0, second=0, microsecond=0)
+            if next_backup <= now:
+                next_backup += timedelta(days=1)
+            return next_backup
+        if frequency == "weekly":
+            return now + timedelta(weeks=1)
+        return None
 
     def _scheduled_backup(self):
         """Perform scheduled backup"""
         try:
             self.logger.log_action_start("Scheduled backup started")
-            self.create_full_backup(auto_generated=True)
+
+            # Prefer a cheap incremental backup until the chain gets too long
+            base_name = self._get_incremental_base()
+            if base_name:
+                self.create_incremental_backup(base_name, auto_generated=True)
+            else:
+                self.create_full_backup(auto_generated=True)
+
             self._cleanup_old_backups()
         except Exception as e:
             self.logger.log_error(f"Scheduled backup failed: {e}")
 
     def create_full_backup(
-        self, backup_name: Optional[str] = None, auto_generated: bool = False
+        self,
+        backup_name: Optional[str] = None,
+        auto_generated: bool = False,
+        overrides: Optional[Dict[str, Any]] = None,
     ) -> Tuple[bool, str]:
         """
         Create a complete system backup
@@ -189,80 +544,342 @@ class BackupManager(ModuleBase):
         Args:
             backup_name: Custom name for the backup
             auto_generated: Whether this is an automatic backup
+            overrides: Config values to use for this backup only
 
         Returns:
             Tuple of (success, backup_file_path)
         """
+        return self._create_backup(backup_name, auto_generated, overrides=overrides)
+
+    def create_incremental_backup(
+        self,
+        base_name: str,
+        backup_name: Optional[str] = None,
+        auto_generated: bool = False,
+    ) -> Tuple[bool, str]:
+        """
+        Create a backup holding only the files changed since another backup
+
+        Args:
+            base_name: Name of the full or incremental backup to build on
+            backup_name: Custom name for the backup
+            auto_generated: Whether this is an automatic backup
+
+        Returns:
+            Tuple of (success, backup_file_path)
+        """
+        base_manifest = self._load_manifest(base_name)
+        if base_manifest is None:
+            return False, f"No manifest found for base backup: {base_name}"
+
+        return self._create_backup(backup_name, auto_generated, base_manifest)
+
+    def _create_backup(
+        self,
+        backup_name: Optional[str],
+        auto_generated: bool,
+        base_manifest: Optional[Dict[str, Any]] = None,
+        overrides: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[bool, str]:
+        """Create a full backup, or an incremental one on top of base_manifest"""
+        backup_type = "full" if base_manifest is None else "incremental"
+
+        # Read settings once so a config change mid-backup can't mix behaviours
+        cfg = {**self._config, **overrides} if overrides else self._config
+        include_user_data = cfg.get("include_user_data", True)
+        include_logs = cfg.get("include_logs", False)
+        compression = (
+            cfg.get("compression") or "zip"
+            if cfg.get("compress_backups", True)
+            else "none"
+        )
+        encrypt = cfg.get("encrypt_backups", False)
+        n_threads = cfg.get("compress_threads") or os.cpu_count() or 1
+
+        # Backups written elsewhere are invisible to _find_backup_path, so they
+        # can't be part of an incremental chain
+        backup_root = (
+            Path(overrides["backup_location"])
+            if overrides and overrides.get("backup_location")
+            else self.backup_dir
+        )
+        in_backup_dir = backup_root.resolve() == self.backup_dir.resolve()
+        if base_manifest is not None and not in_backup_dir:
+            return False, "Incremental backups must be stored in the backup directory"
+
         try:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
             if not backup_name:
                 prefix = "auto" if auto_generated else "manual"
-                backup_name = f"{prefix}_backup_{timestamp}"
+                suffix = "backup" if base_manifest is None else "incremental"
+                backup_name = f"{prefix}_{suffix}_{timestamp}"
 
-            self.logger.log_action_start(f"Creating full backup: {backup_name}")
+            self.logger.log_action_start(
+                f"Creating {backup_type} backup: {backup_name}"
+            )
 
-            # Create temporary directory for backup preparation
-            temp_dir = self.backup_dir / "temp" / backup_name
-            temp_dir.mkdir(parents=True, exist_ok=True)
+            # Collect the files to back up; they are streamed straight from
+            # their source locations into the backup without a staging copy
+            items = list(
+                self._iter_backup_items(
+                    include_user_data=include_user_data,
+                    include_logs=include_logs,
+                )
+            )
 
-            try:
-                # Backup system configurations
-                self._backup_system_config(temp_dir)
+            # Record file state and drop anything unchanged since the base;
+            # backups outside the backup dir get no manifest, so skip hashing
+            previous_files = None
+            if base_manifest and base_manifest.get("hash_algorithm") == HASH_ALGORITHM:
+                previous_files = base_manifest["files"]
+            if in_backup_dir:
+                manifest_files, changed = self._build_manifest(items, previous_files)
+            else:
+                manifest_files, changed = {}, set()
+            deleted = []
+            if base_manifest is not None:
+                items = [item for item in items if item[0] in changed]
+
+                # Files gone since the base, so a chain restore removes them too;
+                # sections left out by configuration were not deleted
+                excluded = {
+                    section
+                    for section, included in (
+                        ("user_data", include_user_data),
+                        ("logs", include_logs),
+                    )
+                    if not included
+                }
+                deleted = sorted(
+                    arcname
+                    for arcname in base_manifest["files"]
+                    if arcname not in manifest_files
+                    and arcname.split("/", 1)[0] not in excluded
+                )
 
-                # Backup user data if enabled
-                if self.config.get("include_user_data", True):
-                    self._backup_user_data(temp_dir)
+            # Create metadata
+            parent = base_manifest["backup_name"] if base_manifest else None
+            items.append(
+                (
+                    "backup_metadata.json",
+                    self._create_backup_metadata(
+                        backup_name, auto_generated, parent, cfg, deleted
+                    ),
+                )
+            )
 
-                # Backup module configurations
-                self._backup_module_configs(temp_dir)
+            # Compress backup if enabled
+            target_dir = backup_root / f"{backup_type}_backups"
+            if compression == "zstd" and not ZSTD_AVAILABLE:
+                self.logger.log_error(
+                    "zstandard is not installed, falling back to zip compression"
+                )
+                compression = "zip"
+            if compression == "zstd":
+                backup_file = target_dir / f"{backup_name}.tar.zst"
+                self._create_zstd_backup(
+                    items, backup_file, cfg.get("zstd_level", 3), n_threads
+                )
+            elif compression == "zip":
+                backup_file = target_dir / f"{backup_name}.zip"
+                self._create_zip_backup(
+                    items, backup_file, cfg.get("compress_level", 1), n_threads
+                )
+            else:
+                backup_file = target_dir / backup_name
+                self._write_directory_backup(items, backup_file)
+
+            # Encrypt if enabled
+            if encrypt:
+                backup_file = self._encrypt_backup(backup_file)
+
+            if in_backup_dir:
+                self._save_manifest(
+                    {
+                        "backup_name": backup_name,
+                        "created_at": datetime.now().isoformat(),
+                        "parent": parent,
+                        "hash_algorithm": HASH_ALGORITHM,
+                        "chain_length": (
+                            base_manifest.get("chain_length", 0) + 1
+                            if base_manifest
+                            else 0
+                        ),
+                        "files": manifest_files,
+                        "deleted": deleted,
+                    }
+                )
 
-                # Backup database connections
-                self._backup_database_connections(temp_dir)
+            self._list_cache = (None, 0.0, None)
+            self.logger.log_action_end(
+                f"{backup_type.title()} backup created successfully: "
+                f"{backup_file} ({len(items) - 1} files)"
+            )
+            return True, str(backup_file)
 
-                # Backup application settings
-                self._backup_app_settings(temp_dir)
+        except Exception as e:
+            self.logger.log_error(f"Failed to create {backup_type} backup: {e}")
+            return False, str(e)
 
-                # Include logs if enabled
-                if self.config.get("include_logs", False):
-                    self._backup_logs(temp_dir)
+    def _build_manifest(
+        self,
+        items: List[BackupItem],
+        previous: Optional[Dict[str, Dict[str, Any]]],
+    ) -> Tuple[Dict[str, Dict[str, Any]], Set[str]]:
+        """
+        Describe every backup item for incremental backups
 
-                # Create metadata
-                self._create_backup_metadata(temp_dir, backup_name, auto_generated)
+        Files whose size and mtime match the previous manifest are assumed
+        unchanged; everything else is hashed and compared.
 
-                # Compress backup if enabled
-                if self.config.get("compress_backups", True):
-                    backup_file = (
-                        self.backup_dir / "full_backups" / f"{backup_name}.zip"
-                    )
-                    self._create_zip_backup(temp_dir, backup_file)
-                else:
-                    backup_file = self.backup_dir / "full_backups" / backup_name
-                    shutil.copytree(temp_dir, backup_file)
+        Returns:
+            Tuple of (manifest files, set of changed arcnames)
+        """
+        previous = previous or {}
+        files = {}
+        changed = set()
 
-                # Encrypt if enabled
-                if self.config.get("encrypt_backups", False):
-                    backup_file = self._encrypt_backup(backup_file)
+        for arcname, source in items:
+            entry = previous.get(arcname)
 
-                self.logger.log_action_end(
-                    f"Full backup created successfully: {backup_file}"
-                )
-                return True, str(backup_file)
+            if isinstance(source, bytes):
+                size, mtime_ns = len(source), None
+                digest = _hash_bytes(source)
+            else:
+                stat = source.stat()
+                size, mtime_ns = stat.st_size, stat.st_mtime_ns
+                if entry and entry["size"] == size and entry["mtime_ns"] == mtime_ns:
+                    files[arcname] = entry
+                    continue
+                digest = _hash_file(source)
+
+            files[arcname] = {"size": size, "mtime_ns": mtime_ns, "hash": digest}
+            if not entry or entry["hash"] != digest:
+                changed.add(arcname)
+
+        return files, changed
+
+    def _manifest_path(self, backup_name: str) -> Path:
+        """Get the manifest file path for a backup"""
+        return self.backup_dir / "manifests" / f"{backup_name}.json"
+
+    def _load_manifest(self, backup_name: str) -> Optional[Dict[str, Any]]:
+        """Load a backup manifest, or None if it doesn't exist"""
+        manifest_path = self._manifest_path(backup_name)
+        if not manifest_path.exists():
+            return None
+        return _load_json(manifest_path.read_bytes())
+
+    def _save_manifest(self, manifest: Dict[str, Any]):
+        """Save a backup manifest"""
+        manifest_path = self._manifest_path(manifest["backup_name"])
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        manifest_path.write_bytes(_dump_json(manifest))
+
+    def _get_incremental_base(self) -> Optional[str]:
+        """Get the backup the next scheduled incremental should build on
+
+        Returns None when a new full backup should be taken instead.
+        """
+        manifests_dir = self.backup_dir / "manifests"
+        if not manifests_dir.exists():
+            return None
+
+        max_chain = self.config.get("max_incremental_backups", 6)
+        manifests = sorted(
+            manifests_dir.glob("*.json"),
+            key=lambda p: p.stat().st_mtime,
+            reverse=True,
+        )
 
+        for manifest_file in manifests:
+            manifest = _load_json(manifest_file.read_bytes())
+            if self._find_backup_path(manifest["backup_name"]) is None:
+                continue
+            if manifest.get("chain_length", 0) >= max_chain:
+                return None
+            return manifest["backup_name"]
+
+        return None
+
+    def _find_backup_path(self, backup_name: str) -> Optional[Path]:
+        """Locate a restorable backup by name, encrypted or not"""
+        names = [backup_name]
+        names += [backup_name + s for s in ARCHIVE_SUFFIXES.values()]
+        candidates = names + [name + ".encrypted" for name in names]
+        for backup_dir in ("full_backups", "incremental_backups"):
+            for candidate in candidates:
+                backup_path = self.backup_dir / backup_dir / candidate
+                if backup_path.exists():
+                    return backup_path
+        return None
+
+    @staticmethod
+    def _backup_name_from_path(backup_path: Path) -> str:
+        """Strip archive suffixes from a backup path to get its name"""
+        name = backup_path.name
+        for suffix in (".encrypted", *ARCHIVE_SUFFIXES.values()):
+            if name.endswith(suffix):
+                name = name[: -len(suffix)]
+        return name
+
+    def _fast_copy(self, src: Path, dst: Path):
+        """Copy a file's contents, mode and timestamps (like shutil.copy2)"""
+        src_stat = os.stat(src)
+        cloexec = getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_BINARY", 0)
+
+        src_fd = os.open(src, os.O_RDONLY | cloexec)
+        try:
+            dst_fd = os.open(
+                dst,
+                os.O_WRONLY | os.O_CREAT | os.O_TRUNC | cloexec,
+                src_stat.st_mode & 0o777,
+            )
+            try:
+                _copy_fd(src_fd, dst_fd)
             finally:
-                # Cleanup temporary directory
-                if temp_dir.exists():
-                    shutil.rmtree(temp_dir)
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
 
-        except Exception as e:
-            self.logger.log_error(f"Failed to create full backup: {e}")
-            return False, str(e)
+        os.chmod(dst, src_stat.st_mode & 0o7777)
+        os.utime(dst, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
 
-    def _backup_system_config(self, temp_dir: Path):
-        """Backup system configuration files"""
-        config_dir = temp_dir / "system_config"
-        config_dir.mkdir(parents=True, exist_ok=True)
+    def _iter_backup_items(
+        self, include_user_data: bool, include_logs: bool
+    ) -> Iterator[BackupItem]:
+        """Yield (arcname, source) for every file that goes into a backup"""
+        # Backup system configurations
+        yield from self._backup_system_config()
+
+        # Backup user data if enabled
+        if include_user_data:
+            yield from self._backup_user_data()
+
+        # Backup module configurations
+        yield from self._backup_module_configs()
+
+        # Backup database connections
+        yield from self._backup_database_connections()
+
+        # Backup application settings
+        yield from self._backup_app_settings()
+
+        # Include logs if enabled
+        if include_logs:
+            yield from self._backup_logs()
 
+    @staticmethod
+    def _iter_tree(source_dir: Path, arc_prefix: str) -> Iterator[BackupItem]:
+        """Yield every file under source_dir, named relative to arc_prefix"""
+        for file_path in source_dir.rglob("*"):
+            if file_path.is_file():
+                arcname = f"{arc_prefix}/{file_path.relative_to(source_dir).as_posix()}"
+                yield arcname, file_path
+
+    def _backup_system_config(self) -> Iterator[BackupItem]:
+        """Backup system configuration files"""
         # Backup main configuration files
         config_files = [
             "config/app_settings.json",
@@ -274,41 +891,30 @@ class BackupManager(ModuleBase):
         for config_file in config_files:
             source_path = project_root / config_file
             if source_path.exists():
-                dest_path = config_dir / Path(config_file).name
-                shutil.copy2(source_path, dest_path)
+                yield f"system_config/{source_path.name}", source_path
 
-    def _backup_user_data(self, temp_dir: Path):
+    def _backup_user_data(self) -> Iterator[BackupItem]:
         """Backup user preferences and personal data"""
-        user_dir = temp_dir / "user_data"
-        user_dir.mkdir(parents=True, exist_ok=True)
-
         # Backup user preferences
         prefs_source = project_root / "data" / "user_preferences"
         if prefs_source.exists():
-            prefs_dest = user_dir / "user_preferences"
-            shutil.copytree(prefs_source, prefs_dest)
+            yield from self._iter_tree(prefs_source, "user_data/user_preferences")
 
         # Backup users.json
         users_source = project_root / "data" / "users.json"
         if users_source.exists():
-            shutil.copy2(users_source, user_dir / "users.json")
+            yield "user_data/users.json", users_source
 
-    def _backup_module_configs(self, temp_dir: Path):
+    def _backup_module_configs(self) -> Iterator[BackupItem]:
         """Backup module configuration files"""
-        modules_dir = temp_dir / "module_configs"
-        modules_dir.mkdir(parents=True, exist_ok=True)
-
         # Backup module configs
         configs_source = project_root / "data" / "module_configs"
         if configs_source.exists():
             for config_file in configs_source.glob("*.json"):
-                shutil.copy2(config_file, modules_dir / config_file.name)
+                yield f"module_configs/{config_file.name}", config_file
 
-    def _backup_database_connections(self, temp_dir: Path):
+    def _backup_database_connections(self) -> Iterator[BackupItem]:
         """Backup database connection configurations"""
-        db_dir = temp_dir / "database_connections"
-        db_dir.mkdir(parents=True, exist_ok=True)
-
         # This would backup database connection info from user preferences
         # Note: Passwords should be handled securely
         all_users_prefs = {}
@@ -317,8 +923,7 @@ class BackupManager(ModuleBase):
         if prefs_dir.exists():
             for pref_file in prefs_dir.glob("*.json"):
                 try:
-                    with open(pref_file, "r") as f:
-                        user_prefs = json.load(f)
+                    user_prefs = _load_json(pref_file.read_bytes())
 
                     # Remove sensitive data like passwords for security
                     if "database_connections" in user_prefs:
@@ -333,81 +938,182 @@ class BackupManager(ModuleBase):
                     )
 
         # Save sanitized preferences
-        with open(db_dir / "user_database_configs.json", "w") as f:
-            json.dump(all_users_prefs, f, indent=2)
+        yield (
+            "database_connections/user_database_configs.json",
+            _dump_json(all_users_prefs),
+        )
 
-    def _backup_app_settings(self, temp_dir: Path):
+    def _backup_app_settings(self) -> Iterator[BackupItem]:
         """Backup application-specific settings"""
-        app_dir = temp_dir / "app_settings"
-        app_dir.mkdir(parents=True, exist_ok=True)
-
         # Backup localization files
         locales_source = project_root / "locales"
         if locales_source.exists():
-            locales_dest = app_dir / "locales"
-            shutil.copytree(locales_source, locales_dest)
+            yield from self._iter_tree(locales_source, "app_settings/locales")
 
         # Backup translations
         translations_source = project_root / "translations"
         if translations_source.exists():
-            translations_dest = app_dir / "translations"
-            shutil.copytree(translations_source, translations_dest)
+            yield from self._iter_tree(translations_source, "app_settings/translations")
 
-    def _backup_logs(self, temp_dir: Path):
+    def _backup_logs(self) -> Iterator[BackupItem]:
         """Backup system logs"""
-        logs_dir = temp_dir / "logs"
-        logs_dir.mkdir(parents=True, exist_ok=True)
-
         logs_source = project_root / "logs"
         if logs_source.exists():
             # Only backup recent logs (last 7 days)
-            cutoff_date = datetime.now() - timedelta(days=7)
+            cutoff_ts = (datetime.now() - timedelta(days=7)).timestamp()
 
-            for log_file in logs_source.glob("*.log"):
-                try:
-                    file_time = datetime.fromtimestamp(log_file.stat().st_mtime)
-                    if file_time > cutoff_date:
-                        shutil.copy2(log_file, logs_dir / log_file.name)
-                except Exception as e:
-                    self.logger.log_error(f"Error backing up log file {log_file}: {e}")
+            with os.scandir(logs_source) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".log"):
+                        continue
+                    try:
+                        if (
+                            entry.is_file(follow_symlinks=False)
+                            and entry.stat(follow_symlinks=False).st_mtime > cutoff_ts
+                        ):
+                            yield f"logs/{entry.name}", Path(entry.path)
+                    except OSError as e:
+                        self.logger.log_error(
+                            f"Error backing up log file {entry.path}: {e}"
+                        )
 
     def _create_backup_metadata(
-        self, temp_dir: Path, backup_name: str, auto_generated: bool
-    ):
-        """Create backup metadata file"""
+        self,
+        backup_name: str,
+        auto_generated: bool,
+        parent: Optional[str] = None,
+        cfg: Optional[Dict[str, Any]] = None,
+        deleted: Optional[List[str]] = None,
+    ) -> bytes:
+        """Create backup metadata file contents"""
+        if cfg is None:
+            cfg = self._config
         metadata = {
             "backup_name": backup_name,
             "created_at": datetime.now().isoformat(),
             "auto_generated": auto_generated,
+            "backup_type": "full" if parent is None else "incremental",
+            "parent": parent,
+            "deleted_files": deleted or [],
             "version": "1.0.0",
             "system_info": {
                 "platform": os.name,
                 "python_version": sys.version,
             },
-            "backup_config": self.config.copy(),
+            "backup_config": cfg.copy(),
             "components": {
                 "system_config": True,
-                "user_data": self.config.get("include_user_data", True),
+                "user_data": cfg.get("include_user_data", True),
                 "module_configs": True,
                 "database_connections": True,
                 "app_settings": True,
-                "logs": self.config.get("include_logs", False),
+                "logs": cfg.get("include_logs", False),
             },
         }
 
-        metadata_file = temp_dir / "backup_metadata.json"
-        with open(metadata_file, "w") as f:
-            json.dump(metadata, f, indent=2)
+        return _dump_json(metadata)
+
+    def _create_zip_backup(
+        self, items: List[BackupItem], backup_file: Path, level: int, n_threads: int
+    ):
+        """Create compressed zip backup, deflating files in parallel"""
+        backup_file.parent.mkdir(parents=True, exist_ok=True)
 
-    def _create_zip_backup(self, source_dir: Path, backup_file: Path):
-        """Create compressed zip backup"""
+        generated_time = time.localtime()[:6]
+
+        with zipfile.ZipFile(
+            backup_file,
+            "w",
+            zipfile.ZIP_DEFLATED,
+            compresslevel=level,
+            allowZip64=True,
+        ) as zipf:
+            if not _can_write_precompressed(zipf):
+                # Serial, but ZipFile streams each file through its compressor
+                for arcname, source in items:
+                    if isinstance(source, bytes):
+                        zinfo = zipfile.ZipInfo(arcname, date_time=generated_time)
+                        zinfo.external_attr = 0o100644 << 16
+                        zipf.writestr(zinfo, source, zipfile.ZIP_DEFLATED, level)
+                    else:
+                        zipf.write(source, arcname)
+                return
+
+            # zlib releases the GIL while compressing, so worker threads compress
+            # in parallel while the main thread writes finished entries in order;
+            # the window bounds how many compressed payloads are held in memory
+            with ThreadPoolExecutor(max_workers=n_threads) as executor:
+                results = _ordered_map(
+                    executor,
+                    _deflate_file,
+                    ((source, level) for _, source in items),
+                    window=n_threads * 2,
+                )
+                for (arcname, source), (crc, payload, size, compress_type) in zip(
+                    items, results
+                ):
+                    if isinstance(source, bytes):
+                        zinfo = zipfile.ZipInfo(arcname, date_time=generated_time)
+                        zinfo.external_attr = 0o100644 << 16  # regular file, rw-r--r--
+                    else:
+                        zinfo = zipfile.ZipInfo.from_file(source, arcname)
+                    zinfo.compress_type = compress_type
+                    _write_precompressed(zipf, zinfo, crc, payload, size)
+
+    def _create_zstd_backup(
+        self, items: List[BackupItem], backup_file: Path, level: int, n_threads: int
+    ):
+        """Create a zstd-compressed tar backup using libzstd's worker threads"""
         backup_file.parent.mkdir(parents=True, exist_ok=True)
 
-        with zipfile.ZipFile(backup_file, "w", zipfile.ZIP_DEFLATED) as zipf:
-            for file_path in source_dir.rglob("*"):
-                if file_path.is_file():
-                    arcname = file_path.relative_to(source_dir)
-                    zipf.write(file_path, arcname)
+        compressor = zstandard.ZstdCompressor(level=level, threads=n_threads)
+        generated_time = time.time()
+
+        with open(backup_file, "wb") as raw, compressor.stream_writer(
+            raw, closefd=False
+        ) as writer, tarfile.open(fileobj=writer, mode="w|") as tar:
+            for arcname, source in items:
+                if isinstance(source, bytes):
+                    tarinfo = tarfile.TarInfo(arcname)
+                    tarinfo.size = len(source)
+                    tarinfo.mtime = generated_time
+                    tarinfo.mode = 0o644
+                    tar.addfile(tarinfo, io.BytesIO(source))
+                else:
+                    tar.add(source, arcname=arcname, recursive=False)
+
+    def _extract_zstd_backup(self, backup_file: Path, dest_dir: Path):
+        """Extract a zstd-compressed tar backup"""
+        if not ZSTD_AVAILABLE:
+            raise RuntimeError("zstandard is required to restore .tar.zst backups")
+
+        with open(backup_file, "rb") as raw, zstandard.ZstdDecompressor().stream_reader(
+            raw
+        ) as reader, tarfile.open(fileobj=reader, mode="r|") as tar:
+            if hasattr(tarfile, "data_filter"):
+                tar.extractall(dest_dir, filter="data")
+            else:
+                dest_root = dest_dir.resolve()
+                for member in tar:
+                    target = (dest_root / member.name).resolve()
+                    if not (member.isfile() or member.isdir()) or (
+                        target != dest_root and dest_root not in target.parents
+                    ):
+                        raise ValueError(
+                            f"Unsafe entry in backup archive: {member.name}"
+                        )
+                    tar.extract(member, dest_dir)
+
+    def _write_directory_backup(self, items: List[BackupItem], backup_dir: Path):
+        """Write an uncompressed backup as a plain directory tree"""
+        _ensure_dirs([backup_dir] + [(backup_dir / a).parent for a, _ in items])
+
+        for arcname, source in items:
+            dest_path = backup_dir / arcname
+            if isinstance(source, bytes):
+                dest_path.write_bytes(source)
+            else:
+                self._fast_copy(source, dest_path)
 
     def _encrypt_backup(self, backup_file: Path) -> Path:
         """Encrypt backup file (placeholder implementation)"""
@@ -434,29 +1140,46 @@ class BackupManager(ModuleBase):
             self.logger.log_action_start(f"Restoring backup: {backup_path.name}")
 
             # Create temporary restore directory
-            temp_restore_dir = (
-                self.backup_dir
-                / "temp"
-                / f"restore_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            restore_root = (
+                self.backup_dir / "temp" / f"restore_{backup_path.name}_{timestamp}"
             )
-            temp_restore_dir.mkdir(parents=True, exist_ok=True)
+            restore_root.mkdir(parents=True, exist_ok=True)
+            temp_restore_dir = restore_root
 
             try:
-                # Extract backup
-                if backup_path.suffix == ".zip":
-                    with zipfile.ZipFile(backup_path, "r") as zipf:
-                        zipf.extractall(temp_restore_dir)
+                # Extract backup; encryption is a placeholder that keeps the
+                # archive format, so only the .encrypted suffix is ignored
+                archive_name = backup_path.name
+                if archive_name.endswith(".encrypted"):
+                    archive_name = archive_name[: -len(".encrypted")]
+                if archive_name.endswith(ARCHIVE_SUFFIXES["zip"]):
+                    _extract_zip(backup_path, temp_restore_dir, os.cpu_count() or 1)
+                elif archive_name.endswith(ARCHIVE_SUFFIXES["zstd"]):
+                    self._extract_zstd_backup(backup_path, temp_restore_dir)
                 else:
-                    shutil.copytree(backup_path, temp_restore_dir / "backup_content")
-                    temp_restore_dir = temp_restore_dir / "backup_content"
+                    # Restoring only reads from the backup, so a directory
+                    # backup can be used in place instead of being copied
+                    temp_restore_dir = backup_path
 
                 # Validate backup
                 metadata_file = temp_restore_dir / "backup_metadata.json"
                 if not metadata_file.exists():
                     return False, "Invalid backup: metadata not found"
 
-                with open(metadata_file, "r") as f:
-                    metadata = json.load(f)
+                metadata = _load_json(metadata_file.read_bytes())
+
+                # Incremental backups only hold changed files, so restore the
+                # chain they were built on first and overlay this one on top
+                parent = metadata.get("parent")
+                if parent:
+                    parent_path = self._find_backup_path(parent)
+                    if parent_path is None:
+                        return False, f"Parent backup not found: {parent}"
+
+                    success, message = self.restore_backup(str(parent_path))
+                    if not success:
+                        return False, f"Failed to restore parent {parent}: {message}"
 
                 # Restore components
                 success_count = 0
@@ -466,7 +1189,9 @@ class BackupManager(ModuleBase):
                         success_count += 1
 
                 if (temp_restore_dir / "user_data").exists():
-                    if self._restore_user_data(temp_restore_dir / "user_data"):
+                    if self._restore_user_data(
+                        temp_restore_dir / "user_data", replace=not parent
+                    ):
                         success_count += 1
 
                 if (temp_restore_dir / "module_configs").exists():
@@ -475,6 +1200,9 @@ class BackupManager(ModuleBase):
                     ):
                         success_count += 1
 
+                # Drop files deleted since the parent, which it just restored
+                self._remove_deleted_files(metadata.get("deleted_files", []))
+
                 self.logger.log_action_end(
                     f"Backup restored successfully: {success_count} components"
                 )
@@ -485,41 +1213,120 @@ class BackupManager(ModuleBase):
 
             finally:
                 # Cleanup temporary directory
-                if temp_restore_dir.exists():
-                    shutil.rmtree(temp_restore_dir.parent)
+                if restore_root.exists():
+                    self._discard_temp_dir(restore_root)
 
         except Exception as e:
             self.logger.log_error(f"Failed to restore backup: {e}")
             return False, str(e)
 
+    @property
+    def _trash_dir(self) -> Path:
+        """Directory holding temp directories waiting to be deleted"""
+        return self.backup_dir / "temp" / "trash"
+
+    def _discard_temp_dir(self, temp_dir: Path):
+        """Move a temp directory into the trash and delete it in the background
+
+        The rename is a single syscall, so callers don't wait for the
+        recursive delete.
+        """
+        self._trash_dir.mkdir(parents=True, exist_ok=True)
+        trash_path = self._trash_dir / f"{temp_dir.name}.{uuid.uuid4().hex}"
+        try:
+            os.rename(temp_dir, trash_path)
+        except OSError:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            return
+        self._empty_trash()
+
+    def _empty_trash(self):
+        """Start a background thread deleting the trash, unless one is running"""
+        with self._trash_lock:
+            if self._trash_thread is not None and self._trash_thread.is_alive():
+                return
+            self._trash_thread = threading.Thread(target=self._purge_trash, daemon=True)
+            self._trash_thread.start()
+
+    def _purge_trash(self):
+        """Delete everything in the trash until it stays empty"""
+        while True:
+            with self._trash_lock:
+                entries = (
+                    list(self._trash_dir.iterdir()) if self._trash_dir.exists() else []
+                )
+                if not entries:
+                    self._trash_thread = None
+                    return
+
+            for entry in entries:
+                if entry.is_dir() and not entry.is_symlink():
+                    shutil.rmtree(entry, ignore_errors=True)
+                else:
+                    entry.unlink(missing_ok=True)
+
+    @staticmethod
+    def _restore_target(arcname: str) -> Optional[Path]:
+        """Where restore puts a backed up file, or None if it isn't restored"""
+        section, _, rest = arcname.partition("/")
+        if section == "system_config" and rest.endswith(".json"):
+            return project_root / "config" / rest
+        if section == "user_data":
+            return project_root / "data" / rest
+        if section == "module_configs" and rest.endswith(".json"):
+            return project_root / "data" / "module_configs" / rest
+        return None
+
+    def _remove_deleted_files(self, arcnames: Iterable[str]):
+        """Remove restored files that an incremental backup recorded as deleted"""
+        for arcname in arcnames:
+            target = self._restore_target(arcname)
+            if target is None:
+                continue
+            try:
+                target.unlink(missing_ok=True)
+            except OSError as e:
+                self.logger.log_error(f"Error removing deleted file {target}: {e}")
+
     def _restore_system_config(self, config_dir: Path) -> bool:
         """Restore system configuration files"""
         try:
+            dest_dir = project_root / "config"
+            dest_dir.mkdir(parents=True, exist_ok=True)
+
             for config_file in config_dir.glob("*.json"):
-                dest_path = project_root / "config" / config_file.name
-                dest_path.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(config_file, dest_path)
+                dest_path = dest_dir / config_file.name
+                self._fast_copy(config_file, dest_path)
             return True
         except Exception as e:
             self.logger.log_error(f"Error restoring system config: {e}")
             return False
 
-    def _restore_user_data(self, user_dir: Path) -> bool:
-        """Restore user data"""
+    def _restore_user_data(self, user_dir: Path, replace: bool = True) -> bool:
+        """Restore user data
+
+        With replace=False the backed up preferences are merged into the
+        existing ones, as needed when overlaying an incremental backup.
+        """
         try:
             # Restore user preferences
             prefs_source = user_dir / "user_preferences"
             if prefs_source.exists():
                 prefs_dest = project_root / "data" / "user_preferences"
-                if prefs_dest.exists():
+                if replace and prefs_dest.exists():
                     shutil.rmtree(prefs_dest)
-                shutil.copytree(prefs_source, prefs_dest)
+                shutil.copytree(
+                    prefs_source,
+                    prefs_dest,
+                    copy_function=self._fast_copy,
+                    dirs_exist_ok=True,
+                )
 
             # Restore users.json
             users_source = user_dir / "users.json"
             if users_source.exists():
                 users_dest = project_root / "data" / "users.json"
-                shutil.copy2(users_source, users_dest)
+                self._fast_copy(users_source, users_dest)
 
             return True
         except Exception as e:
@@ -534,61 +1341,74 @@ class BackupManager(ModuleBase):
 
             for config_file in modules_dir.glob("*.json"):
                 dest_path = dest_dir / config_file.name
-                shutil.copy2(config_file, dest_path)
+                self._fast_copy(config_file, dest_path)
 
             return True
         except Exception as e:
             self.logger.log_error(f"Error restoring module configs: {e}")
             return False
 
-    def list_backups(self) -> List[Dict[str, Any]]:
-        """List all available backups"""
-        backups = []
-
+    def list_backups(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """List available backups, newest first, optionally only the first `limit`"""
         backup_dirs = [
             self.backup_dir / "full_backups",
             self.backup_dir / "incremental_backups",
         ]
 
+        # Reuse the previous listing while the backup directories are unchanged
+        cache_key = tuple(
+            (d.stat().st_mtime_ns, sum(1 for _ in d.iterdir()))
+            for d in backup_dirs
+            if d.exists()
+        )
+        cached_key, cached_at, cached_backups = self._list_cache
+        if (
+            cache_key == cached_key
+            and time.monotonic() - cached_at < LIST_CACHE_TTL_SECONDS
+        ):
+            return cached_backups[:limit]
+
+        backup_entries = []
         for backup_dir in backup_dirs:
-            if not backup_dir.exists():
-                continue
+            if backup_dir.exists():
+                with os.scandir(backup_dir) as entries:
+                    backup_entries.extend(
+                        (entry, backup_dir.name == "full_backups") for entry in entries
+                    )
 
-            for backup_file in backup_dir.iterdir():
-                if backup_file.is_file() or backup_file.is_dir():
-                    try:
-                        stat = backup_file.stat()
-                        backups.append(
-                            {
-                                "name": backup_file.name,
-                                "path": str(backup_file),
-                                "size": (
-                                    stat.st_size
-                                    if backup_file.is_file()
-                                    else self._get_dir_size(backup_file)
-                                ),
-                                "created_at": datetime.fromtimestamp(
-                                    stat.st_ctime
-                                ).isoformat(),
-                                "modified_at": datetime.fromtimestamp(
-                                    stat.st_mtime
-                                ).isoformat(),
-                                "type": (
-                                    "full"
-                                    if "full_backups" in str(backup_file)
-                                    else "incremental"
-                                ),
-                                "compressed": backup_file.suffix == ".zip",
-                            }
-                        )
-                    except Exception as e:
-                        self.logger.log_error(
-                            f"Error reading backup info for {backup_file}: {e}"
-                        )
+        # Stat calls and directory size walks are I/O bound, so fan them out
+        with ThreadPoolExecutor(max_workers=BACKUP_IO_WORKERS) as executor:
+            results = executor.map(lambda e: self._get_backup_info(*e), backup_entries)
+            backups = [info for info in results if info is not None]
 
         # Sort by creation time (newest first)
-        backups.sort(key=lambda x: x["created_at"], reverse=True)
-        return backups
+        backups.sort(key=lambda x: x["created_at_epoch"], reverse=True)
+        self._list_cache = (cache_key, time.monotonic(), backups)
+        return backups[:limit]
+
+    def _get_backup_info(
+        self, entry: os.DirEntry, is_full: bool
+    ) -> Optional[Dict[str, Any]]:
+        """Build the listing entry for a single backup from its directory entry"""
+        try:
+            is_file = entry.is_file()
+            if not (is_file or entry.is_dir()):
+                return None
+
+            stat = entry.stat()
+            return {
+                "name": entry.name,
+                "path": entry.path,
+                "size": stat.st_size if is_file else self._get_dir_size(entry.path),
+                "created_at": datetime.fromtimestamp(stat.st_ctime).isoformat(),
+                "created_at_epoch": stat.st_ctime,
+                "modified_at": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+                "type": "full" if is_full else "incremental",
+                "compressed": entry.name.endswith(tuple(ARCHIVE_SUFFIXES.values())),
+            }
+        except Exception as e:
+            self.logger.log_error(f"Error reading backup info for {entry.path}: {e}")
+            return None
 
     def delete_backup(self, backup_path: str) -> Tuple[bool, str]:
         """Delete a backup file"""
@@ -601,6 +1421,13 @@ class BackupManager(ModuleBase):
                 backup_file.unlink()
             else:
                 shutil.rmtree(backup_file)
+            self._list_cache = (None, 0.0, None)
+
+            manifest_path = self._manifest_path(
+                self._backup_name_from_path(backup_file)
+            )
+            if manifest_path.exists():
+                manifest_path.unlink()
 
             self.logger.log_action_end(f"Backup deleted: {backup_file.name}")
             return True, "Backup deleted successfully"
@@ -613,63 +1440,113 @@ class BackupManager(ModuleBase):
         """Clean up old backups based on retention policy"""
         try:
             retention_days = self.config.get("retention_days", 30)
-            cutoff_date = datetime.now() - timedelta(days=retention_days)
-
-            for backup_info in self.list_backups():
-                backup_date = datetime.fromisoformat(backup_info["created_at"])
-                if backup_date < cutoff_date:
-                    self.delete_backup(backup_info["path"])
-                    self.logger.log_action_end(
-                        f"Old backup cleaned up: {backup_info['name']}"
-                    )
+            cutoff_ts = (datetime.now() - timedelta(days=retention_days)).timestamp()
+
+            backups = self.list_backups()
+            stale_backups = [
+                backup_info
+                for backup_info in backups
+                if backup_info["created_at_epoch"] < cutoff_ts
+            ]
+
+            # Keep stale backups that newer incremental backups still build on
+            required = self._get_required_parents(
+                self._backup_name_from_path(Path(b["path"]))
+                for b in backups
+                if b not in stale_backups
+            )
+            stale_backups = [
+                b
+                for b in stale_backups
+                if self._backup_name_from_path(Path(b["path"])) not in required
+            ]
+
+            with ThreadPoolExecutor(max_workers=BACKUP_IO_WORKERS) as executor:
+                results = executor.map(
+                    self.delete_backup, [b["path"] for b in stale_backups]
+                )
+                for backup_info, (success, _) in zip(stale_backups, results):
+                    if success:
+                        self.logger.log_action_end(
+                            f"Old backup cleaned up: {backup_info['name']}"
+                        )
 
         except Exception as e:
             self.logger.log_error(f"Error cleaning up old backups: {e}")
 
+    def _get_required_parents(self, backup_names: Iterable[str]) -> Set[str]:
+        """Get every backup that the given backups depend on for restore"""
+        required = set()
+        for backup_name in backup_names:
+            manifest = self._load_manifest(backup_name)
+            while manifest and manifest.get("parent"):
+                parent = manifest["parent"]
+                if parent in required:
+                    break
+                required.add(parent)
+                manifest = self._load_manifest(parent)
+        return required
+
     def _get_backup_count(self) -> int:
         """Get total number of backups"""
         return len(self.list_backups())
 
     def _get_last_backup_time(self) -> Optional[str]:
         """Get timestamp of last backup"""
-        backups = self.list_backups()
+        backups = self.list_backups(limit=1)
         return backups[0]["created_at"] if backups else None
 
     def _get_next_backup_time(self) -> Optional[str]:
         """Get timestamp of next scheduled backup"""
-        frequency = self.config.get("backup_frequency", "daily")
-        if frequency == "manual":
-            return None
+        if self._scheduler_running and self._next_backup_at:
+            return self._next_backup_at.isoformat()
 
-        # This is a simplified implementation
-        # In reality, you'd check the actual schedule
-        if frequency == "hourly":
-            next_backup = datetime.now() + timedelta(hours=1)
-        elif frequency == "daily":
-            next_backup = datetime.now().replace(
-                hour=2, minute=0, second=0
-            ) + timedelta(days=1)
-        elif frequency == "weekly":
-            next_backup = datetime.now() + timedelta(weeks=1)
-        else:
-            return None
+        next_backup = self._compute_next_backup(
+            self.config.get("backup_frequency", "daily")
+        )
+        return next_backup.isoformat() if next_backup else None
 
-        return next_backup.isoformat()
+    def _get_dir_size(self, path: Union[str, Path]) -> int:
+        """Get total size of directory
+
+        Backup directories are written once and then left alone, so sizes are
+        cached against the directory's identity and modification time.
+        """
+        try:
+            root_stat = os.stat(path)
+        except OSError:
+            return 0
+        key = (root_stat.st_dev, root_stat.st_ino, root_stat.st_mtime_ns)
+        with self._dir_size_lock:
+            if key in self._dir_size_cache:
+                self._dir_size_cache.move_to_end(key)
+                return self._dir_size_cache[key]
 
-    def _get_dir_size(self, path: Path) -> int:
-        """Get total size of directory"""
         total_size = 0
-        for file_path in path.rglob("*"):
-            if file_path.is_file():
-                try:
-                    total_size += file_path.stat().st_size
-                except (OSError, FileNotFoundError):
-                    pass
+        stack = [str(path)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                            elif entry.is_file(follow_symlinks=False):
+                                total_size += entry.stat(follow_symlinks=False).st_size
+                        except OSError:
+                            pass
+            except OSError:
+                pass
+
+        with self._dir_size_lock:
+            self._dir_size_cache[key] = total_size
+            if len(self._dir_size_cache) > DIR_SIZE_CACHE_SIZE:
+                self._dir_size_cache.popitem(last=False)
         return total_size
 
     def export_configuration(self) -> str:
         """Export backup configuration as JSON"""
-        return json.dumps(
+        return _dump_json(
             {
                 "module": "backup_manager",
                 "version": "1.0.0",
@@ -679,6 +1556,5 @@ class BackupManager(ModuleBase):
                     "last_backup": self._get_last_backup_time(),
                     "backup_location": str(self.backup_dir),
                 },
-            },
-            indent=2,
-        )
+            }
+        ).decode("utf-8")
@@ -3,66 +3,203 @@ Backup Module UI Components
 Streamlit interface for backup management functionality.
 """
 
-import json
+import io
+import math
+import os
+import stat
 import sys
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional
 
+import numpy as np
+import pandas as pd
 import streamlit as st
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
-sys.path.append(str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.append(str(project_root))
 
 from utils.logging_system import RedshiftLogger
 
-from modules.backup.backup_manager import BackupManager
+from modules.backup.backup_manager import BackupManager, _dump_json, _load_json
 
 # Auth decorators disabled for open access mode
 
 logger = RedshiftLogger()
 
+MODULE_CONFIG_PATH = project_root / "data" / "module_configs" / "backup_module.json"
+
+SIZE_NAMES = ["B", "KB", "MB", "GB", "TB"]
+
+# Automatic backup frequencies, in the order the settings form lists them
+FREQUENCY_OPTIONS = ("manual", "hourly", "daily", "weekly")
+FREQUENCY_INDEX = {value: i for i, value in enumerate(FREQUENCY_OPTIONS)}
+
+# Archive formats offered when compression is enabled
+COMPRESSION_OPTIONS = ("zip", "zstd")
+COMPRESSION_INDEX = {value: i for i, value in enumerate(COMPRESSION_OPTIONS)}
+
+# Backups shown per page of the manage table
+BACKUPS_PAGE_SIZE = 50
+
+# Static page chrome, each sent as a single markdown element
+_PANEL_HEADER_MD = """### 💾 System Backup Manager
+Manage system backups, restore configurations, and schedule automatic backups.
+
+---"""
+_BULK_OPERATIONS_MD = """---
+##### Bulk Operations"""
+_EXPORT_IMPORT_MD = """---
+##### 📤 Export/Import Settings"""
+
+
+def _format_timestamps(epochs: Iterable[float], fmt: str) -> List[str]:
+    """Format epoch timestamps in local time without building datetime objects"""
+    return [time.strftime(fmt, time.localtime(epoch)) for epoch in epochs]
+
+
+def _format_sizes(sizes: np.ndarray) -> np.ndarray:
+    """Format an array of byte counts in human readable form, e.g. 1.5 MB"""
+    sizes = np.asarray(sizes, dtype=np.float64)
+    unit = np.clip(
+        np.floor(np.log2(np.maximum(sizes, 1)) / 10), 0, len(SIZE_NAMES) - 1
+    ).astype(np.int64)
+    values = np.round(sizes / np.power(1024.0, unit), 2)
+    labels = np.char.add(
+        np.char.add(values.astype(str), " "), np.array(SIZE_NAMES)[unit]
+    )
+    return np.where(sizes == 0, "0 B", labels)
+
+
+@st.cache_resource
+def _get_backup_manager() -> BackupManager:
+    """Shared backup manager, created and initialized once per server process"""
+    manager = BackupManager()
+    manager.initialize()
+    return manager
+
+
+# Serializes read-modify-write of the module config file across sessions
+_MODULE_CONFIG_LOCK = threading.Lock()
+
+
+def _read_module_config() -> Dict[str, Any]:
+    """Parse the backup module config file as it is on disk now
+
+    Read on every save, so restores and manual edits are never overwritten.
+    """
+    if MODULE_CONFIG_PATH.exists():
+        return _load_json(MODULE_CONFIG_PATH.read_bytes())
+    return {"enabled": True, "auto_start": True, "priority": 3}
+
+
+@st.cache_data(ttl=5)
+def _cached_snapshot(_manager: BackupManager) -> Dict[str, Any]:
+    """Backup listing, module info and config, read once and shared by the tabs
+
+    Backup operations clear this so the next render sees their result.
+    """
+    return {
+        "backups": _manager.list_backups(),
+        "info": _manager.get_info(),
+        "config": dict(_manager.config),
+    }
+
+
+# Project directories a restore writes to, and ones the app needs to run
+WRITABLE_DIRS = ("data", "config", "logs")
+REQUIRED_DIRS = ("data", "config", "utils")
+
+
+def _probe_paths(paths: Iterable[Path]) -> Dict[Path, Optional[bool]]:
+    """Stat each path once: None if it is missing, else whether we can write it"""
+    euid = os.geteuid() if hasattr(os, "geteuid") else None
+    probes = {}
+    for path in paths:
+        try:
+            path_stat = os.stat(path)
+        except FileNotFoundError:
+            probes[path] = None
+            continue
+        except OSError:
+            probes[path] = False
+            continue
+
+        if path_stat.st_uid == euid:
+            probes[path] = bool(path_stat.st_mode & stat.S_IWUSR)
+        else:
+            probes[path] = os.access(path, os.W_OK)
+    return probes
+
+
+def _path_health(backup_location: str) -> Dict[str, bool]:
+    """Check storage, permissions and components from a single probe pass"""
+    backup_dir = Path(backup_location)
+    try:
+        if not backup_dir.is_dir():
+            backup_dir.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        pass
+
+    writable_dirs = [project_root / name for name in WRITABLE_DIRS]
+    required_dirs = [project_root / name for name in REQUIRED_DIRS]
+    probes = _probe_paths({backup_dir, *writable_dirs, *required_dirs})
+
+    return {
+        "storage": bool(probes[backup_dir]),
+        "permissions": all(probes[d] is not False for d in writable_dirs),
+        "components": all(probes[d] is not None for d in required_dirs),
+    }
+
+
+@st.cache_data(ttl=10)
+def _cached_path_health(backup_location: str) -> Dict[str, bool]:
+    """Path health checks, reused across quick reruns"""
+    return _path_health(backup_location)
+
 
 class BackupPanel:
     """Main backup management panel"""
 
-    def __init__(self):
-        self.backup_manager = BackupManager()
-        self.backup_manager.initialize()
+    # Directories already created by this process
+    _created_dirs = set()
 
     def render(self):
         """Render the main backup panel"""
-        st.subheader("💾 System Backup Manager")
-        st.markdown(
-            "Manage system backups, restore configurations, and schedule automatic backups."
-        )
-        st.markdown("---")
+        st.markdown(_PANEL_HEADER_MD)
+
+        snapshot = _cached_snapshot(_get_backup_manager())
+        cfg = MappingProxyType(snapshot["config"])
 
         # Create tabs for different backup operations
         tab1, tab2, tab3, tab4 = st.tabs(
             ["📊 Overview", "💾 Create Backup", "📋 Manage Backups", "⚖️ Settings"]
         )
 
-        with tab1:
-            self._render_overview()
+        with tab1, st.container():
+            self._render_overview(snapshot)
 
-        with tab2:
-            self._render_create_backup()
+        with tab2, st.container():
+            self._render_create_backup(cfg)
 
-        with tab3:
-            self._render_manage_backups()
+        with tab3, st.container():
+            self._render_manage_backups(snapshot)
 
-        with tab4:
-            self._render_settings()
+        with tab4, st.container():
+            self._render_settings(cfg)
 
-    def _render_overview(self):
+    def _render_overview(self, snapshot: Dict[str, Any]):
         """Render backup overview dashboard"""
         st.markdown("#### 📊 Backup System Status")
 
         # Get backup statistics
-        backups = self.backup_manager.list_backups()
-        info = self.backup_manager.get_info()
+        backups = snapshot["backups"]
+        info = snapshot["info"]
 
         # Status metrics
         col1, col2, col3, col4 = st.columns(4)
@@ -99,21 +236,19 @@ class BackupPanel:
         if backups:
             st.markdown("#### 📋 Recent Backups")
 
-            recent_backups = backups[:5]  # Show last 5 backups
-
-            backup_data = []
-            for backup in recent_backups:
-                backup_data.append(
-                    {
-                        "Name": backup["name"],
-                        "Type": backup["type"].title(),
-                        "Size": self._format_size(backup["size"]),
-                        "Created": datetime.fromisoformat(
-                            backup["created_at"]
-                        ).strftime("%Y-%m-%d %H:%M"),
-                        "Compressed": "✅" if backup.get("compressed", False) else "❌",
-                    }
-                )
+            recent_backups = pd.DataFrame(backups[:5])  # Show last 5 backups
+
+            backup_data = pd.DataFrame(
+                {
+                    "Name": recent_backups["name"],
+                    "Type": recent_backups["type"].str.title(),
+                    "Size": _format_sizes(recent_backups["size"].to_numpy()),
+                    "Created": _format_timestamps(
+                        recent_backups["created_at_epoch"], "%Y-%m-%d %H:%M"
+                    ),
+                    "Compressed": np.where(recent_backups["compressed"], "✅", "❌"),
+                }
+            )
 
             st.dataframe(backup_data, use_container_width=True)
         else:
@@ -123,9 +258,9 @@ class BackupPanel:
 
         # System health check
         st.markdown("#### 🏥 System Health")
-        self._render_system_health()
+        self._render_system_health(snapshot)
 
-    def _render_create_backup(self):
+    def _render_create_backup(self, cfg: Mapping[str, Any]):
         """Render backup creation interface"""
         current_user = get_current_user()
 
@@ -147,12 +282,14 @@ class BackupPanel:
                 "Backup Name (optional)",
                 placeholder="Leave empty for auto-generated name",
                 help="Custom name for this backup",
+                key="create_backup_name",
             )
 
             backup_type = st.selectbox(
                 "Backup Type",
                 options=["Full Backup", "Configuration Only", "User Data Only"],
                 help="Select what to include in the backup",
+                key="create_backup_type",
             )
 
         with col2:
@@ -160,12 +297,14 @@ class BackupPanel:
                 "Compress Backup",
                 value=True,
                 help="Compress backup to save storage space",
+                key="create_backup_compress",
             )
 
             include_logs = st.checkbox(
                 "Include Recent Logs",
                 value=False,
                 help="Include system logs from the last 7 days",
+                key="create_backup_include_logs",
             )
 
         # Advanced options
@@ -174,6 +313,7 @@ class BackupPanel:
                 "Encrypt Backup",
                 value=False,
                 help="Encrypt backup for security (requires decryption key for restore)",
+                key="create_backup_encrypt",
             )
 
             if encrypt_backup:
@@ -185,6 +325,7 @@ class BackupPanel:
                 "Custom Backup Location",
                 placeholder="Leave empty to use default location",
                 help="Custom directory to store this backup",
+                key="create_backup_location",
             )
 
         # Create backup button
@@ -207,18 +348,18 @@ class BackupPanel:
         with col2:
             if st.button("🧪 Test Backup", use_container_width=True):
                 with st.spinner("Testing backup configuration..."):
-                    self._test_backup_configuration()
+                    self._test_backup_configuration(cfg)
 
         with col3:
             st.markdown(
                 "*Backup creation may take several minutes depending on data size*"
             )
 
-    def _render_manage_backups(self):
+    def _render_manage_backups(self, snapshot: Dict[str, Any]):
         """Render backup management interface"""
         st.markdown("#### 📋 Manage Existing Backups")
 
-        backups = self.backup_manager.list_backups()
+        backups = snapshot["backups"]
 
         if not backups:
             st.info("🔍 No backups found. Create your first backup to see it here.")
@@ -227,51 +368,75 @@ class BackupPanel:
         # Backup management table
         st.markdown("##### Available Backups")
 
-        # Add selection column
-        selected_backups = []
-
-        for i, backup in enumerate(backups):
-            col1, col2, col3, col4, col5, col6 = st.columns([0.5, 2, 1, 1, 1, 1.5])
-
-            with col1:
-                select = st.checkbox("", key=f"select_{i}")
-                if select:
-                    selected_backups.append(backup)
+        # Only the current page of backups is sent to the browser
+        page_count = math.ceil(len(backups) / BACKUPS_PAGE_SIZE)
+        page = 1
+        if page_count > 1:
+            page = st.number_input(
+                f"Page (of {page_count})",
+                min_value=1,
+                max_value=page_count,
+                value=1,
+                key="backup_table_page",
+            )
+        backups = backups[(page - 1) * BACKUPS_PAGE_SIZE : page * BACKUPS_PAGE_SIZE]
+
+        # One table widget for the page, with a checkbox column for selection
+        df = pd.DataFrame(backups)
+        table = pd.DataFrame(
+            {
+                "Select": False,
+                "Name": df["name"],
+                "Type": df["type"].str.title(),
+                "Size": _format_sizes(df["size"].to_numpy()),
+                "Created": _format_timestamps(
+                    df["created_at_epoch"], "%m/%d/%Y %H:%M:%S"
+                ),
+                "Format": df["compressed"].map(
+                    {True: "📦 Compressed", False: "📁 Folder"}
+                ),
+            }
+        )
+        edited = st.data_editor(
+            table,
+            column_config={"Select": st.column_config.CheckboxColumn("Select")},
+            disabled=["Name", "Type", "Size", "Created", "Format"],
+            hide_index=True,
+            use_container_width=True,
+            key=f"backup_table_{page}",
+        )
+        selected_backups = [backups[i] for i in edited.index[edited["Select"]]]
 
-            with col2:
-                st.markdown(f"**{backup['name']}**")
-                st.caption(f"Type: {backup['type'].title()}")
+        # Individual backup actions: one target, one action, one button
+        col1, col2, col3 = st.columns([2, 1, 1])
 
-            with col3:
-                st.markdown(self._format_size(backup["size"]))
+        with col1:
+            target_name = st.selectbox(
+                "Backup",
+                options=[backup["name"] for backup in backups],
+                key="backup_action_target",
+                label_visibility="collapsed",
+            )
+            target = next(b for b in backups if b["name"] == target_name)
 
-            with col4:
-                created_dt = datetime.fromisoformat(backup["created_at"])
-                st.markdown(created_dt.strftime("%m/%d/%Y"))
-                st.caption(created_dt.strftime("%H:%M:%S"))
+        with col2:
+            action = st.selectbox(
+                "Action",
+                options=["🔄 Restore", "🗑️ Delete"],
+                key="backup_action",
+                label_visibility="collapsed",
+            )
 
-            with col5:
-                if backup.get("compressed", False):
-                    st.success("✅ ZIP")
+        with col3:
+            if st.button("Apply", key="backup_action_apply", use_container_width=True):
+                if action == "🔄 Restore":
+                    self._restore_backup(target)
                 else:
-                    st.info("📁 Folder")
-
-            with col6:
-                # Individual backup actions
-                col_restore, col_delete = st.columns(2)
-
-                with col_restore:
-                    if st.button("🔄", key=f"restore_{i}", help="Restore this backup"):
-                        self._restore_backup(backup)
-
-                with col_delete:
-                    if st.button("🗑️", key=f"delete_{i}", help="Delete this backup"):
-                        self._delete_backup(backup)
+                    self._delete_backup(target)
 
         # Bulk operations
         if selected_backups:
-            st.markdown("---")
-            st.markdown("##### Bulk Operations")
+            st.markdown(_BULK_OPERATIONS_MD)
 
             col1, col2, col3 = st.columns(3)
 
@@ -292,7 +457,7 @@ class BackupPanel:
                     else:
                         st.warning("Please select exactly 2 backups to compare")
 
-    def _render_settings(self):
+    def _render_settings(self, cfg: Mapping[str, Any]):
         """Render backup settings interface"""
         current_user = get_current_user()
 
@@ -304,7 +469,7 @@ class BackupPanel:
         st.markdown("#### ⚙️ Backup Settings")
 
         # Load current configuration
-        current_config = self.backup_manager.config
+        current_config = cfg
 
         with st.form("backup_settings_form"):
             col1, col2 = st.columns(2)
@@ -314,9 +479,10 @@ class BackupPanel:
 
                 backup_frequency = st.selectbox(
                     "Automatic Backup Frequency",
-                    options=["manual", "hourly", "daily", "weekly"],
-                    index=["manual", "hourly", "daily", "weekly"].index(
-                        current_config.get("backup_frequency", "daily")
+                    options=FREQUENCY_OPTIONS,
+                    index=FREQUENCY_INDEX.get(
+                        current_config.get("backup_frequency", "daily"),
+                        FREQUENCY_INDEX["daily"],
                     ),
                     help="How often to create automatic backups",
                 )
@@ -343,6 +509,16 @@ class BackupPanel:
                     help="Automatically compress backup files",
                 )
 
+                compression = st.selectbox(
+                    "Compression Format",
+                    options=COMPRESSION_OPTIONS,
+                    index=COMPRESSION_INDEX.get(
+                        current_config.get("compression", "zip"),
+                        COMPRESSION_INDEX["zip"],
+                    ),
+                    help="zstd is faster and smaller but needs the zstandard package",
+                )
+
             with col2:
                 st.markdown("##### 📋 Content")
 
@@ -383,6 +559,7 @@ class BackupPanel:
                         "retention_days": retention_days,
                         "backup_location": backup_location,
                         "compress_backups": compress_backups,
+                        "compression": compression,
                         "include_user_data": include_user_data,
                         "include_logs": include_logs,
                         "encrypt_backups": encrypt_backups,
@@ -403,14 +580,13 @@ class BackupPanel:
                         st.error("❌ Failed to reset settings")
 
         # Export/Import settings
-        st.markdown("---")
-        st.markdown("##### 📤 Export/Import Settings")
+        st.markdown(_EXPORT_IMPORT_MD)
 
         col1, col2 = st.columns(2)
 
         with col1:
             if st.button("📤 Export Settings", use_container_width=True):
-                config_json = self.backup_manager.export_configuration()
+                config_json = _get_backup_manager().export_configuration()
                 st.download_button(
                     "💾 Download Configuration",
                     data=config_json,
@@ -423,11 +599,12 @@ class BackupPanel:
                 "📤 Import Settings",
                 type=["json"],
                 help="Upload a backup configuration file",
+                key="import_backup_settings",
             )
 
             if uploaded_file:
                 try:
-                    config_data = json.loads(uploaded_file.read())
+                    config_data = _load_json(uploaded_file.read())
                     if self._import_backup_settings(config_data):
                         st.success("✅ Settings imported successfully!")
                         st.rerun()
@@ -436,9 +613,9 @@ class BackupPanel:
                 except Exception as e:
                     st.error(f"❌ Invalid configuration file: {e}")
 
-    def _render_system_health(self):
+    def _render_system_health(self, snapshot: Dict[str, Any]):
         """Render system health information"""
-        health_data = self._get_system_health()
+        health_data = self._get_system_health(snapshot)
 
         col1, col2, col3 = st.columns(3)
 
@@ -468,48 +645,44 @@ class BackupPanel:
     ):
         """Create backup with specified options"""
         try:
-            # Update temporary config for this backup
-            temp_config = self.backup_manager.config.copy()
-            temp_config["compress_backups"] = compress
-            temp_config["include_logs"] = include_logs
-            temp_config["encrypt_backups"] = encrypt
+            # Options for this backup only; the shared config is left untouched
+            overrides = {
+                "compress_backups": compress,
+                "include_logs": include_logs,
+                "encrypt_backups": encrypt,
+            }
+            if not compress:
+                overrides["compression"] = "none"
 
             if location:
-                temp_config["backup_location"] = location
-
-            # Temporarily update config
-            original_config = self.backup_manager.config
-            self.backup_manager.config = temp_config
+                overrides["backup_location"] = location
 
-            try:
-                success, result = self.backup_manager.create_full_backup(
-                    backup_name=name if name else None
-                )
-
-                if success:
-                    st.success(f"✅ Backup created successfully!")
-                    st.info(f"📁 Backup location: {result}")
-                    logger.log_action_end(f"Manual backup created: {result}")
-                else:
-                    st.error(f"❌ Backup failed: {result}")
+            success, result = _get_backup_manager().create_full_backup(
+                backup_name=name if name else None, overrides=overrides
+            )
+            _cached_snapshot.clear()
 
-            finally:
-                # Restore original config
-                self.backup_manager.config = original_config
+            if success:
+                st.success(f"✅ Backup created successfully!")
+                st.info(f"📁 Backup location: {result}")
+                logger.log_action_end(f"Manual backup created: {result}")
+            else:
+                st.error(f"❌ Backup failed: {result}")
 
         except Exception as e:
             st.error(f"❌ Error creating backup: {e}")
             logger.log_error(f"Backup creation error: {e}")
 
-    def _test_backup_configuration(self):
+    def _test_backup_configuration(self, cfg: Mapping[str, Any]):
         """Test backup configuration without creating actual backup"""
         try:
             # Perform validation checks
+            path_health = _path_health(cfg.get("backup_location", "./backup"))
             checks = [
-                ("Storage location accessible", self._check_storage_access()),
-                ("Permissions valid", self._check_permissions()),
-                ("Required components available", self._check_components()),
-                ("Configuration valid", self._check_configuration()),
+                ("Storage location accessible", path_health["storage"]),
+                ("Permissions valid", path_health["permissions"]),
+                ("Required components available", path_health["components"]),
+                ("Configuration valid", self._check_configuration(cfg)),
             ]
 
             all_passed = True
@@ -533,9 +706,10 @@ class BackupPanel:
         """Restore a specific backup"""
         if st.session_state.get(f'confirm_restore_{backup_info["name"]}'):
             with st.spinner(f"Restoring backup: {backup_info['name']}..."):
-                success, message = self.backup_manager.restore_backup(
+                success, message = _get_backup_manager().restore_backup(
                     backup_info["path"]
                 )
+                _cached_snapshot.clear()
 
                 if success:
                     st.success(f"✅ {message}")
@@ -555,7 +729,8 @@ class BackupPanel:
     def _delete_backup(self, backup_info):
         """Delete a specific backup"""
         if st.session_state.get(f'confirm_delete_{backup_info["name"]}'):
-            success, message = self.backup_manager.delete_backup(backup_info["path"])
+            success, message = _get_backup_manager().delete_backup(backup_info["path"])
+            _cached_snapshot.clear()
 
             if success:
                 st.success(f"✅ {message}")
@@ -578,9 +753,10 @@ class BackupPanel:
             deleted_count = 0
 
             for backup in selected_backups:
-                success, _ = self.backup_manager.delete_backup(backup["path"])
+                success, _ = _get_backup_manager().delete_backup(backup["path"])
                 if success:
                     deleted_count += 1
+            _cached_snapshot.clear()
 
             st.success(f"✅ Deleted {deleted_count}/{len(selected_backups)} backups")
             logger.log_action_end(f"Bulk delete: {deleted_count} backups")
@@ -594,17 +770,26 @@ class BackupPanel:
             )
 
     def _export_selected_backups(self, selected_backups):
-        """Export selected backups information"""
-        export_data = {
+        """Export selected backups information as newline-delimited JSON
+
+        The first line holds the export header, then one backup per line, so
+        each record is serialized straight into the buffer.
+        """
+        buffer = io.BytesIO()
+        header = {
             "export_timestamp": datetime.now().isoformat(),
-            "backups": selected_backups,
+            "backup_count": len(selected_backups),
         }
+        for record in (header, *selected_backups):
+            buffer.write(_dump_json(record, indent=False))
+            buffer.write(b"\n")
+        buffer.seek(0)
 
         st.download_button(
             "💾 Download Backup List",
-            data=json.dumps(export_data, indent=2),
-            file_name=f"backup_list_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-            mime="application/json",
+            data=buffer,
+            file_name=f"backup_list_{datetime.now().strftime('%Y%m%d_%H%M%S')}.ndjson",
+            mime="application/x-ndjson",
         )
 
     def _compare_backups(self, backups):
@@ -614,53 +799,42 @@ class BackupPanel:
 
         st.markdown("##### 📊 Backup Comparison")
 
-        backup1, backup2 = backups
+        df = pd.DataFrame(backups)
+        rows = pd.DataFrame(
+            {
+                "Name": df["name"],
+                "Type": df["type"].str.title(),
+                "Size": _format_sizes(df["size"].to_numpy()),
+                "Created": _format_timestamps(df["created_at_epoch"], "%Y-%m-%d %H:%M"),
+                "Compressed": np.where(df["compressed"], "Yes", "No"),
+            }
+        )
 
-        comparison_data = {
-            "Attribute": ["Name", "Type", "Size", "Created", "Compressed"],
-            "Backup 1": [
-                backup1["name"],
-                backup1["type"].title(),
-                self._format_size(backup1["size"]),
-                datetime.fromisoformat(backup1["created_at"]).strftime(
-                    "%Y-%m-%d %H:%M"
-                ),
-                "Yes" if backup1.get("compressed", False) else "No",
-            ],
-            "Backup 2": [
-                backup2["name"],
-                backup2["type"].title(),
-                self._format_size(backup2["size"]),
-                datetime.fromisoformat(backup2["created_at"]).strftime(
-                    "%Y-%m-%d %H:%M"
-                ),
-                "Yes" if backup2.get("compressed", False) else "No",
-            ],
-        }
+        comparison_data = rows.T.reset_index()
+        comparison_data.columns = ["Attribute", "Backup 1", "Backup 2"]
 
         st.dataframe(comparison_data, use_container_width=True)
 
     def _save_backup_settings(self, new_config):
         """Save backup settings"""
         try:
-            config_path = (
-                project_root / "data" / "module_configs" / "backup_module.json"
-            )
-
-            if config_path.exists():
-                with open(config_path, "r") as f:
-                    full_config = json.load(f)
-            else:
-                full_config = {"enabled": True, "auto_start": True, "priority": 3}
-
-            full_config["custom"] = new_config
-            full_config["last_modified"] = datetime.now().isoformat()
-
-            with open(config_path, "w") as f:
-                json.dump(full_config, f, indent=2)
+            with _MODULE_CONFIG_LOCK:
+                full_config = _read_module_config()
+                full_config["custom"] = new_config
+                full_config["last_modified"] = datetime.now().isoformat()
+
+                # Write a sibling temp file and rename it over the config, so a
+                # crash mid-write never leaves a truncated config behind
+                if MODULE_CONFIG_PATH.parent not in self._created_dirs:
+                    MODULE_CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
+                    self._created_dirs.add(MODULE_CONFIG_PATH.parent)
+                tmp_path = MODULE_CONFIG_PATH.with_suffix(".json.tmp")
+                tmp_path.write_bytes(_dump_json(full_config))
+                os.replace(tmp_path, MODULE_CONFIG_PATH)
 
             # Update backup manager config
-            self.backup_manager.config = new_config
+            _get_backup_manager().config = new_config
+            _cached_snapshot.clear()
 
             logger.log_action_end("Backup settings updated")
             return True
@@ -675,6 +849,7 @@ class BackupPanel:
             "backup_frequency": "daily",
             "backup_location": "./backup",
             "compress_backups": True,
+            "compression": "zip",
             "retention_days": 30,
             "include_user_data": True,
             "include_logs": False,
@@ -694,110 +869,43 @@ class BackupPanel:
             logger.log_error(f"Error importing backup settings: {e}")
             return False
 
-    def _get_system_health(self):
+    def _get_system_health(self, snapshot: Dict[str, Any]):
         """Get system health information"""
+        path_health = _cached_path_health(
+            snapshot["config"].get("backup_location", "./backup")
+        )
+
         return {
-            "storage_status": "healthy" if self._check_storage_access() else "warning",
-            "permissions_status": "healthy" if self._check_permissions() else "error",
+            "storage_status": "healthy" if path_health["storage"] else "warning",
+            "permissions_status": (
+                "healthy" if path_health["permissions"] else "error"
+            ),
             "scheduler_status": (
-                "running" if self.backup_manager._scheduler_running else "stopped"
+                "running" if snapshot["info"].get("status") == "active" else "stopped"
             ),
         }
 
-    def _check_storage_access(self):
-        """Check if backup storage location is accessible"""
-        try:
-            backup_dir = Path(
-                self.backup_manager.config.get("backup_location", "./backup")
-            )
-            backup_dir.mkdir(parents=True, exist_ok=True)
-
-            # Try to create a test file
-            test_file = backup_dir / ".test_access"
-            test_file.write_text("test")
-            test_file.unlink()
-
-            return True
-        except Exception:
-            return False
-
-    def _check_permissions(self):
-        """Check if we have required permissions"""
-        try:
-            # Check read/write permissions on key directories
-            test_dirs = [
-                project_root / "data",
-                project_root / "config",
-                project_root / "logs",
-            ]
-
-            for test_dir in test_dirs:
-                if test_dir.exists():
-                    # Try to create a test file
-                    test_file = test_dir / ".permission_test"
-                    test_file.write_text("test")
-                    test_file.unlink()
-
-            return True
-        except Exception:
-            return False
-
-    def _check_components(self):
-        """Check if required components are available"""
-        try:
-            # Check if key directories exist
-            required_dirs = [
-                project_root / "data",
-                project_root / "config",
-                project_root / "utils",
-            ]
-
-            return all(dir_path.exists() for dir_path in required_dirs)
-        except Exception:
-            return False
-
-    def _check_configuration(self):
+    @staticmethod
+    def _check_configuration(cfg: Mapping[str, Any]) -> bool:
         """Check if configuration is valid"""
         try:
-            config = self.backup_manager.config
+            config = cfg
 
             # Basic validation
             if not isinstance(config.get("retention_days"), int):
                 return False
 
-            if config.get("backup_frequency") not in [
-                "manual",
-                "hourly",
-                "daily",
-                "weekly",
-            ]:
+            if config.get("backup_frequency") not in FREQUENCY_INDEX:
                 return False
 
             return True
         except Exception:
             return False
 
-    @staticmethod
-    def _format_size(size_bytes):
-        """Format file size in human readable format"""
-        if size_bytes == 0:
-            return "0 B"
-
-        size_names = ["B", "KB", "MB", "GB", "TB"]
-        import math
-
-        i = int(math.floor(math.log(size_bytes, 1024)))
-        p = math.pow(1024, i)
-        s = round(size_bytes / p, 2)
-        return f"{s} {size_names[i]}"
-
 
 class BackupSettings:
     """Backup settings configuration panel"""
 
-    def __init__(self):
-        self.backup_manager = BackupManager()
-
     def render(self):
         """Render backup settings panel"""
         st.markdown("### ⚙️ Backup Module Settings")
@@ -805,4 +913,4 @@ class BackupSettings:
         # This would be used in the module manager
         # Currently integrated into the main BackupPanel
         panel = BackupPanel()
-        panel._render_settings()
+        panel._render_settings(MappingProxyType(dict(_get_backup_manager().config)))
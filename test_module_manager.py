@@ -1,137 +1,104 @@
 #!/usr/bin/env python3
 """
 Test script for the real ModuleManager functionality
+Run with: pytest test_module_manager.py
 """
 
-import sys
 import os
+import sys
 from pathlib import Path
 
+import pytest
+
 # Add project root to path
-sys.path.append(str(Path(__file__).parent))
-
-from core.module_manager import ModuleManager
-import json
-
-def test_module_manager():
-    """Test all ModuleManager functionality"""
-    
-    print("🧪 Testing ModuleManager - Real Functionality")
-    print("=" * 60)
-    
-    # Initialize module manager
-    try:
-        manager = ModuleManager()
-        print("✅ ModuleManager initialized successfully")
-    except Exception as e:
-        print(f"❌ Failed to initialize ModuleManager: {e}")
-        return False
-    
-    # Test discovering modules
-    print("\n📦 Discovering modules...")
-    try:
-        discovered = manager.discover_modules()
-        print(f"✅ Discovered {len(discovered)} modules:")
-        for module in discovered:
-            print(f"  • {module['name']} v{module['version']} ({'✅' if module['is_loadable'] else '❌'})")
-    except Exception as e:
-        print(f"❌ Failed to discover modules: {e}")
-        return False
-    
-    # Test getting installed modules (should be empty initially)
-    print("\n📋 Getting installed modules...")
-    try:
-        installed = manager.get_installed_modules()
-        print(f"✅ Found {len(installed)} installed modules")
-        if installed:
-            for module in installed:
-                print(f"  • {module['name']} v{module['version']} - {module['status']}")
-    except Exception as e:
-        print(f"❌ Failed to get installed modules: {e}")
-        return False
-    
-    # Test installing a module if any are available
-    if discovered:
-        print(f"\n📥 Testing module installation...")
-        test_module = discovered[0]  # Take the first discovered module
-        module_name = test_module['name']
-        
-        try:
-            result = manager.install_module(module_name)
-            if result['success']:
-                print(f"✅ Successfully installed {module_name}")
-                
-                # Test getting module status
-                status = manager.get_module_status(module_name)
-                if status.get('exists'):
-                    print(f"✅ Module status retrieved: {status['status']}")
-                else:
-                    print(f"❌ Failed to get module status: {status.get('error', 'Unknown error')}")
-                
-                # Test setting configuration
-                config_result = manager.set_module_config(module_name, 'test_setting', 'test_value')
-                if config_result['success']:
-                    print(f"✅ Configuration set successfully")
-                    
-                    # Test getting configuration
-                    get_config = manager.get_module_config(module_name)
-                    if get_config['success']:
-                        print(f"✅ Configuration retrieved: {get_config['configs']}")
-                    else:
-                        print(f"❌ Failed to get configuration: {get_config['error']}")
-                else:
-                    print(f"❌ Failed to set configuration: {config_result['error']}")
-                
-                # Test updating module status
-                status_update = manager.update_module_status(module_name, 'disabled')
-                if status_update['success']:
-                    print(f"✅ Module status updated to disabled")
-                    
-                    # Re-enable it
-                    manager.update_module_status(module_name, 'active')
-                    print(f"✅ Module status updated back to active")
-                else:
-                    print(f"❌ Failed to update module status: {status_update['error']}")
-                
-                # Test getting dependencies
-                deps = manager.get_module_dependencies(module_name)
-                if deps['success']:
-                    if deps.get('dependencies'):
-                        print(f"✅ Dependencies checked: {len(deps['dependencies'])} dependencies")
-                        for dep, status in deps['dependency_status'].items():
-                            print(f"  • {dep}: {'✅' if status['available'] else '❌'}")
-                    else:
-                        print(f"✅ No dependencies for {module_name}")
-                else:
-                    print(f"❌ Failed to check dependencies: {deps['error']}")
-                
-                # Test loading module
-                load_result = manager.load_module(module_name)
-                if load_result['success']:
-                    print(f"✅ Module {module_name} loaded successfully")
-                else:
-                    print(f"⚠️  Module load failed (expected): {load_result['error']}")
-                
-                # Test uninstalling the module
-                print(f"\n🗑️  Testing module uninstallation...")
-                uninstall_result = manager.uninstall_module(module_name)
-                if uninstall_result['success']:
-                    print(f"✅ Successfully uninstalled {module_name}")
-                else:
-                    print(f"❌ Failed to uninstall {module_name}: {uninstall_result['error']}")
-                    
-            else:
-                print(f"❌ Failed to install {module_name}: {result['error']}")
-        except Exception as e:
-            print(f"❌ Exception during module testing: {e}")
-                
-    else:
-        print("ℹ️  No modules available for testing installation")
-    
-    print("\n" + "=" * 60)
-    print("🎉 ModuleManager testing completed!")
-    return True
-
-if __name__ == "__main__":
-    success = test_module_manager()
-    sys.exit(0 if success else 1)
\ No newline at end of file
+project_root = Path(__file__).parent
+sys.path.append(str(project_root))
+
+from core.module_manager import ModuleManager, _MODULE_INFO_CACHE
+
+@pytest.fixture
+def manager(tmp_path):
+    """ModuleManager over the real modules directory and a throwaway database"""
+    return ModuleManager(str(project_root / "modules"), str(tmp_path / "modules.db"))
+
+def test_discover_modules(manager):
+    """Test discovering modules and listing installed ones"""
+    discovered = manager.discover_modules()
+    assert discovered, "No modules discovered"
+    for module in discovered:
+        assert {'name', 'version', 'install_path', 'is_installed', 'is_loadable'} <= set(module)
+        assert not module['is_installed']
+
+    # Nothing is installed in a fresh database
+    assert manager.get_installed_modules() == []
+
+def test_module_lifecycle(manager):
+    """Test install, configure, status, dependencies, load and uninstall of one module"""
+    discovered = manager.discover_modules()
+    if not discovered:
+        pytest.skip("No modules available for testing installation")
+    module_name = discovered[0]['name']
+
+    # Install
+    result = manager.install_module(module_name)
+    assert result['success'], result.get('error')
+    assert [module['name'] for module in manager.get_installed_modules()] == [module_name]
+
+    # Status
+    status = manager.get_module_status(module_name)
+    assert status.get('exists'), status.get('error')
+    assert status['status'] == 'active'
+
+    # Configuration
+    config_result = manager.set_module_config(module_name, 'test_setting', 'test_value')
+    assert config_result['success'], config_result.get('error')
+    get_config = manager.get_module_config(module_name)
+    assert get_config['success'], get_config.get('error')
+    assert get_config['configs'] == {'test_setting': 'test_value'}
+
+    # Status updates
+    assert manager.update_module_status(module_name, 'disabled')['success']
+    assert manager.get_module_status(module_name)['status'] == 'disabled'
+    assert manager.update_module_status(module_name, 'active')['success']
+
+    # Dependencies
+    deps = manager.get_module_dependencies(module_name)
+    assert deps['success'], deps.get('error')
+    assert set(deps['dependency_status']) == set(deps['dependencies'])
+
+    # Loading may fail for modules that expect the full app; it must not raise
+    assert 'success' in manager.load_module(module_name)
+
+    # Uninstall
+    uninstall_result = manager.uninstall_module(module_name)
+    assert uninstall_result['success'], uninstall_result.get('error')
+    assert not manager.get_module_status(module_name).get('exists')
+
+def test_discover_modules_cache(tmp_path):
+    """Test module.json is re-read only after it changes"""
+    module_path = tmp_path / "modules" / "sample"
+    module_path.mkdir(parents=True)
+    (module_path / "__init__.py").write_text("")
+    module_json = module_path / "module.json"
+    module_json.write_text('{"name": "sample", "version": "1.0.0"}')
+
+    manager = ModuleManager(str(tmp_path / "modules"), str(tmp_path / "modules.db"))
+    assert manager.discover_modules()[0]['version'] == "1.0.0"
+    assert manager.install_module("sample")['success']
+
+    # Cached info still reflects the current install state
+    discovered = manager.discover_modules()
+    assert discovered[0]['is_installed']
+    assert _MODULE_INFO_CACHE[module_path][1] is not discovered[0]
+    assert 'is_loadable' not in _MODULE_INFO_CACHE[module_path][1]
+
+    # The cache is shared, so a fresh manager per request still hits it
+    fresh = ModuleManager(str(tmp_path / "modules"), str(tmp_path / "modules.db"))
+    cached = _MODULE_INFO_CACHE[module_path]
+    assert fresh.discover_modules()[0]['is_installed']
+    assert _MODULE_INFO_CACHE[module_path] is cached
+
+    module_json.write_text('{"name": "sample", "version": "1.1.0"}')
+    stat = module_json.stat()
+    os.utime(module_json, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert manager.discover_modules()[0]['version'] == "1.1.0"
@@ -7,7 +7,9 @@ Comprehensive testing of PostgreSQL database connectivity and operations
 import sys
 import os
 import traceback
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
 import json
 
@@ -18,6 +20,7 @@ try:
     import psycopg2
     from psycopg2 import sql, OperationalError, DatabaseError
     import psycopg2.extras
+    import psycopg2.pool
     PSYCOPG2_AVAILABLE = True
     print("✓ psycopg2 module imported successfully")
 except ImportError as e:
@@ -34,6 +37,11 @@ class PostgreSQLTester:
         self.test_results = []
         self.failed_tests = []
         self.passed_tests = []
+        # Tests run concurrently; guards the result lists and keeps output lines together
+        self._results_lock = threading.Lock()
+        
+        # Connection pools per configuration name, built once a config connects
+        self._pools = {}
         
         # Common PostgreSQL test configurations
         self.test_configs = [
@@ -80,17 +88,64 @@ class PostgreSQLTester:
             'duration': duration,
             'timestamp': datetime.now().isoformat()
         }
-        self.test_results.append(result)
-        
-        if status == 'PASS':
-            self.passed_tests.append(test_name)
-            print(f"✓ {test_name} - PASSED ({duration:.2f}s)")
-        else:
-            self.failed_tests.append(test_name)
-            print(f"✗ {test_name} - FAILED ({duration:.2f}s)")
-            if details:
-                print(f"  Details: {details}")
+        with self._results_lock:
+            self.test_results.append(result)
+            
+            if status == 'PASS':
+                self.passed_tests.append(test_name)
+                print(f"✓ {test_name} - PASSED ({duration:.2f}s)")
+            else:
+                self.failed_tests.append(test_name)
+                print(f"✗ {test_name} - FAILED ({duration:.2f}s)")
+                if details:
+                    print(f"  Details: {details}")
                 
+    def _create_pool(self, config):
+        """Create a connection pool for a configuration that connected successfully"""
+        if config['name'] in self._pools:
+            return
+            
+        try:
+            self._pools[config['name']] = psycopg2.pool.ThreadedConnectionPool(
+                minconn=2,
+                maxconn=8,
+                host=config['host'],
+                port=config['port'],
+                database=config['database'],
+                user=config['username'],
+                password=config['password'],
+                connect_timeout=10
+            )
+        except OperationalError as e:
+            # Tests fall back to direct connections
+            print(f"⚠️  Connection pool unavailable for {config['name']}: {e}")
+            
+    def _get_conn(self, config):
+        """
+        Get a connection for a configuration.
+        Returns (conn, release); release returns a pooled connection or closes a direct one.
+        """
+        pool = self._pools.get(config['name'])
+        if pool is not None:
+            conn = pool.getconn()
+            return conn, lambda: pool.putconn(conn)
+            
+        conn = psycopg2.connect(
+            host=config['host'],
+            port=config['port'],
+            database=config['database'],
+            user=config['username'],
+            password=config['password'],
+            connect_timeout=10
+        )
+        return conn, conn.close
+        
+    def close_pools(self):
+        """Close all pooled connections"""
+        for pool in self._pools.values():
+            pool.closeall()
+        self._pools.clear()
+        
     def test_psycopg2_availability(self):
         """Test if psycopg2 is properly installed"""
         start_time = time.time()
@@ -184,58 +239,50 @@ class PostgreSQLTester:
             return False
             
         try:
-            conn = psycopg2.connect(
-                host=config['host'],
-                port=config['port'],
-                database=config['database'],
-                user=config['username'],
-                password=config['password'],
-                connect_timeout=10
-            )
-            
-            with conn.cursor() as cur:
-                # Create test table
-                table_name = f"test_table_{int(time.time())}"
-                cur.execute(f"""
-                    CREATE TEMPORARY TABLE {table_name} (
-                        id SERIAL PRIMARY KEY,
-                        name VARCHAR(100),
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            conn, release = self._get_conn(config)
+            try:
+                with conn.cursor() as cur:
+                    # Create test table
+                    table_name = f"test_table_{int(time.time())}"
+                    cur.execute(f"""
+                        CREATE TEMPORARY TABLE {table_name} (
+                            id SERIAL PRIMARY KEY,
+                            name VARCHAR(100),
+                            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                        )
+                    """)
+                    
+                    # Insert test data
+                    psycopg2.extras.execute_values(
+                        cur,
+                        f"INSERT INTO {table_name} (name) VALUES %s",
+                        [('Test 1',), ('Test 2',), ('Test 3',)],
+                        page_size=1000
                     )
-                """)
-                
-                # Insert test data
-                cur.execute(f"""
-                    INSERT INTO {table_name} (name) 
-                    VALUES (%s), (%s), (%s)
-                """, ('Test 1', 'Test 2', 'Test 3'))
-                
-                # Select test data
-                cur.execute(f"SELECT COUNT(*) FROM {table_name}")
-                count = cur.fetchone()[0]
-                
-                if count != 3:
-                    raise Exception(f"Expected 3 rows, got {count}")
                     
-                # Test UPDATE
-                cur.execute(f"""
-                    UPDATE {table_name} 
-                    SET name = %s 
-                    WHERE name = %s
-                """, ('Updated Test', 'Test 1'))
-                
-                # Verify update
-                cur.execute(f"""
-                    SELECT COUNT(*) FROM {table_name} 
-                    WHERE name = %s
-                """, ('Updated Test',))
-                updated_count = cur.fetchone()[0]
-                
-                if updated_count != 1:
-                    raise Exception(f"Update failed, expected 1 updated row, got {updated_count}")
+                    # Test UPDATE
+                    cur.execute(f"""
+                        UPDATE {table_name} 
+                        SET name = %s 
+                        WHERE name = %s
+                    """, ('Updated Test', 'Test 1'))
+                    
+                    # Select test data and verify the update in one round trip
+                    cur.execute(f"""
+                        SELECT COUNT(*), COUNT(*) FILTER (WHERE name = %s)
+                        FROM {table_name}
+                    """, ('Updated Test',))
+                    count, updated_count = cur.fetchone()
+                    
+                    if count != 3:
+                        raise Exception(f"Expected 3 rows, got {count}")
+                        
+                    if updated_count != 1:
+                        raise Exception(f"Update failed, expected 1 updated row, got {updated_count}")
                 
-            conn.commit()
-            conn.close()
+                conn.commit()
+            finally:
+                release()
             
             self.log_test(
                 test_name,
@@ -264,49 +311,42 @@ class PostgreSQLTester:
             return False
             
         try:
-            conn = psycopg2.connect(
-                host=config['host'],
-                port=config['port'],
-                database=config['database'],
-                user=config['username'],
-                password=config['password'],
-                connect_timeout=10
-            )
-            
-            with conn.cursor() as cur:
-                # Create test table
-                table_name = f"test_transaction_{int(time.time())}"
-                cur.execute(f"""
-                    CREATE TEMPORARY TABLE {table_name} (
-                        id SERIAL PRIMARY KEY,
-                        value INTEGER
-                    )
-                """)
-                conn.commit()
-                
-                # Test successful transaction
-                cur.execute(f"INSERT INTO {table_name} (value) VALUES (%s)", (100,))
-                conn.commit()
-                
-                # Verify committed data
-                cur.execute(f"SELECT COUNT(*) FROM {table_name}")
-                count_after_commit = cur.fetchone()[0]
-                
-                # Test rollback transaction
-                cur.execute(f"INSERT INTO {table_name} (value) VALUES (%s)", (200,))
-                conn.rollback()
-                
-                # Verify rollback
-                cur.execute(f"SELECT COUNT(*) FROM {table_name}")
-                count_after_rollback = cur.fetchone()[0]
-                
-                if count_after_commit != 1:
-                    raise Exception(f"Commit test failed: expected 1 row, got {count_after_commit}")
+            conn, release = self._get_conn(config)
+            try:
+                with conn.cursor() as cur:
+                    # Create test table
+                    table_name = f"test_transaction_{int(time.time())}"
+                    cur.execute(f"""
+                        CREATE TEMPORARY TABLE {table_name} (
+                            id SERIAL PRIMARY KEY,
+                            value INTEGER
+                        )
+                    """)
+                    conn.commit()
                     
-                if count_after_rollback != 1:
-                    raise Exception(f"Rollback test failed: expected 1 row, got {count_after_rollback}")
+                    # Test successful transaction
+                    cur.execute(f"INSERT INTO {table_name} (value) VALUES (%s)", (100,))
+                    conn.commit()
                     
-            conn.close()
+                    # Verify committed data
+                    cur.execute(f"SELECT COUNT(*) FROM {table_name}")
+                    count_after_commit = cur.fetchone()[0]
+                    
+                    # Test rollback transaction
+                    cur.execute(f"INSERT INTO {table_name} (value) VALUES (%s)", (200,))
+                    conn.rollback()
+                    
+                    # Verify rollback
+                    cur.execute(f"SELECT COUNT(*) FROM {table_name}")
+                    count_after_rollback = cur.fetchone()[0]
+                    
+                    if count_after_commit != 1:
+                        raise Exception(f"Commit test failed: expected 1 row, got {count_after_commit}")
+                    
+                    if count_after_rollback != 1:
+                        raise Exception(f"Rollback test failed: expected 1 row, got {count_after_rollback}")
+            finally:
+                release()
             
             self.log_test(
                 test_name,
@@ -334,32 +374,23 @@ class PostgreSQLTester:
             self.log_test(test_name, "SKIP", "psycopg2 not available", 0)
             return False
             
+        connections = []
         try:
-            connections = []
-            
-            # Create multiple connections
+            # Hold multiple connections at once
             for i in range(5):
-                conn = psycopg2.connect(
-                    host=config['host'],
-                    port=config['port'],
-                    database=config['database'],
-                    user=config['username'],
-                    password=config['password'],
-                    connect_timeout=10
-                )
-                connections.append(conn)
+                connections.append(self._get_conn(config))
                 
             # Test each connection
-            for i, conn in enumerate(connections):
+            for i, (conn, _) in enumerate(connections):
                 with conn.cursor() as cur:
                     cur.execute("SELECT %s as connection_id", (i,))
                     result = cur.fetchone()[0]
                     if result != i:
                         raise Exception(f"Connection {i} test failed")
                         
-            # Close all connections
-            for conn in connections:
-                conn.close()
+            # Release all connections
+            for _, release in connections:
+                release()
                 
             self.log_test(
                 test_name,
@@ -371,9 +402,9 @@ class PostgreSQLTester:
             
         except Exception as e:
             # Clean up any open connections
-            for conn in connections:
+            for _, release in connections:
                 try:
-                    conn.close()
+                    release()
                 except:
                     pass
                     
@@ -442,70 +473,69 @@ class PostgreSQLTester:
             return False
             
         try:
-            conn = psycopg2.connect(
-                host=config['host'],
-                port=config['port'],
-                database=config['database'],
-                user=config['username'],
-                password=config['password'],
-                connect_timeout=10
-            )
-            
-            with conn.cursor() as cur:
-                # Create test table with various data types
-                table_name = f"test_datatypes_{int(time.time())}"
-                cur.execute(f"""
-                    CREATE TEMPORARY TABLE {table_name} (
-                        id SERIAL PRIMARY KEY,
-                        text_col TEXT,
-                        varchar_col VARCHAR(50),
-                        int_col INTEGER,
-                        bigint_col BIGINT,
-                        decimal_col DECIMAL(10,2),
-                        boolean_col BOOLEAN,
-                        date_col DATE,
-                        timestamp_col TIMESTAMP,
-                        json_col JSON
+            conn, release = self._get_conn(config)
+            try:
+                with conn.cursor() as cur:
+                    # Create test table with various data types
+                    table_name = f"test_datatypes_{int(time.time())}"
+                    cur.execute(f"""
+                        CREATE TEMPORARY TABLE {table_name} (
+                            id SERIAL PRIMARY KEY,
+                            text_col TEXT,
+                            varchar_col VARCHAR(50),
+                            int_col INTEGER,
+                            bigint_col BIGINT,
+                            decimal_col DECIMAL(10,2),
+                            boolean_col BOOLEAN,
+                            date_col DATE,
+                            timestamp_col TIMESTAMP,
+                            json_col JSON
+                        )
+                    """)
+                    
+                    # Insert test data
+                    test_data = (
+                        'Test text',
+                        'Test varchar',
+                        42,
+                        9223372036854775807,
+                        123.45,
+                        True,
+                        '2025-08-04',
+                        '2025-08-04 15:30:00',
+                        '{"key": "value", "number": 123}'
                     )
-                """)
-                
-                # Insert test data
-                test_data = (
-                    'Test text',
-                    'Test varchar',
-                    42,
-                    9223372036854775807,
-                    123.45,
-                    True,
-                    '2025-08-04',
-                    '2025-08-04 15:30:00',
-                    '{"key": "value", "number": 123}'
-                )
-                
-                cur.execute(f"""
-                    INSERT INTO {table_name} 
-                    (text_col, varchar_col, int_col, bigint_col, decimal_col, 
-                     boolean_col, date_col, timestamp_col, json_col)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-                """, test_data)
-                
-                # Select and verify data
-                cur.execute(f"SELECT * FROM {table_name} WHERE id = 1")
-                row = cur.fetchone()
-                
-                if not row:
-                    raise Exception("No data retrieved")
                     
-                # Basic validation
-                if row[1] != 'Test text':
-                    raise Exception("Text data type test failed")
-                if row[3] != 42:
-                    raise Exception("Integer data type test failed")
-                if not row[6]:
-                    raise Exception("Boolean data type test failed")
+                    psycopg2.extras.execute_values(
+                        cur,
+                        f"""
+                        INSERT INTO {table_name} 
+                        (text_col, varchar_col, int_col, bigint_col, decimal_col, 
+                         boolean_col, date_col, timestamp_col, json_col)
+                        VALUES %s
+                        """,
+                        [test_data],
+                        page_size=1000
+                    )
                     
-            conn.commit()
-            conn.close()
+                    # Select and verify data
+                    cur.execute(f"SELECT * FROM {table_name} WHERE id = 1")
+                    row = cur.fetchone()
+                    
+                    if not row:
+                        raise Exception("No data retrieved")
+                    
+                    # Basic validation
+                    if row[1] != 'Test text':
+                        raise Exception("Text data type test failed")
+                    if row[3] != 42:
+                        raise Exception("Integer data type test failed")
+                    if not row[6]:
+                        raise Exception("Boolean data type test failed")
+                    
+                conn.commit()
+            finally:
+                release()
             
             self.log_test(
                 test_name,
@@ -549,13 +579,21 @@ class PostgreSQLTester:
                 continue
                 
             successful_configs.append(config)
+            self._create_pool(config)
             
-            # Run comprehensive tests on successful connections
-            self.test_database_operations(config)
-            self.test_transaction_handling(config)
-            self.test_concurrent_connections(config)
-            self.test_database_manager_integration(config)
-            self.test_data_types(config)
+        # Run comprehensive tests on successful connections; they are independent, so overlap them
+        if successful_configs:
+            tests = (
+                self.test_database_operations,
+                self.test_transaction_handling,
+                self.test_concurrent_connections,
+                self.test_database_manager_integration,
+                self.test_data_types
+            )
+            print(f"\n🚀 Running {len(tests)} tests on {len(successful_configs)} configuration(s) concurrently")
+            print("-" * 60)
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                wait([executor.submit(test, config) for config in successful_configs for test in tests])
             
         # Summary
         print("\n" + "=" * 80)
@@ -602,6 +640,7 @@ def main():
     
     try:
         success = tester.run_all_tests()
+        tester.close_pools()
         tester.save_results()
         
         if success:
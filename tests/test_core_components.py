@@ -12,6 +12,8 @@ import json
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 
+import pytest
+
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.append(str(project_root))
@@ -50,6 +52,19 @@ class TestDatabaseManager(unittest.TestCase):
             result = cursor.fetchone()
             self.assertEqual(result[0], 1)
     
+    def test_get_counts(self):
+        """Test several counts are returned from one query"""
+        from database.database_manager import DatabaseManager
+        
+        db_manager = DatabaseManager(self.test_db.name)
+        counts = db_manager.get_counts({
+            'servers': ("SELECT COUNT(*) FROM servers", ()),
+            'over_port': ("SELECT COUNT(*) FROM servers WHERE port > ?", (0,)),
+            'constant': ("SELECT ?", (7,))
+        })
+        
+        self.assertEqual(counts, {'servers': 0, 'over_port': 0, 'constant': 7})
+    
     def test_database_schema_creation(self):
         """Test database schema is created correctly"""
         from database.database_manager import DatabaseManager
@@ -77,7 +92,17 @@ with sqlite3.connect("{self.test_db.name}") as conn:
             for table in expected_tables:
                 self.assertIn(table, tables, f"Table {table} should exist")
 
+        # Count rows in every existing table with one UNION ALL round trip
+        counts = db_manager.get_counts({
+            table: (f"SELECT COUNT(*) FROM {table}", ())
+            for table in expected_tables if table in tables
+        })
+        self.assertEqual(set(counts), set(expected_tables))
+        self.assertEqual(counts['ldap_users'], 0)
+
 
+@pytest.mark.ldap
+@pytest.mark.xdist_group("ldap")
 class TestLDAPIntegration(unittest.TestCase):
     """Test LDAP Integration functionality"""
     
@@ -114,6 +139,224 @@ class TestLDAPIntegration(unittest.TestCase):
         self.assertTrue(success)
         self.assertIn("successful", message.lower())
 
+    BULK_USER_ENTRIES = [
+        {'type': 'searchResEntry', 'dn': 'uid=tesla,dc=example,dc=com',
+         'attributes': {'uid': ['tesla'], 'cn': ['Nikola Tesla'], 'mail': ['tesla@ldap.forumsys.com']}},
+        {'type': 'searchResEntry', 'dn': 'uid=newton,dc=example,dc=com',
+         'attributes': {'uid': ['newton'], 'cn': []}}
+    ]
+
+    @patch('core.ldap_integration.Connection')
+    @patch('core.ldap_integration.Server')
+    def test_bulk_lookup(self, mock_server, mock_connection):
+        """Test several users are resolved with one search and cached (mocked)"""
+        from core.ldap_integration import LDAPManager, TEST_CONFIGS
+
+        conn = mock_connection.return_value
+        conn.closed = False
+        paged_search = conn.extend.standard.paged_search
+        paged_search.return_value = self.BULK_USER_ENTRIES
+
+        # A small batch reads each found user's groups instead of scanning every group
+        def search(search_base, search_filter, search_scope, attributes):
+            conn.entries = [Mock(cn='scientists')] if 'uid=tesla' in search_filter else []
+        conn.search.side_effect = search
+
+        ldap_manager = LDAPManager(TEST_CONFIGS['forumsys'])
+        users = ldap_manager.bulk_lookup(['tesla', 'einstein', 'newton'])
+
+        self.assertEqual(set(users), {'tesla', 'newton'})
+        self.assertEqual(users['tesla']['groups'], ['scientists'])
+        self.assertEqual(users['newton']['groups'], [])
+        self.assertEqual(users['newton']['cn'], 'newton')
+        self.assertEqual(paged_search.call_count, 1)
+        self.assertEqual(
+            paged_search.call_args.kwargs['search_filter'],
+            '(|(uid=tesla)(uid=einstein)(uid=newton))'
+        )
+        self.assertEqual(conn.search.call_count, 2)
+        self.assertIn('tesla', ldap_manager._dn_cache)
+
+    @patch('core.ldap_integration.GROUP_SCAN_MIN_USERS', 2)
+    @patch('core.ldap_integration.Connection')
+    @patch('core.ldap_integration.Server')
+    def test_bulk_lookup_large_batch_scans_groups(self, mock_server, mock_connection):
+        """Test a large batch reads every membership with one paged group search (mocked)"""
+        from core.ldap_integration import LDAPManager, TEST_CONFIGS
+
+        conn = mock_connection.return_value
+        conn.closed = False
+        paged_search = conn.extend.standard.paged_search
+        paged_search.side_effect = [
+            self.BULK_USER_ENTRIES,
+            [
+                {'type': 'searchResEntry', 'dn': 'ou=scientists,dc=example,dc=com',
+                 'attributes': {'cn': ['scientists'], 'member': ['uid=tesla,dc=example,dc=com']}}
+            ]
+        ]
+
+        ldap_manager = LDAPManager(TEST_CONFIGS['forumsys'])
+        users = ldap_manager.bulk_lookup(['tesla', 'einstein', 'newton'])
+
+        self.assertEqual(users['tesla']['groups'], ['scientists'])
+        self.assertEqual(users['newton']['groups'], [])
+        self.assertEqual(paged_search.call_count, 2)
+        conn.search.assert_not_called()
+
+    @patch('core.ldap_integration.Connection')
+    @patch('core.ldap_integration.Server')
+    def test_cached_authentication_budget(self, mock_server, mock_connection):
+        """Test a repeat login is one bind on a pooled connection (mocked)"""
+        import time
+        from core.ldap_integration import LDAPManager, TEST_CONFIGS
+
+        conn = mock_connection.return_value
+        conn.closed = False
+        conn.rebind.return_value = True
+        conn.entries = []
+
+        ldap_manager = LDAPManager(TEST_CONFIGS['forumsys'])
+        ldap_manager._dn_cache['tesla'] = (
+            {'dn': 'uid=tesla,dc=example,dc=com', 'username': 'tesla'},
+            time.monotonic() + 60
+        )
+
+        for _ in range(20):
+            success, _ = ldap_manager.authenticate_user('tesla', 'password')
+            self.assertTrue(success)
+
+        # One connection for all logins, no user searches, user bind + service rebind
+        # and a fresh group lookup each
+        self.assertEqual(mock_connection.call_count, 1)
+        self.assertEqual(
+            [c.kwargs['search_filter'] for c in conn.search.call_args_list],
+            ['(member=uid=tesla,dc=example,dc=com)'] * 20
+        )
+        self.assertEqual(conn.rebind.call_count, 40)
+
+    @patch('core.ldap_integration.Connection')
+    @patch('core.ldap_integration.Server')
+    def test_cached_login_reads_groups_fresh(self, mock_server, mock_connection):
+        """Test a cached DN never serves stale group membership (mocked)"""
+        import time
+        from core.ldap_integration import LDAPManager, TEST_CONFIGS
+
+        conn = mock_connection.return_value
+        conn.closed = False
+        conn.rebind.return_value = True
+
+        ldap_manager = LDAPManager(TEST_CONFIGS['forumsys'])
+        ldap_manager._cache_user(
+            'tesla',
+            {'dn': 'uid=tesla,dc=example,dc=com', 'username': 'tesla', 'groups': ['admins']},
+            time.monotonic() + 60
+        )
+        self.assertNotIn('groups', ldap_manager._dn_cache['tesla'][0])
+
+        conn.entries = [Mock(cn='admins')]
+        self.assertEqual(ldap_manager.authenticate_user('tesla', 'password')[1]['groups'], ['admins'])
+
+        # Removed from the group: the next login sees it immediately
+        conn.entries = []
+        self.assertEqual(ldap_manager.authenticate_user('tesla', 'password')[1]['groups'], [])
+
+    def test_ldap_lookups_use_indexes(self):
+        """Test LDAP config and user lookups are index searches, not table scans"""
+        import sqlite3
+
+        with sqlite3.connect(":memory:") as conn:
+            conn.executescript((project_root / "database" / "ldap_schema.sql").read_text())
+
+            lookups = {
+                "ldap_config": "SELECT server, port, base_dn FROM ldap_config WHERE config_name = ?",
+                "ldap_users": "SELECT dn, email FROM ldap_users WHERE username = ?",
+            }
+            for table, query in lookups.items():
+                with self.subTest(table=table):
+                    plan = " ".join(row[-1] for row in conn.execute(f"EXPLAIN QUERY PLAN {query}", ('x',)))
+                    self.assertIn("USING INDEX", plan)
+
+            row = conn.execute(lookups["ldap_config"], ('forumsys_test',)).fetchone()
+            self.assertEqual(row, ('ldap.forumsys.com', 389, 'dc=example,dc=com'))
+
+    def test_user_sync_batched(self):
+        """Test a large LDAP sync writes every user and re-syncs as updates"""
+        import sqlite3
+        from core.ldap_integration import LDAPManager
+        from database.database_manager import DatabaseManager
+
+        test_db = tempfile.NamedTemporaryFile(suffix='.db', delete=False)
+        test_db.close()
+        self.addCleanup(os.unlink, test_db.name)
+        with sqlite3.connect(test_db.name) as conn:
+            conn.executescript((project_root / "database" / "ldap_schema.sql").read_text())
+
+        users = [
+            {'dn': f'uid=user{i},dc=example,dc=com', 'username': f'user{i}', 'cn': f'User {i}',
+             'mail': f'user{i}@example.com', 'displayName': '', 'givenName': '', 'sn': '',
+             'groups': ['scientists']}
+            for i in range(5000)
+        ]
+
+        with patch('core.ldap_integration.LDAP_AVAILABLE', True):
+            ldap_manager = LDAPManager({'group_filter': '(member={user_dn})'})
+            ldap_manager.db = DatabaseManager(test_db.name)
+            self.addCleanup(ldap_manager.db.close)
+
+            with patch.object(ldap_manager, 'get_all_users', return_value=users):
+                result = ldap_manager.sync_users()
+                users[0]['mail'] = 'renamed@example.com'
+                self.assertTrue(ldap_manager.sync_users()['success'])
+
+        self.assertTrue(result['success'], result.get('error'))
+        self.assertEqual(result['synced_users'], 5000)
+
+        with ldap_manager.db.get_cursor() as cursor:
+            cursor.execute("SELECT COUNT(*) FROM ldap_users")
+            self.assertEqual(cursor.fetchone()[0], 5000)
+            cursor.execute("SELECT email FROM ldap_users WHERE username = ?", ('user0',))
+            self.assertEqual(cursor.fetchone()[0], 'renamed@example.com')
+
+    def test_user_sync_duplicate_and_nameless_entries(self):
+        """Test a uid listed twice and an entry without a name don't fail the whole sync"""
+        import sqlite3
+        from core.ldap_integration import LDAPManager
+        from database.database_manager import DatabaseManager
+
+        test_db = tempfile.NamedTemporaryFile(suffix='.db', delete=False)
+        test_db.close()
+        self.addCleanup(os.unlink, test_db.name)
+        with sqlite3.connect(test_db.name) as conn:
+            conn.executescript((project_root / "database" / "ldap_schema.sql").read_text())
+
+        def user(dn, username, mail):
+            return {'dn': dn, 'username': username, 'cn': username or '', 'mail': mail,
+                    'displayName': '', 'givenName': '', 'sn': '', 'groups': []}
+        users = [
+            user('uid=jdoe,ou=staff,dc=example,dc=com', 'jdoe', 'jdoe@staff.example.com'),
+            user('uid=jdoe,ou=admins,dc=example,dc=com', 'jdoe', 'jdoe@admins.example.com'),
+            user('cn=,dc=example,dc=com', None, ''),
+            user('uid=bob,dc=example,dc=com', 'bob', 'bob@example.com'),
+        ]
+
+        with patch('core.ldap_integration.LDAP_AVAILABLE', True):
+            ldap_manager = LDAPManager({'group_filter': '(member={user_dn})'})
+            ldap_manager.db = DatabaseManager(test_db.name)
+            self.addCleanup(ldap_manager.db.close)
+
+            with patch.object(ldap_manager, 'get_all_users', return_value=users):
+                result = ldap_manager.sync_users()
+
+        self.assertTrue(result['success'], result.get('error'))
+        self.assertEqual(result['synced_users'], 2)
+        self.assertEqual(len(result['errors']), 1)
+        self.assertIn('cn=,dc=example,dc=com', result['errors'][0])
+
+        with ldap_manager.db.get_cursor() as cursor:
+            cursor.execute("SELECT username, email FROM ldap_users ORDER BY username")
+            self.assertEqual([tuple(row) for row in cursor.fetchall()],
+                             [('bob', 'bob@example.com'), ('jdoe', 'jdoe@admins.example.com')])
+
 
 class TestAuthManager(unittest.TestCase):
     """Test Authentication Manager functionality"""
@@ -178,6 +421,128 @@ class TestAuthManager(unittest.TestCase):
             self.assertFalse(auth_manager._is_password_strong("ALLUPPERCASE"))  # No lower/digits
 
 
+    def test_ldap_manager_not_built_when_disabled(self):
+        """Test LDAP manager is only created when LDAP is enabled"""
+        from core.auth_manager import AuthManager
+        
+        with patch('core.auth_manager.get_database_manager'):
+            auth_manager = AuthManager()
+            auth_manager.config['ldap_enabled'] = False
+            
+            with patch('core.auth_manager.get_ldap_manager') as mock_get_ldap:
+                self.assertIsNone(auth_manager.ldap_manager)
+                mock_get_ldap.assert_not_called()
+
+    
+    def test_failed_auth_backoff_and_weighting(self):
+        """Test failed logins back off exponentially and weigh common passwords more"""
+        from core.auth_manager import AuthManager
+        
+        with patch('core.auth_manager.get_database_manager') as mock_get_db:
+            mock_get_db.return_value = MagicMock()
+            auth_manager = AuthManager()
+            cursor = mock_get_db.return_value.get_cursor.return_value.__enter__.return_value
+            
+            auth_manager._handle_failed_auth('locktest', 'Rare-Typo-42')
+            self.assertIn((1, 'locktest'), [c.args[1] for c in cursor.execute.call_args_list if len(c.args) > 1])
+            self.assertTrue(auth_manager._is_rate_limited('locktest'))
+            
+            cursor.execute.reset_mock()
+            auth_manager._handle_failed_auth('locktest', 'password')
+            self.assertIn((5, 'locktest'), [c.args[1] for c in cursor.execute.call_args_list if len(c.args) > 1])
+            self.assertEqual(auth_manager._backoff['locktest'][0], 2)
+            
+            self.assertFalse(auth_manager._is_rate_limited('someone_else'))
+
+    def test_cached_ldap_login_reads_groups_fresh(self):
+        """Test a cached LDAP login re-reads groups, so a removed admin loses the role"""
+        from core.auth_manager import AuthManager
+
+        with patch('core.auth_manager.get_database_manager', return_value=MagicMock()):
+            auth_manager = AuthManager()
+        auth_manager.config.update(ldap_enabled=True, local_fallback=False)
+
+        ldap_manager = Mock()
+        ldap_manager.is_healthy.return_value = True
+        ldap_manager.authenticate_user.return_value = (True, {
+            'dn': 'uid=jdoe,dc=example,dc=com', 'username': 'jdoe', 'mail': 'jdoe@example.com',
+            'cn': 'John Doe', 'groups': ['db_admins']
+        })
+        ldap_manager.get_user_groups.return_value = []
+        auth_manager._ldap_manager = ldap_manager
+
+        with patch.object(auth_manager, '_is_user_locked', return_value=False):
+            success, user_info, method = auth_manager.authenticate('jdoe', 'secret')
+            self.assertEqual((success, method, user_info['role']), (True, 'ldap', 'admin'))
+
+            # Removed from db_admins in the directory; the repeat login is served from the cache
+            success, user_info, method = auth_manager.authenticate('jdoe', 'secret')
+
+        self.assertEqual((success, method), (True, 'ldap'))
+        self.assertEqual(user_info['role'], 'user')
+        self.assertEqual(user_info['groups'], [])
+        ldap_manager.authenticate_user.assert_called_once()
+        ldap_manager.get_user_groups.assert_called_once_with('uid=jdoe,dc=example,dc=com')
+
+    def test_auth_attempt_rollup_seeded_and_pruned(self):
+        """Test the 5-minute rollup is seeded from existing attempts once and old buckets pruned"""
+        import sqlite3
+        import time
+        from contextlib import contextmanager
+        from core.auth_manager import AuthManager
+
+        # A bare database, since the main schema's user_sessions predates the auth tables
+        conn = sqlite3.connect(self.test_db.name)
+        self.addCleanup(conn.close)
+
+        @contextmanager
+        def get_cursor():
+            with conn:
+                yield conn.cursor()
+        db = Mock(get_cursor=get_cursor)
+
+        with db.get_cursor() as cursor:
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS auth_attempts (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    username VARCHAR(255) NOT NULL,
+                    auth_method VARCHAR(50) NOT NULL,
+                    success BOOLEAN NOT NULL,
+                    ip_address VARCHAR(45),
+                    user_agent TEXT,
+                    error_message TEXT,
+                    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            cursor.executemany(
+                "INSERT INTO auth_attempts (username, auth_method, success, timestamp) "
+                "VALUES (?, ?, ?, datetime('now', ?))",
+                [('admin', 'local', True, '+0 days'), ('admin', 'local', False, '+0 days'),
+                 ('tesla', 'ldap', True, '+0 days'), ('tesla', 'ldap', True, '-3 days')]
+            )
+
+        def rollup_total():
+            with db.get_cursor() as cursor:
+                cursor.execute("SELECT COALESCE(SUM(count), 0) FROM auth_attempts_5m WHERE bucket_ts >= ?",
+                               (int(time.time()) // 86400 * 86400,))
+                return cursor.fetchone()[0]
+
+        with patch('core.auth_manager.get_database_manager', return_value=db):
+            AuthManager()
+            self.assertEqual(rollup_total(), 3)
+
+            stale_bucket = int(time.time()) - 30 * 86400
+            with db.get_cursor() as cursor:
+                cursor.execute("INSERT INTO auth_attempts_5m VALUES (?, 1, 'local', 9)", (stale_bucket,))
+
+            # A restart neither seeds again nor keeps buckets past retention
+            AuthManager()
+            self.assertEqual(rollup_total(), 3)
+            with db.get_cursor() as cursor:
+                cursor.execute("SELECT COUNT(*) FROM auth_attempts_5m WHERE bucket_ts = ?", (stale_bucket,))
+                self.assertEqual(cursor.fetchone()[0], 0)
+
+
 class TestUserManagement(unittest.TestCase):
     """Test User Management functionality"""
     
@@ -232,6 +597,140 @@ class TestConfigurationManagement(unittest.TestCase):
             self.assertIn('ldap3', content, "requirements.txt should contain ldap3")
 
 
+class TestBackupManager(unittest.TestCase):
+    """Test Backup Manager archive writing"""
+
+    def setUp(self):
+        backup_manager = pytest.importorskip("modules.backup.backup_manager")
+        self.BackupManager = backup_manager.BackupManager
+
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_path = Path(temp_dir.name)
+
+        source_dir = self.temp_path / "source"
+        source_dir.mkdir()
+        (source_dir / "settings.json").write_text(json.dumps({"rows": list(range(1000))}))
+        (source_dir / "logo.png").write_bytes(b"\x89PNG\r\n\x1a\n" + os.urandom(4096))
+        (source_dir / "empty.txt").write_bytes(b"")
+        self.items = [
+            ("data/settings.json", source_dir / "settings.json"),
+            ("data/logo.png", source_dir / "logo.png"),
+            ("data/empty.txt", source_dir / "empty.txt"),
+            ("backup_metadata.json", b'{"backup_name": "roundtrip"}'),
+        ]
+
+        config = {"backup_location": str(self.temp_path / "backup"), "compress_threads": 2}
+        with patch.object(self.BackupManager, '_load_config', return_value=config):
+            self.manager = self.BackupManager()
+
+    def _assert_round_trip(self, backup_file):
+        import zipfile
+
+        with zipfile.ZipFile(backup_file) as zipf:
+            self.assertIsNone(zipf.testzip())
+            self.assertEqual(zipf.namelist(), [arcname for arcname, _ in self.items])
+            for arcname, source in self.items:
+                expected = source if isinstance(source, bytes) else source.read_bytes()
+                self.assertEqual(zipf.read(arcname), expected)
+
+    def test_zip_backup_round_trip(self):
+        """Test parallel-deflated zip archives pass testzip and read back intact"""
+        backup_file = self.temp_path / "precompressed.zip"
+        self.manager._create_zip_backup(self.items, backup_file, level=1, n_threads=2)
+        self._assert_round_trip(backup_file)
+
+    def test_zip_backup_without_zipfile_internals(self):
+        """Test zip archives fall back to ZipFile.write when its internals change"""
+        internals = ("_no_such_zipfile_attribute",)
+        with patch('modules.backup.backup_manager.ZIPFILE_INTERNALS', internals), \
+                patch('modules.backup.backup_manager._write_precompressed') as precompressed:
+            backup_file = self.temp_path / "fallback.zip"
+            self.manager._create_zip_backup(self.items, backup_file, level=1, n_threads=2)
+
+        precompressed.assert_not_called()
+        self._assert_round_trip(backup_file)
+
+    def test_compression_settings_follow_overrides(self):
+        """Test the level and thread count come from the per-backup settings snapshot"""
+        with patch('modules.backup.backup_manager.project_root', self.temp_path / "app"), \
+                patch.object(self.BackupManager, '_create_zip_backup') as create_zip:
+            success, _ = self.manager.create_full_backup(
+                "tuned", overrides={"compress_level": 9, "compress_threads": 3}
+            )
+
+        self.assertTrue(success)
+        self.assertEqual(create_zip.call_args.args[2:], (9, 3))
+
+    def test_incremental_chain_restore(self):
+        """Test a chain over an encrypted full backup restores edits and deletions"""
+        app_root = self.temp_path / "app"
+        module_configs = app_root / "data" / "module_configs"
+        module_configs.mkdir(parents=True)
+        (module_configs / "kept.json").write_text('{"version": 1}')
+        (module_configs / "removed.json").write_text('{"version": 1}')
+
+        with patch('modules.backup.backup_manager.project_root', app_root):
+            success, full_path = self.manager.create_full_backup(
+                "base", overrides={"encrypt_backups": True}
+            )
+            self.assertTrue(success, full_path)
+            self.assertTrue(full_path.endswith(".zip.encrypted"))
+
+            (module_configs / "kept.json").write_text('{"version": 2}')
+            (module_configs / "removed.json").unlink()
+            success, incremental_path = self.manager.create_incremental_backup("base", "step")
+            self.assertTrue(success, incremental_path)
+            self.assertEqual(self.manager._load_manifest("step")["deleted"], ["module_configs/removed.json"])
+
+            # Drift away from the backed up state, then restore the chain
+            (module_configs / "kept.json").write_text('{"version": 3}')
+            (module_configs / "removed.json").write_text('{"version": 3}')
+            success, message = self.manager.restore_backup(incremental_path)
+            self.assertTrue(success, message)
+
+        self.assertEqual(json.loads((module_configs / "kept.json").read_text()), {"version": 2})
+        self.assertFalse((module_configs / "removed.json").exists())
+
+    def test_user_preferences_restore_uses_fast_copy(self):
+        """Test restored user preference trees are copied through _fast_copy"""
+        app_root = self.temp_path / "app"
+        prefs = app_root / "data" / "user_preferences"
+        (prefs / "admin").mkdir(parents=True)
+        (prefs / "admin" / "theme.json").write_text('{"theme": "dark"}')
+
+        with patch('modules.backup.backup_manager.project_root', app_root):
+            success, backup_path = self.manager.create_full_backup("prefs")
+            self.assertTrue(success, backup_path)
+            (prefs / "admin" / "theme.json").write_text('{"theme": "light"}')
+
+            with patch.object(self.manager, '_fast_copy', wraps=self.manager._fast_copy) as fast_copy:
+                success, message = self.manager.restore_backup(backup_path)
+
+        self.assertTrue(success, message)
+        self.assertEqual(json.loads((prefs / "admin" / "theme.json").read_text()), {"theme": "dark"})
+        self.assertIn(str(prefs / "admin" / "theme.json"), [str(c.args[1]) for c in fast_copy.call_args_list])
+
+    def test_backup_outside_backup_dir_is_not_chained(self):
+        """Test backups written to another location skip the manifest and take no incrementals"""
+        elsewhere = {"backup_location": str(self.temp_path / "elsewhere")}
+
+        with patch('modules.backup.backup_manager.project_root', self.temp_path / "app"):
+            with patch.object(self.manager, '_build_manifest') as build_manifest:
+                success, backup_path = self.manager.create_full_backup("moved", overrides=elsewhere)
+            self.assertTrue(success, backup_path)
+            build_manifest.assert_not_called()
+            self.assertTrue(backup_path.startswith(elsewhere["backup_location"]))
+            self.assertIsNone(self.manager._load_manifest("moved"))
+
+            self.assertTrue(self.manager.create_full_backup("base")[0])
+            success, message = self.manager._create_backup(
+                "step", False, self.manager._load_manifest("base"), overrides=elsewhere
+            )
+        self.assertFalse(success)
+        self.assertIn("backup directory", message)
+
+
 class TestErrorHandling(unittest.TestCase):
     """Test Error Handling"""
     
@@ -247,6 +746,47 @@ class TestErrorHandling(unittest.TestCase):
             self.assertFalse(success)
             self.assertIn("not installed", message.lower())
     
+    def test_ldap_circuit_breaker(self):
+        """Test repeated LDAP server errors stop LDAP attempts for a cooldown"""
+        with patch('core.ldap_integration.LDAP_AVAILABLE', True):
+            from core.ldap_integration import LDAPManager
+            
+            ldap_manager = LDAPManager({'failure_threshold': 3, 'failure_cooldown_seconds': 30})
+            self.assertTrue(ldap_manager.is_healthy())
+            
+            for _ in range(3):
+                ldap_manager._record_failure()
+            self.assertFalse(ldap_manager.is_healthy())
+
+    @patch('core.ldap_integration.Connection')
+    @patch('core.ldap_integration.Server')
+    def test_rejected_credentials_keep_ldap_healthy(self, mock_server, mock_connection):
+        """Test wrong or empty passwords never open the LDAP circuit breaker (mocked)"""
+        import time
+        from core.ldap_integration import LDAPManager, LDAPPasswordIsMandatoryError, TEST_CONFIGS
+
+        conn = mock_connection.return_value
+        conn.closed = False
+        service_bind = (TEST_CONFIGS['forumsys']['bind_dn'], TEST_CONFIGS['forumsys']['bind_password'])
+
+        def rebind(user=None, password=None):
+            if not password:
+                raise LDAPPasswordIsMandatoryError("password is mandatory")
+            return (user, password) == service_bind
+        conn.rebind.side_effect = rebind
+
+        ldap_manager = LDAPManager(dict(TEST_CONFIGS['forumsys'], failure_threshold=3))
+        ldap_manager._dn_cache['tesla'] = (
+            {'dn': 'uid=tesla,dc=example,dc=com', 'username': 'tesla'},
+            time.monotonic() + 60
+        )
+
+        for password in ['', 'wrong', '', 'wrong', '']:
+            self.assertEqual(ldap_manager.authenticate_user('tesla', password), (False, None))
+
+        self.assertTrue(ldap_manager.is_healthy())
+        self.assertEqual(mock_connection.call_count, 1)
+    
     def test_database_error_handling(self):
         """Test database error handling"""
         from database.database_manager import DatabaseManager